@@ -0,0 +1,88 @@
+"""
+IMAS Manager - API Authentication
+
+Token authentication backed by the shared cache.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import router
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+from core.cache import get_cache_timeout
+
+
+if TYPE_CHECKING:
+    from django.contrib.auth.models import AbstractBaseUser
+    from django.db.models import Field
+
+
+# Never copied into the shared cache; loaded on access instead.
+_UNCACHED_USER_FIELDS = frozenset({"password", "last_login"})
+
+
+def token_cache_key(key: str) -> str:
+    """Return the cache key holding the resolved token for ``key``."""
+    return f"imas:tok:{key}"
+
+
+def invalidate_cached_token(key: str) -> None:
+    """Drop a token from the cache so revocation takes effect immediately."""
+    cache.delete(token_cache_key(key))
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    TokenAuthentication that memoizes the token -> user lookup.
+    
+    The user's concrete fields are cached for the ``api_token`` timeout,
+    except ``password`` and ``last_login``, which are deferred and only
+    loaded if accessed. Cache hits rebuild the user without a query.
+    Entries are evicted by core.signals whenever the token or its user
+    is saved or deleted.
+    """
+
+    def authenticate_credentials(self, key: str) -> tuple[AbstractBaseUser, Token]:
+        cache_key = token_cache_key(key)
+        cached = cache.get(cache_key)
+        
+        if cached is None:
+            try:
+                token = Token.objects.select_related("user").get(key=key)
+            except Token.DoesNotExist as e:
+                raise exceptions.AuthenticationFailed(_("Invalid token.")) from e
+            user = token.user
+            cache.set(
+                cache_key,
+                {
+                    field.attname: getattr(user, field.attname)
+                    for field in _cached_user_fields()
+                },
+                timeout=get_cache_timeout("api_token"),
+            )
+        else:
+            user_model = get_user_model()
+            user = user_model.from_db(
+                router.db_for_read(user_model), list(cached), list(cached.values())
+            )
+            token = Token(key=key, user=user)
+        
+        if not user.is_active:
+            raise exceptions.AuthenticationFailed(_("User inactive or deleted."))
+        
+        return (user, token)
+
+
+def _cached_user_fields() -> list[Field]:
+    """Concrete user fields safe to keep in the token cache."""
+    return [
+        field
+        for field in get_user_model()._meta.concrete_fields
+        if field.attname not in _UNCACHED_USER_FIELDS
+    ]
@@ -0,0 +1,35 @@
+"""
+IMAS Manager - OpenAPI Schema View
+
+Serves the OpenAPI document generated at build time instead of
+re-introspecting every serializer on each request.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+
+from django.conf import settings
+from django.http import FileResponse
+from drf_spectacular.views import SpectacularAPIView
+
+
+class PrecompiledSpectacularAPIView(SpectacularAPIView):
+    """
+    Return the pre-generated schema file when it can answer the request.
+
+    Falls back to live generation for JSON, versioned or localized
+    requests, and when no file was generated (local development).
+    """
+
+    def get(self, request, *args, **kwargs):
+        schema_file = Path(settings.SPECTACULAR_SCHEMA_FILE)
+        if (
+            request.accepted_renderer.format == "yaml"
+            and not request.query_params.keys() - {"format"}
+            and schema_file.is_file()
+        ):
+            return FileResponse(
+                schema_file.open("rb"),
+                content_type=request.accepted_media_type,
+            )
+        return super().get(request, *args, **kwargs)
@@ -181,13 +181,7 @@ class TagViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=["get"])
     def popular(self, request):
         """Get popular tags by usage count."""
-        from django.db.models import Count
-        
-        tags = Tag.objects.annotate(
-            usage_count=Count("incident_tags")
-        ).filter(
-            is_active=True
-        ).order_by("-usage_count")[:20]
+        tags = Tag.objects.filter(is_active=True).order_by("-usage_count")[:20]
         
         serializer = self.get_serializer(tags, many=True)
         return Response(serializer.data)
@@ -222,7 +216,7 @@ class IncidentTagViewSet(viewsets.ModelViewSet):
         incident_id = self.kwargs.get("incident_id")
         return IncidentTag.objects.filter(
             incident_id=incident_id
-        ).select_related("tag", "applied_by")
+        ).select_related("tag", "added_by")
     
     def get_serializer_class(self):
         if self.action == "create":
@@ -0,0 +1,22 @@
+"""
+IMAS Manager - API v1 Pagination
+
+Pagination classes for list endpoints.
+"""
+from __future__ import annotations
+
+from rest_framework.pagination import CursorPagination
+
+
+class IncidentCursorPagination(CursorPagination):
+    """
+    Keyset pagination for the incident list.
+    
+    Pages are fetched with a ``created_at`` range lookup instead of an
+    OFFSET, so deep pages cost the same as the first one on a growing
+    incident table.
+    """
+    
+    ordering = "-created_at"
+    page_size_query_param = "page_size"
+    max_page_size = 100
@@ -387,8 +387,6 @@ class IncidentCommentCreateSerializer(serializers.ModelSerializer):
 class TagSerializer(serializers.ModelSerializer):
     """Serializer for tags."""
     
-    usage_count = serializers.SerializerMethodField()
-    
     class Meta:
         model = Tag
         fields = [
@@ -401,10 +399,7 @@ class TagSerializer(serializers.ModelSerializer):
             "usage_count",
             "created_at",
         ]
-        read_only_fields = ["id", "created_at"]
-    
-    def get_usage_count(self, obj) -> int:
-        return obj.incident_tags.count()
+        read_only_fields = ["id", "usage_count", "created_at"]
 
 
 class IncidentTagSerializer(serializers.ModelSerializer):
@@ -513,7 +508,6 @@ class RunbookListSerializer(serializers.ModelSerializer):
         read_only=True,
         allow_null=True,
     )
-    steps_count = serializers.SerializerMethodField()
     
     class Meta:
         model = Runbook
@@ -529,9 +523,6 @@ class RunbookListSerializer(serializers.ModelSerializer):
             "usage_count",
             "created_at",
         ]
-    
-    def get_steps_count(self, obj) -> int:
-        return obj.steps.count()
 
 
 # =============================================================================
@@ -598,7 +589,6 @@ class EscalationPolicyListSerializer(serializers.ModelSerializer):
         source="team.name",
         read_only=True,
     )
-    steps_count = serializers.SerializerMethodField()
     
     class Meta:
         model = EscalationPolicy
@@ -611,6 +601,3 @@ class EscalationPolicyListSerializer(serializers.ModelSerializer):
             "is_active",
             "steps_count",
         ]
-    
-    def get_steps_count(self, obj) -> int:
-        return obj.steps.count()
\ No newline at end of file
@@ -24,6 +24,7 @@ from api.permissions import (
     CanResolveIncident,
     IsResponder,
 )
+from api.v1.pagination import IncidentCursorPagination
 from api.v1.serializers import (
     ErrorSerializer,
     IncidentAcknowledgeResponseSerializer,
@@ -34,9 +35,8 @@ from api.v1.serializers import (
     ServiceSerializer,
     TeamSerializer,
 )
-from core.choices import IncidentStatus
 from core.models import AuditAction, AuditLog, Incident, Service, Team
-from services.orchestrator import orchestrator
+from services.orchestrator import InvalidTransitionError, orchestrator
 
 
 @extend_schema(
@@ -178,6 +178,7 @@ class IncidentListCreateView(generics.ListCreateAPIView):
     """
     
     queryset = Incident.objects.select_related("service", "lead").prefetch_related("impacted_scopes")
+    pagination_class = IncidentCursorPagination
     filterset_fields = ["status", "severity", "service"]
     search_fields = ["title", "description"]
     ordering_fields = ["created_at", "severity", "status"]
@@ -220,7 +221,7 @@ class IncidentListCreateView(generics.ListCreateAPIView):
         )
         
         # Audit log
-        AuditLog.log(
+        AuditLog.log_async(
             action=AuditAction.INCIDENT_CREATED,
             user=request.user,
             request=request,
@@ -322,19 +323,19 @@ class IncidentAcknowledgeView(APIView):
         # Check object-level permission
         self.check_object_permissions(request, incident)
         
-        if incident.status != IncidentStatus.TRIGGERED:
+        try:
+            incident = orchestrator.acknowledge_incident(
+                incident=incident,
+                user=request.user,
+            )
+        except InvalidTransitionError:
             return Response(
                 {"error": f"Cannot acknowledge incident in '{incident.status}' status"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
         
-        incident = orchestrator.acknowledge_incident(
-            incident=incident,
-            user=request.user,
-        )
-        
         # Audit log
-        AuditLog.log(
+        AuditLog.log_async(
             action=AuditAction.INCIDENT_ACKNOWLEDGED,
             user=request.user,
             request=request,
@@ -407,21 +408,21 @@ class IncidentResolveView(APIView):
         # Check object-level permission
         self.check_object_permissions(request, incident)
         
-        if incident.status == IncidentStatus.RESOLVED:
+        resolution_note = request.data.get("note", "")
+        try:
+            incident = orchestrator.resolve_incident(
+                incident=incident,
+                user=request.user,
+                resolution_note=resolution_note,
+            )
+        except InvalidTransitionError:
             return Response(
                 {"error": "Incident is already resolved"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
         
-        resolution_note = request.data.get("note", "")
-        incident = orchestrator.resolve_incident(
-            incident=incident,
-            user=request.user,
-            resolution_note=resolution_note,
-        )
-        
         # Audit log
-        AuditLog.log(
+        AuditLog.log_async(
             action=AuditAction.INCIDENT_RESOLVED,
             user=request.user,
             request=request,
@@ -10,6 +10,7 @@ API endpoints for receiving alerts from monitoring systems:
 from __future__ import annotations
 
 import logging
+from collections import ChainMap
 from typing import Any
 
 from django.utils import timezone
@@ -293,9 +294,10 @@ class GrafanaWebhookView(BaseWebhookView):
         common_annotations = data.get("commonAnnotations", {})
         
         for alert_data in data.get("alerts", []):
-            # Merge common and specific labels/annotations
-            labels = {**common_labels, **alert_data.get("labels", {})}
-            annotations = {**common_annotations, **alert_data.get("annotations", {})}
+            # Layer alert-specific labels/annotations over the common ones
+            # without copying the common mappings for every alert
+            labels = ChainMap(alert_data.get("labels", {}), common_labels)
+            annotations = ChainMap(alert_data.get("annotations", {}), common_annotations)
             
             alert = AlertPayload(
                 source="GRAFANA",
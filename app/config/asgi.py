@@ -2,6 +2,11 @@
 IMAS Manager - ASGI Configuration
 
 ASGI config for WebSocket support with Django Channels.
+
+Served by uvicorn (installed in the Docker image), e.g.:
+    gunicorn config.asgi:application -k uvicorn.workers.UvicornWorker
+Daphne is not a dependency; channels only imports it for its runserver
+integration when "daphne" is in INSTALLED_APPS.
 """
 from __future__ import annotations
 
@@ -34,11 +34,24 @@ DEBUG = env("DEBUG")
 SECRET_KEY = env("SECRET_KEY", default="django-insecure-change-me-in-production")
 ALLOWED_HOSTS = env("ALLOWED_HOSTS")
 
+# Redis settings shared by the channel layer, cache and Celery pools.
+# REDIS_URL carries its own database number when set; otherwise the channel
+# layer and cache fall back to separate local databases.
+REDIS_URL = env("REDIS_URL", default=None)
+REDIS_MAX_CONNECTIONS = env.int("REDIS_MAX_CONNECTIONS", default=50)
+
 # =============================================================================
 # Application Definition
 # =============================================================================
 DJANGO_APPS = [
-    "django.contrib.admin",
+    # Worker-only processes (Celery) can set ADMIN_AUTODISCOVER=False to skip
+    # importing every ModelAdmin at startup; admin modules are then only
+    # imported on demand.
+    (
+        "django.contrib.admin"
+        if env.bool("ADMIN_AUTODISCOVER", default=True)
+        else "django.contrib.admin.apps.SimpleAdminConfig"
+    ),
     "django.contrib.auth",
     "django.contrib.contenttypes",
     "django.contrib.sessions",
@@ -68,9 +81,17 @@ ASGI_APPLICATION = "config.asgi.application"
 
 CHANNEL_LAYERS = {
     "default": {
-        "BACKEND": "channels_redis.core.RedisChannelLayer",
+        # Pub/Sub layer: group fan-out is done by Redis PUBLISH rather than
+        # per-member pushes from the Django process. Each ASGI process holds
+        # one subscription per group and hands messages to its connections
+        # through in-memory queues, so local delivery has no Redis hop.
+        "BACKEND": "channels_redis.pubsub.RedisPubSubChannelLayer",
         "CONFIG": {
-            "hosts": [env("REDIS_URL", default="redis://localhost:6379/2")],
+            "hosts": [REDIS_URL or "redis://localhost:6379/2"],
+            "prefix": "imas",
+            # Binary msgpack frames (channels_redis' default, pinned here);
+            # Celery keeps its own JSON serializer.
+            "serializer_format": "msgpack",
         },
     },
 }
@@ -87,6 +108,7 @@ MIDDLEWARE = [
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "core.middleware.StaffProfilerMiddleware",
     "core.middleware.AuditLogMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
@@ -94,6 +116,25 @@ MIDDLEWARE = [
 
 ROOT_URLCONF = "config.urls"
 
+# Security headers emitted by SecurityMiddleware / XFrameOptionsMiddleware;
+# SecurityHeadersMiddleware only adds what Django has no setting for (CSP).
+SECURE_CONTENT_TYPE_NOSNIFF = True
+SECURE_REFERRER_POLICY = "strict-origin-when-cross-origin"
+SECURE_HSTS_SECONDS = 0 if DEBUG else 31536000
+SECURE_HSTS_INCLUDE_SUBDOMAINS = True
+# Only trust X-Forwarded-Proto behind a proxy that terminates TLS and
+# overwrites the header on every request; otherwise clients could spoof it.
+if env.bool("USE_X_FORWARDED_PROTO", default=False):
+    SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
+X_FRAME_OPTIONS = "DENY"
+
+# With AUDIT_LOG_ASYNC, audit entries are saved from a background thread so
+# the INSERT stays off the response path; a full queue falls back to inline
+# saves. Entries not yet written are lost if the process is killed without
+# running atexit (SIGKILL, OOM, hard worker timeout), so it is opt-in.
+AUDIT_LOG_ASYNC = env.bool("AUDIT_LOG_ASYNC", default=False)
+AUDIT_LOG_QUEUE_SIZE = 10_000
+
 # =============================================================================
 # Templates
 # =============================================================================
@@ -101,10 +142,21 @@ TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
         "DIRS": [BASE_DIR / "templates"],
-        "APP_DIRS": True,
         "OPTIONS": {
+            # Keep compiled templates in memory; the dev server's autoreloader
+            # still resets this cache when a template changes.
+            "loaders": [
+                (
+                    "django.template.loaders.cached.Loader",
+                    [
+                        "django.template.loaders.filesystem.Loader",
+                        "django.template.loaders.app_directories.Loader",
+                    ],
+                ),
+            ],
             "context_processors": [
-                "django.template.context_processors.debug",
+                # The debug processor only contributes anything when DEBUG is on
+                *(["django.template.context_processors.debug"] if DEBUG else []),
                 "django.template.context_processors.request",
                 "django.contrib.auth.context_processors.auth",
                 "django.contrib.messages.context_processors.messages",
@@ -125,6 +177,17 @@ DATABASES = {
     )
 }
 
+# Keep connections open between requests instead of reconnecting per request.
+# Set DB_CONN_MAX_AGE=0 when DATABASE_URL points at a PgBouncer transaction pool.
+DATABASES["default"]["CONN_MAX_AGE"] = env.int("DB_CONN_MAX_AGE", default=600)
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = True
+DATABASES["default"]["DISABLE_SERVER_SIDE_CURSORS"] = env.bool(
+    "DB_DISABLE_SERVER_SIDE_CURSORS", default=False
+)
+# Label connections in pg_stat_activity; other backends reject the option
+if DATABASES["default"]["ENGINE"].startswith("django.db.backends.postgresql"):
+    DATABASES["default"].setdefault("OPTIONS", {})["application_name"] = "imas"
+
 # =============================================================================
 # Password Validation
 # =============================================================================
@@ -135,6 +198,14 @@ AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.NumericPasswordValidator"},
 ]
 
+# Argon2 first; PBKDF2 hashes from before the switch are upgraded on next login.
+# Tests override this with the MD5 hasher for speed.
+PASSWORD_HASHERS = [
+    "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+]
+
 # =============================================================================
 # Internationalization
 # =============================================================================
@@ -150,8 +221,19 @@ STATIC_URL = "static/"
 STATIC_ROOT = BASE_DIR / "staticfiles"
 STATICFILES_DIRS = [BASE_DIR / "static"] if (BASE_DIR / "static").exists() else []
 
-# WhiteNoise configuration for production
-STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
+# WhiteNoise configuration for production: hashed names plus gzip/brotli
+# variants are produced once by collectstatic (at image build), and WhiteNoise
+# serves them from an index built at startup.
+STORAGES = {
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    },
+    "staticfiles": {
+        "BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage",
+    },
+}
+WHITENOISE_AUTOREFRESH = DEBUG
+WHITENOISE_USE_FINDERS = DEBUG
 
 # =============================================================================
 # Default Primary Key
@@ -165,8 +247,17 @@ REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 20,
+    "DEFAULT_RENDERER_CLASSES": [
+        "drf_orjson_renderer.renderers.ORJSONRenderer",
+        *(["rest_framework.renderers.BrowsableAPIRenderer"] if DEBUG else []),
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "drf_orjson_renderer.parsers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework.authentication.TokenAuthentication",
+        "api.authentication.CachedTokenAuthentication",
         "rest_framework.authentication.SessionAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
@@ -333,6 +424,10 @@ All errors follow a consistent format:
     },
 }
 
+# Schema generated at build time (`manage.py spectacular --file ...`);
+# /api/schema/ serves it as-is and only introspects the API when it is absent.
+SPECTACULAR_SCHEMA_FILE = STATIC_ROOT / "schema.yaml"
+
 # Application version
 VERSION = "1.0.0"
 
@@ -347,6 +442,9 @@ CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = TIME_ZONE
 CELERY_TASK_TRACK_STARTED = True
 CELERY_TASK_TIME_LIMIT = 30 * 60  # 30 minutes
+CELERY_BROKER_POOL_LIMIT = REDIS_MAX_CONNECTIONS
+CELERY_REDIS_MAX_CONNECTIONS = REDIS_MAX_CONNECTIONS
+CELERY_BROKER_TRANSPORT_OPTIONS = {"socket_keepalive": True}
 
 # =============================================================================
 # Cache Configuration (Redis)
@@ -354,19 +452,31 @@ CELERY_TASK_TIME_LIMIT = 30 * 60  # 30 minutes
 CACHES = {
     "default": {
         "BACKEND": "django.core.cache.backends.redis.RedisCache",
-        "LOCATION": env("REDIS_URL", default="redis://localhost:6379/1"),
+        "LOCATION": REDIS_URL or "redis://localhost:6379/1",
         "TIMEOUT": 300,  # 5 minutes default TTL
         "KEY_PREFIX": "imas",
+        # Passed to the redis-py ConnectionPool; a unix:// LOCATION uses the
+        # same bounded pool over a UNIX domain socket.
+        "OPTIONS": {
+            "max_connections": REDIS_MAX_CONNECTIONS,
+            "socket_keepalive": True,
+            "socket_timeout": 2,
+            "socket_connect_timeout": 2,
+        },
     }
 }
 
 # Cache timeouts for different data types (in seconds)
 CACHE_TIMEOUTS = {
     "dashboard_stats": 60,       # 1 minute for dashboard KPIs
+    "dashboard_stats_stale": 600,  # 10 minutes for the stale-while-revalidate copy
+    "broadcast_stats": 2,        # 2 seconds to coalesce WebSocket broadcast bursts
+    "dashboard_live_stats": 3,   # 3 seconds to coalesce dashboard reconnect storms
     "incident_list": 30,         # 30 seconds for incident lists
     "service_list": 300,         # 5 minutes for services (rarely changes)
     "team_list": 300,            # 5 minutes for teams
     "metrics": 120,              # 2 minutes for metrics
+    "api_token": 60,             # 1 minute for token -> user lookups
 }
 
 # Celery Beat Schedule (Periodic Tasks)
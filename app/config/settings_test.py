@@ -5,11 +5,14 @@ Uses SQLite in-memory database for faster tests without PostgreSQL.
 """
 from config.settings import *  # noqa: F401, F403
 
-# Use SQLite for tests
+# Use SQLite for tests. Django already creates in-memory test databases in
+# shared-cache mode (file:memorydb_default?mode=memory&cache=shared), so every
+# connection sees the same schema; keep that connection open for the run.
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": ":memory:",
+        "CONN_MAX_AGE": None,
     }
 }
 
@@ -20,9 +23,20 @@ CACHES = {
     }
 }
 
+# Tests run without collectstatic, so there is no manifest to resolve against
+STORAGES = {
+    **STORAGES,  # noqa: F405
+    "staticfiles": {
+        "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
+    },
+}
+
 # Disable rate limiting middleware for tests
 MIDDLEWARE = [m for m in MIDDLEWARE if "RateLimitByIP" not in m]
 
+# Write audit entries inline so tests can assert on them immediately
+AUDIT_LOG_ASYNC = False
+
 # Speed up password hashing for tests
 PASSWORD_HASHERS = [
     "django.contrib.auth.hashers.MD5PasswordHasher",
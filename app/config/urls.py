@@ -5,13 +5,10 @@ from __future__ import annotations
 
 from django.contrib import admin
 from django.urls import include, path
-from drf_spectacular.views import (
-    SpectacularAPIView,
-    SpectacularRedocView,
-    SpectacularSwaggerView,
-)
+from drf_spectacular.views import SpectacularRedocView, SpectacularSwaggerView
 
 from api.health import health_check, health_detailed, health_live, health_ready
+from api.openapi import PrecompiledSpectacularAPIView
 
 urlpatterns = [
     # Health Checks (before auth to ensure availability)
@@ -38,7 +35,7 @@ urlpatterns = [
     path("api/token/", include("api.auth.urls")),
     
     # API Documentation
-    path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
+    path("api/schema/", PrecompiledSpectacularAPIView.as_view(), name="schema"),
     path("api/docs/", SpectacularSwaggerView.as_view(url_name="schema"), name="swagger-ui"),
     path("api/schema/swagger-ui/", SpectacularSwaggerView.as_view(url_name="schema"), name="swagger-ui-alt"),
     path("api/redoc/", SpectacularRedocView.as_view(url_name="schema"), name="redoc"),
@@ -7,8 +7,17 @@ from __future__ import annotations
 
 import pytest
 from django.contrib.auth import get_user_model
+from rest_framework.authtoken.models import Token
 from rest_framework.test import APIClient
 
+from core.choices import (
+    IncidentSeverity,
+    IncidentStatus,
+    NotificationProviderType,
+    ServiceCriticality,
+)
+from core.models import ImpactScope, Incident, NotificationProvider, Service, Team
+
 User = get_user_model()
 
 
@@ -41,8 +50,6 @@ def admin_user(db) -> User:
 @pytest.fixture
 def authenticated_client(api_client: APIClient, user: User) -> APIClient:
     """Return an authenticated API client."""
-    from rest_framework.authtoken.models import Token
-    
     token, _ = Token.objects.get_or_create(user=user)
     api_client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
     return api_client
@@ -51,8 +58,6 @@ def authenticated_client(api_client: APIClient, user: User) -> APIClient:
 @pytest.fixture
 def team(db):
     """Create and return a test team."""
-    from core.models import Team
-    
     return Team.objects.create(
         name="Test Team",
         slack_channel_id="C0123456789",
@@ -62,9 +67,6 @@ def team(db):
 @pytest.fixture
 def service(db, team):
     """Create and return a test service."""
-    from core.models import Service
-    from core.choices import ServiceCriticality
-    
     return Service.objects.create(
         name="test-service",
         owner_team=team,
@@ -76,8 +78,6 @@ def service(db, team):
 @pytest.fixture
 def impact_scope(db):
     """Create and return a test impact scope."""
-    from core.models import ImpactScope
-    
     return ImpactScope.objects.create(
         name="Security",
         description="Security-related impact",
@@ -89,9 +89,6 @@ def impact_scope(db):
 @pytest.fixture
 def incident(db, service, user):
     """Create and return a test incident."""
-    from core.models import Incident
-    from core.choices import IncidentSeverity, IncidentStatus
-    
     return Incident.objects.create(
         title="Test Incident",
         description="This is a test incident.",
@@ -105,9 +102,6 @@ def incident(db, service, user):
 @pytest.fixture
 def notification_provider_slack(db):
     """Create and return a test Slack provider."""
-    from core.models import NotificationProvider
-    from core.choices import NotificationProviderType
-    
     return NotificationProvider.objects.create(
         name="Test Slack",
         type=NotificationProviderType.SLACK,
@@ -7,24 +7,47 @@ Includes custom actions, filters, and dashboard statistics.
 from __future__ import annotations
 
 import csv
+import logging
 from datetime import timedelta
-from io import StringIO
+from functools import lru_cache
 from typing import Any
 
 from django.contrib import admin, messages
 from django.contrib.admin import SimpleListFilter
+from django.contrib.admin.widgets import ForeignKeyRawIdWidget
 from django.contrib.auth import get_user_model
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.contrib.auth.models import User
-from django.db.models import Avg, Count, Q, QuerySet
-from django.http import HttpRequest, HttpResponse
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import connections, transaction
+from django.db.models import (
+    Avg,
+    BooleanField,
+    Case,
+    Count,
+    DurationField,
+    ExpressionWrapper,
+    F,
+    Prefetch,
+    Q,
+    QuerySet,
+    Value,
+    When,
+)
+from django.db.models.functions import Now, Substr
+from django.forms.models import BaseInlineFormSet
+from django.http import HttpRequest, StreamingHttpResponse
 from django.template.response import TemplateResponse
-from django.urls import path
+from django.urls import NoReverseMatch, path, reverse
 from django.utils import timezone
-from django.utils.html import format_html
+from django.utils.functional import cached_property
+from django.utils.html import escape, format_html
 from django.utils.safestring import mark_safe
+from django.utils.text import Truncator
 
-from core.choices import IncidentSeverity, IncidentStatus
+from core.cache import CacheManager, get_cache_timeout
+from core.choices import IncidentEventType, IncidentSeverity, IncidentStatus
 from core.models import (
     AlertFingerprint,
     AlertRule,
@@ -47,6 +70,80 @@ from core.models import (
 )
 
 
+logger = logging.getLogger(__name__)
+
+# Badge colors for the Incident changelist
+_SEVERITY_COLORS = {
+    "SEV1_CRITICAL": "#dc3545",
+    "SEV2_HIGH": "#fd7e14",
+    "SEV3_MEDIUM": "#ffc107",
+    "SEV4_LOW": "#28a745",
+}
+_STATUS_COLORS = {
+    "TRIGGERED": "#dc3545",
+    "ACKNOWLEDGED": "#17a2b8",
+    "MITIGATED": "#ffc107",
+    "RESOLVED": "#28a745",
+}
+_DEFAULT_BADGE_COLOR = "#6c757d"
+_SEVERITY_LABELS = dict(IncidentSeverity.choices)
+_STATUS_LABELS = dict(IncidentStatus.choices)
+
+# Per-row HTML fragments, filled with %-formatting instead of format_html()
+_BADGE_HTML = (
+    '<span style="background-color: %s; color: white; padding: 2px 8px; '
+    'border-radius: 4px; font-size: 11px;">%s</span>'
+)
+_SHORT_ID_LINK_HTML = (
+    '<a href="/admin/core/incident/%s/change/" style="font-weight: bold;">INC-%s</a>'
+)
+
+# Constant success markers for the AuditLog changelist
+_SUCCESS_MARK = mark_safe('<span style="color: #22c55e; font-weight: bold;">✓</span>')
+_FAILURE_MARK = mark_safe('<span style="color: #ef4444; font-weight: bold;">✗</span>')
+
+
+def _render_badge(color: str, label: str) -> str:
+    """Render a colored changelist badge."""
+    return mark_safe(_BADGE_HTML % (escape(color), escape(label)))
+
+
+def _is_changelist(request: HttpRequest, model_admin: admin.ModelAdmin) -> bool:
+    """Return True when the request targets the model admin's changelist view."""
+    match = request.resolver_match
+    opts = model_admin.model._meta
+    return bool(match) and match.url_name == f"{opts.app_label}_{opts.model_name}_changelist"
+
+
+class FasterAdminPaginator(Paginator):
+    """
+    Paginator that estimates the row count of unfiltered changelists.
+    
+    On PostgreSQL, an unfiltered queryset reads the planner estimate from
+    pg_class instead of running COUNT(*) over the whole table. Filtered
+    querysets, small tables and other backends use an exact count.
+    """
+    
+    # Below this many rows an exact COUNT(*) is cheap enough
+    estimate_threshold = 10_000
+    
+    @cached_property
+    def count(self) -> int:
+        queryset = self.object_list
+        if isinstance(queryset, QuerySet) and not queryset.query.where:
+            connection = connections[queryset.db]
+            if connection.vendor == "postgresql":
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+                        [queryset.model._meta.db_table],
+                    )
+                    row = cursor.fetchone()
+                if row and row[0] >= self.estimate_threshold:
+                    return row[0]
+        return super().count
+
+
 # =============================================================================
 # Custom Admin Site with Dashboard
 # =============================================================================
@@ -68,69 +165,139 @@ class IMASAdminSite(admin.AdminSite):
     
     def dashboard_view(self, request: HttpRequest) -> TemplateResponse:
         """Admin dashboard with key metrics and statistics."""
-        now = timezone.now()
-        last_24h = now - timedelta(hours=24)
-        last_7d = now - timedelta(days=7)
-        last_30d = now - timedelta(days=30)
-        
-        # Active incidents
-        active_incidents = Incident.objects.filter(
-            status__in=[IncidentStatus.TRIGGERED, IncidentStatus.ACKNOWLEDGED, IncidentStatus.MITIGATED]
-        )
-        
-        # Incident counts
-        total_incidents_24h = Incident.objects.filter(created_at__gte=last_24h).count()
-        total_incidents_7d = Incident.objects.filter(created_at__gte=last_7d).count()
-        total_incidents_30d = Incident.objects.filter(created_at__gte=last_30d).count()
-        
-        # Severity breakdown (last 7 days)
-        severity_breakdown = Incident.objects.filter(
-            created_at__gte=last_7d
-        ).values("severity").annotate(count=Count("id")).order_by("-count")
-        
-        # Top impacted services (last 30 days)
-        top_services = Incident.objects.filter(
-            created_at__gte=last_30d
-        ).values("service__name").annotate(
-            count=Count("id")
-        ).order_by("-count")[:10]
-        
-        # MTTR average (resolved incidents last 30 days)
-        resolved_incidents = Incident.objects.filter(
-            status=IncidentStatus.RESOLVED,
-            resolved_at__isnull=False,
-            created_at__gte=last_30d,
-        )
-        
-        mttr_values = [inc.mttr for inc in resolved_incidents if inc.mttr]
-        avg_mttr = None
-        if mttr_values:
-            total_seconds = sum(m.total_seconds() for m in mttr_values)
-            avg_mttr = timedelta(seconds=total_seconds / len(mttr_values))
-        
-        # Recent critical incidents
-        recent_critical = Incident.objects.filter(
-            severity=IncidentSeverity.SEV1_CRITICAL,
-            created_at__gte=last_7d,
-        ).order_by("-created_at")[:5]
-        
         context = {
             **self.each_context(request),
             "title": "IMAS Dashboard",
-            "active_incidents": active_incidents,
-            "active_count": active_incidents.count(),
-            "total_incidents_24h": total_incidents_24h,
-            "total_incidents_7d": total_incidents_7d,
-            "total_incidents_30d": total_incidents_30d,
-            "severity_breakdown": severity_breakdown,
-            "top_services": top_services,
-            "avg_mttr": avg_mttr,
-            "recent_critical": recent_critical,
+            **get_admin_dashboard_stats(),
         }
         
         return TemplateResponse(request, "admin/imas_dashboard.html", context)
 
 
+ADMIN_DASHBOARD_CACHE_KEY = "imas:admin:dashboard"
+ADMIN_DASHBOARD_STALE_CACHE_KEY = "imas:admin:dashboard:stale"
+ADMIN_DASHBOARD_REFRESH_LOCK_KEY = "imas:admin:dashboard:refreshing"
+
+
+def build_admin_dashboard_stats() -> dict[str, Any]:
+    """
+    Compute the admin dashboard statistics.
+    
+    QuerySets are materialized so the result can be cached.
+    """
+    now = timezone.now()
+    last_24h = now - timedelta(hours=24)
+    last_7d = now - timedelta(days=7)
+    last_30d = now - timedelta(days=30)
+    
+    active_statuses = [
+        IncidentStatus.TRIGGERED,
+        IncidentStatus.ACKNOWLEDGED,
+        IncidentStatus.MITIGATED,
+    ]
+    
+    # Active incidents
+    active_incidents = Incident.objects.filter(
+        status__in=active_statuses
+    ).select_related("service", "lead")
+    
+    # Incident counts and MTTR average (resolved incidents last 30 days),
+    # computed by the database in a single conditional-aggregate query
+    stats = Incident.objects.aggregate(
+        active_count=Count("id", filter=Q(status__in=active_statuses)),
+        total_incidents_24h=Count("id", filter=Q(created_at__gte=last_24h)),
+        total_incidents_7d=Count("id", filter=Q(created_at__gte=last_7d)),
+        total_incidents_30d=Count("id", filter=Q(created_at__gte=last_30d)),
+        avg_mttr=Avg(
+            ExpressionWrapper(
+                F("resolved_at") - F("created_at"),
+                output_field=DurationField(),
+            ),
+            filter=Q(
+                status=IncidentStatus.RESOLVED,
+                resolved_at__isnull=False,
+                created_at__gte=last_30d,
+            ),
+        ),
+    )
+    
+    # Severity breakdown (last 7 days)
+    severity_breakdown = Incident.objects.filter(
+        created_at__gte=last_7d
+    ).values("severity").annotate(count=Count("id")).order_by("-count")
+    
+    # Top impacted services (last 30 days)
+    top_services = Incident.objects.filter(
+        created_at__gte=last_30d
+    ).values("service__name").annotate(
+        count=Count("id")
+    ).order_by("-count")[:10]
+    
+    # Recent critical incidents
+    recent_critical = Incident.objects.filter(
+        severity=IncidentSeverity.SEV1_CRITICAL,
+        created_at__gte=last_7d,
+    ).order_by("-created_at")[:5]
+    
+    return {
+        "active_incidents": list(active_incidents),
+        **stats,
+        "severity_breakdown": list(severity_breakdown),
+        "top_services": list(top_services),
+        "recent_critical": list(recent_critical),
+    }
+
+
+def refresh_admin_dashboard_stats() -> dict[str, Any]:
+    """Recompute the admin dashboard statistics and store fresh and stale copies."""
+    stats = build_admin_dashboard_stats()
+    cache.set(
+        ADMIN_DASHBOARD_CACHE_KEY,
+        stats,
+        timeout=get_cache_timeout("dashboard_stats"),
+    )
+    cache.set(
+        ADMIN_DASHBOARD_STALE_CACHE_KEY,
+        stats,
+        timeout=get_cache_timeout("dashboard_stats_stale"),
+    )
+    cache.delete(ADMIN_DASHBOARD_REFRESH_LOCK_KEY)
+    return stats
+
+
+def get_admin_dashboard_stats() -> dict[str, Any]:
+    """
+    Get admin dashboard statistics using stale-while-revalidate.
+    
+    A fresh entry is returned as-is. When only the stale entry remains it is
+    returned immediately and a single background refresh is scheduled; the
+    statistics are computed inline only when nothing is cached.
+    """
+    stats = cache.get(ADMIN_DASHBOARD_CACHE_KEY)
+    if stats is not None:
+        return stats
+    
+    stats = cache.get(ADMIN_DASHBOARD_STALE_CACHE_KEY)
+    if stats is None:
+        return refresh_admin_dashboard_stats()
+    
+    # Only one request schedules the refresh while the stale copy is served
+    if cache.add(
+        ADMIN_DASHBOARD_REFRESH_LOCK_KEY,
+        True,
+        timeout=get_cache_timeout("dashboard_stats"),
+    ):
+        try:
+            from core.tasks import refresh_admin_dashboard
+            
+            refresh_admin_dashboard.delay()
+        except Exception as e:
+            logger.error(f"Failed to schedule admin dashboard refresh: {e}")
+            cache.delete(ADMIN_DASHBOARD_REFRESH_LOCK_KEY)
+    
+    return stats
+
+
 # Create custom admin site instance
 imas_admin_site = IMASAdminSite(name="imas_admin")
 
@@ -140,7 +307,20 @@ imas_admin_site = IMASAdminSite(name="imas_admin")
 # =============================================================================
 
 
-class ActiveIncidentFilter(SimpleListFilter):
+class ConditionListFilter(SimpleListFilter):
+    """SimpleListFilter whose lookup values map to fixed Q conditions."""
+    
+    # Built once per class; unknown or missing values leave the queryset as is
+    conditions: dict[str, Q] = {}
+    
+    def queryset(self, request: HttpRequest, queryset: QuerySet) -> QuerySet:
+        condition = self.conditions.get(self.value())
+        if condition is None:
+            return queryset
+        return queryset.filter(condition)
+
+
+class ActiveIncidentFilter(ConditionListFilter):
     """Filter to show only active (non-resolved) incidents."""
     
     title = "Active Status"
@@ -152,15 +332,13 @@ class ActiveIncidentFilter(SimpleListFilter):
             ("no", "Resolved Only"),
         ]
     
-    def queryset(self, request: HttpRequest, queryset: QuerySet) -> QuerySet:
-        if self.value() == "yes":
-            return queryset.exclude(status=IncidentStatus.RESOLVED)
-        if self.value() == "no":
-            return queryset.filter(status=IncidentStatus.RESOLVED)
-        return queryset
+    conditions = {
+        "yes": ~Q(status=IncidentStatus.RESOLVED),
+        "no": Q(status=IncidentStatus.RESOLVED),
+    }
 
 
-class SeverityCriticalFilter(SimpleListFilter):
+class SeverityCriticalFilter(ConditionListFilter):
     """Filter for critical/high severity incidents."""
     
     title = "Critical Priority"
@@ -172,14 +350,20 @@ class SeverityCriticalFilter(SimpleListFilter):
             ("sev1_sev2", "SEV1 + SEV2"),
         ]
     
-    def queryset(self, request: HttpRequest, queryset: QuerySet) -> QuerySet:
-        if self.value() == "sev1":
-            return queryset.filter(severity=IncidentSeverity.SEV1_CRITICAL)
-        if self.value() == "sev1_sev2":
-            return queryset.filter(
-                severity__in=[IncidentSeverity.SEV1_CRITICAL, IncidentSeverity.SEV2_HIGH]
-            )
-        return queryset
+    conditions = {
+        "sev1": Q(severity=IncidentSeverity.SEV1_CRITICAL),
+        "sev1_sev2": Q(
+            severity__in=[IncidentSeverity.SEV1_CRITICAL, IncidentSeverity.SEV2_HIGH]
+        ),
+    }
+
+
+_RECENTLY_CREATED_WINDOWS = {
+    "1h": timedelta(hours=1),
+    "24h": timedelta(hours=24),
+    "7d": timedelta(days=7),
+    "30d": timedelta(days=30),
+}
 
 
 class RecentlyCreatedFilter(SimpleListFilter):
@@ -197,19 +381,13 @@ class RecentlyCreatedFilter(SimpleListFilter):
         ]
     
     def queryset(self, request: HttpRequest, queryset: QuerySet) -> QuerySet:
-        now = timezone.now()
-        if self.value() == "1h":
-            return queryset.filter(created_at__gte=now - timedelta(hours=1))
-        if self.value() == "24h":
-            return queryset.filter(created_at__gte=now - timedelta(hours=24))
-        if self.value() == "7d":
-            return queryset.filter(created_at__gte=now - timedelta(days=7))
-        if self.value() == "30d":
-            return queryset.filter(created_at__gte=now - timedelta(days=30))
-        return queryset
+        window = _RECENTLY_CREATED_WINDOWS.get(self.value())
+        if window is None:
+            return queryset
+        return queryset.filter(created_at__gte=timezone.now() - window)
 
 
-class HasWarRoomFilter(SimpleListFilter):
+class HasWarRoomFilter(ConditionListFilter):
     """Filter for incidents with/without war room."""
     
     title = "War Room"
@@ -221,11 +399,63 @@ class HasWarRoomFilter(SimpleListFilter):
             ("no", "No War Room"),
         ]
     
+    conditions = {
+        # Same predicate as the incident_has_war_room_idx partial index
+        "yes": Q(war_room_link__gt=""),
+        "no": Q(war_room_link="") | Q(war_room_link__isnull=True),
+    }
+
+
+class InputFilter(SimpleListFilter):
+    """
+    List filter rendered as a text box instead of a list of choices.
+    
+    Used for relations with many rows, where a regular filter would load
+    every related object into the sidebar on each changelist render.
+    """
+    
+    template = "admin/input_filter.html"
+    
+    def lookups(self, request: HttpRequest, model_admin) -> list[tuple[str, str]]:
+        # A single placeholder choice so the filter is always displayed
+        return [("", "")]
+    
+    def choices(self, changelist) -> Any:
+        yield {
+            "selected": self.value() is None,
+            "query_string": changelist.get_query_string(remove=[self.parameter_name]),
+            "query_parts": [
+                (key, value)
+                for key, value in changelist.params.items()
+                if key != self.parameter_name
+            ],
+            "display": "All",
+        }
+
+
+class ServiceNameFilter(InputFilter):
+    """Filter incidents by service name."""
+    
+    title = "Service"
+    parameter_name = "service_name"
+    
     def queryset(self, request: HttpRequest, queryset: QuerySet) -> QuerySet:
-        if self.value() == "yes":
-            return queryset.exclude(war_room_link="").exclude(war_room_link__isnull=True)
-        if self.value() == "no":
-            return queryset.filter(Q(war_room_link="") | Q(war_room_link__isnull=True))
+        if self.value():
+            return queryset.filter(service__name__icontains=self.value())
+        return queryset
+
+
+class ImpactScopeNameFilter(InputFilter):
+    """Filter incidents by impacted scope name."""
+    
+    title = "Impacted Scope"
+    parameter_name = "scope_name"
+    
+    def queryset(self, request: HttpRequest, queryset: QuerySet) -> QuerySet:
+        if self.value():
+            return queryset.filter(
+                impacted_scopes__name__icontains=self.value()
+            ).distinct()
         return queryset
 
 
@@ -243,15 +473,18 @@ class OnCallActiveFilter(SimpleListFilter):
         ]
     
     def queryset(self, request: HttpRequest, queryset: QuerySet) -> QuerySet:
+        value = self.value()
+        if value is None:
+            return queryset
         now = timezone.now()
-        if self.value() == "active":
+        if value == "active":
             return queryset.filter(start_time__lte=now, end_time__gte=now)
-        if self.value() == "upcoming":
+        if value == "upcoming":
             return queryset.filter(
                 start_time__gt=now,
                 start_time__lte=now + timedelta(hours=24)
             )
-        if self.value() == "past":
+        if value == "past":
             return queryset.filter(end_time__lt=now)
         return queryset
 
@@ -294,10 +527,24 @@ class OnCallScheduleInline(admin.TabularInline):
     ordering = ("start_time", "escalation_level")
 
 
+class LatestLeadIncidentsFormSet(BaseInlineFormSet):
+    """Inline formset showing only the most recent led incidents."""
+    
+    # max_num does not cap existing rows (and the admin zeroes it for
+    # read-only inlines), so the slice is applied here instead
+    limit = 10
+    
+    def get_queryset(self) -> QuerySet:
+        if not hasattr(self, "_queryset"):
+            self._queryset = super().get_queryset()[:self.limit]
+        return self._queryset
+
+
 class LeadIncidentsInline(admin.TabularInline):
     """Inline display of incidents where user is lead."""
     
     model = Incident
+    formset = LatestLeadIncidentsFormSet
     fk_name = "lead"
     extra = 0
     fields = ("short_id", "title", "severity", "status", "created_at")
@@ -308,6 +555,11 @@ class LeadIncidentsInline(admin.TabularInline):
     verbose_name = "Lead Incident"
     verbose_name_plural = "Lead Incidents (last 10)"
     
+    def get_queryset(self, request: HttpRequest) -> QuerySet:
+        return super().get_queryset(request).only(
+            "id", "title", "severity", "status", "created_at", "lead",
+        )
+    
     def has_add_permission(self, request: HttpRequest, obj=None) -> bool:
         return False
 
@@ -344,26 +596,35 @@ class IMASUserAdmin(BaseUserAdmin):
         name = obj.get_full_name()
         return name if name else obj.username
     
-    @admin.display(description="Lead Incidents")
+    def get_queryset(self, request: HttpRequest) -> QuerySet:
+        return (
+            super().get_queryset(request)
+            .annotate(_lead_count=Count("led_incidents", distinct=True))
+            .prefetch_related("on_call_teams")
+        )
+    
+    @admin.display(description="Lead Incidents", ordering="_lead_count")
     def incident_lead_count(self, obj: User) -> int:
-        return Incident.objects.filter(lead=obj).count()
+        return obj._lead_count
     
     @admin.display(description="On-Call Teams")
     def on_call_teams_display(self, obj: User) -> str:
-        teams = obj.on_call_teams.all()[:3]
+        # Slice the prefetched list; slicing the manager would query again
+        teams = list(obj.on_call_teams.all())
         if teams:
-            names = ", ".join(t.name for t in teams)
-            if obj.on_call_teams.count() > 3:
+            names = ", ".join(t.name for t in teams[:3])
+            if len(teams) > 3:
                 names += "..."
             return names
         return "-"
     
     @admin.display(description="Incident Statistics")
     def incident_stats_display(self, obj: User) -> str:
-        total = Incident.objects.filter(lead=obj).count()
-        active = Incident.objects.filter(
-            lead=obj
-        ).exclude(status=IncidentStatus.RESOLVED).count()
+        stats = Incident.objects.filter(lead=obj).aggregate(
+            total=Count("id"),
+            active=Count("id", filter=~Q(status=IncidentStatus.RESOLVED)),
+        )
+        total, active = stats["total"], stats["active"]
         resolved = total - active
         
         return format_html(
@@ -421,13 +682,35 @@ class TeamAdmin(admin.ModelAdmin):
         }),
     )
 
-    @admin.display(description="Services")
+    def get_queryset(self, request: HttpRequest) -> QuerySet:
+        now = timezone.now()
+        return (
+            super().get_queryset(request)
+            .select_related("current_on_call")
+            .annotate(_service_count=Count("services", distinct=True))
+            .prefetch_related(
+                Prefetch(
+                    "oncall_schedules",
+                    queryset=OnCallSchedule.objects.filter(
+                        start_time__lte=now,
+                        end_time__gt=now,
+                    ).select_related("user"),
+                    to_attr="_active_oncalls",
+                )
+            )
+        )
+
+    @admin.display(description="Services", ordering="_service_count")
     def service_count(self, obj: Team) -> int:
-        return obj.services.count()
+        return obj._service_count
 
     @admin.display(description="On-Call")
     def current_on_call_display(self, obj: Team) -> str:
-        on_call = obj.get_current_on_call()
+        # Same priority as Team.get_current_on_call(), from prefetched rows
+        if obj._active_oncalls:
+            on_call = obj._active_oncalls[0].user
+        else:
+            on_call = obj.current_on_call
         if on_call:
             return on_call.username
         return "-"
@@ -470,6 +753,20 @@ class ServiceAdmin(admin.ModelAdmin):
         }),
     )
 
+    # Columns loaded for the changelist; the change form loads full rows
+    changelist_fields = (
+        "id", "name", "criticality", "is_active", "runbook_url",
+        "monitoring_url", "owner_team__name", "created_at",
+    )
+
+    def get_queryset(self, request: HttpRequest) -> QuerySet:
+        queryset = super().get_queryset(request).annotate(
+            _incident_count=Count("incidents"),
+        )
+        if _is_changelist(request, self):
+            queryset = queryset.only(*self.changelist_fields)
+        return queryset
+
     @admin.display(description="Runbook", boolean=True)
     def has_runbook(self, obj: Service) -> bool:
         return bool(obj.runbook_url)
@@ -478,9 +775,9 @@ class ServiceAdmin(admin.ModelAdmin):
     def has_monitoring(self, obj: Service) -> bool:
         return bool(obj.monitoring_url)
 
-    @admin.display(description="Incidents")
+    @admin.display(description="Incidents", ordering="_incident_count")
     def incident_count(self, obj: Service) -> int:
-        return obj.incidents.count()
+        return obj._incident_count
 
 
 # =============================================================================
@@ -511,9 +808,14 @@ class ImpactScopeAdmin(admin.ModelAdmin):
         }),
     )
 
-    @admin.display(description="Incidents")
+    def get_queryset(self, request: HttpRequest) -> QuerySet:
+        return super().get_queryset(request).annotate(
+            _incident_count=Count("incidents", distinct=True),
+        )
+
+    @admin.display(description="Incidents", ordering="_incident_count")
     def incident_count(self, obj: ImpactScope) -> int:
-        return obj.incidents.count()
+        return obj._incident_count
 
 
 # =============================================================================
@@ -544,8 +846,8 @@ class IncidentAdmin(admin.ModelAdmin):
         HasWarRoomFilter,
         "status",
         "severity",
-        "service",
-        "impacted_scopes",
+        ServiceNameFilter,
+        ImpactScopeNameFilter,
     )
     search_fields = ("id", "title", "description", "service__name", "lead__username")
     readonly_fields = (
@@ -603,12 +905,37 @@ class IncidentAdmin(admin.ModelAdmin):
         "assign_to_me",
     ]
 
+    # Columns loaded for the changelist. The title stays loaded because
+    # str(incident) labels each row checkbox; service/lead feed their __str__.
+    changelist_fields = (
+        "id", "title", "severity", "status", "war_room_link", "lid_link",
+        "created_at", "resolved_at", "service__name", "service__criticality",
+        "lead__username",
+    )
+
+    def get_queryset(self, request: HttpRequest) -> QuerySet:
+        queryset = super().get_queryset(request).annotate(
+            # Resolved incidents show their time to resolution; anything
+            # else (including a reopened incident) keeps aging
+            _age=ExpressionWrapper(
+                Case(
+                    When(
+                        status=IncidentStatus.RESOLVED,
+                        resolved_at__isnull=False,
+                        then=F("resolved_at"),
+                    ),
+                    default=Now(),
+                ) - F("created_at"),
+                output_field=DurationField(),
+            ),
+        )
+        if _is_changelist(request, self):
+            queryset = queryset.only(*self.changelist_fields)
+        return queryset
+
     @admin.display(description="ID")
     def short_id_display(self, obj: Incident) -> str:
-        return format_html(
-            '<a href="/admin/core/incident/{}/change/" style="font-weight: bold;">INC-{}</a>',
-            obj.id, obj.short_id
-        )
+        return mark_safe(_SHORT_ID_LINK_HTML % (escape(obj.id), escape(obj.short_id)))
 
     @admin.display(description="Title")
     def title_truncated(self, obj: Incident) -> str:
@@ -616,35 +943,13 @@ class IncidentAdmin(admin.ModelAdmin):
 
     @admin.display(description="Severity")
     def severity_badge(self, obj: Incident) -> str:
-        colors = {
-            "SEV1_CRITICAL": "#dc3545",
-            "SEV2_HIGH": "#fd7e14",
-            "SEV3_MEDIUM": "#ffc107",
-            "SEV4_LOW": "#28a745",
-        }
-        color = colors.get(obj.severity, "#6c757d")
-        return format_html(
-            '<span style="background-color: {}; color: white; padding: 2px 8px; '
-            'border-radius: 4px; font-size: 11px;">{}</span>',
-            color,
-            obj.get_severity_display(),
-        )
+        color = _SEVERITY_COLORS.get(obj.severity, _DEFAULT_BADGE_COLOR)
+        return _render_badge(color, _SEVERITY_LABELS.get(obj.severity, obj.severity))
 
     @admin.display(description="Status")
     def status_badge(self, obj: Incident) -> str:
-        colors = {
-            "TRIGGERED": "#dc3545",
-            "ACKNOWLEDGED": "#17a2b8",
-            "MITIGATED": "#ffc107",
-            "RESOLVED": "#28a745",
-        }
-        color = colors.get(obj.status, "#6c757d")
-        return format_html(
-            '<span style="background-color: {}; color: white; padding: 2px 8px; '
-            'border-radius: 4px; font-size: 11px;">{}</span>',
-            color,
-            obj.get_status_display(),
-        )
+        color = _STATUS_COLORS.get(obj.status, _DEFAULT_BADGE_COLOR)
+        return _render_badge(color, _STATUS_LABELS.get(obj.status, obj.status))
 
     @admin.display(description="War Room", boolean=True)
     def has_war_room(self, obj: Incident) -> bool:
@@ -654,13 +959,16 @@ class IncidentAdmin(admin.ModelAdmin):
     def has_lid(self, obj: Incident) -> bool:
         return bool(obj.lid_link)
 
-    @admin.display(description="Age")
+    @admin.display(description="Age", ordering="_age")
     def age_display(self, obj: Incident) -> str:
         """Display incident age in human-readable format."""
-        if obj.status == IncidentStatus.RESOLVED and obj.resolved_at:
-            delta = obj.resolved_at - obj.created_at
-        else:
-            delta = timezone.now() - obj.created_at
+        # Computed by the database in get_queryset()
+        delta = getattr(obj, "_age", None)
+        if delta is None:
+            if obj.status == IncidentStatus.RESOLVED and obj.resolved_at:
+                delta = obj.resolved_at - obj.created_at
+            else:
+                delta = timezone.now() - obj.created_at
         
         hours = delta.total_seconds() / 3600
         if hours < 1:
@@ -706,36 +1014,90 @@ class IncidentAdmin(admin.ModelAdmin):
 
     @admin.action(description="✅ Mark as Acknowledged")
     def mark_as_acknowledged(self, request: HttpRequest, queryset: QuerySet[Incident]) -> None:
-        updated = queryset.filter(status=IncidentStatus.TRIGGERED).update(
+        updated = self._bulk_transition(
+            request,
+            queryset,
+            Q(status=IncidentStatus.TRIGGERED),
+            "acknowledged",
             status=IncidentStatus.ACKNOWLEDGED,
-            acknowledged_at=timezone.now()
+            acknowledged_at=timezone.now(),
         )
         self.message_user(request, f"{updated} incident(s) marked as acknowledged.", messages.SUCCESS)
 
     @admin.action(description="🔧 Mark as Mitigated")
     def mark_as_mitigated(self, request: HttpRequest, queryset: QuerySet[Incident]) -> None:
-        updated = queryset.filter(
-            status__in=[IncidentStatus.TRIGGERED, IncidentStatus.ACKNOWLEDGED]
-        ).update(status=IncidentStatus.MITIGATED)
+        updated = self._bulk_transition(
+            request,
+            queryset,
+            Q(status__in=[IncidentStatus.TRIGGERED, IncidentStatus.ACKNOWLEDGED]),
+            "mitigated",
+            status=IncidentStatus.MITIGATED,
+        )
         self.message_user(request, f"{updated} incident(s) marked as mitigated.", messages.SUCCESS)
 
     @admin.action(description="✔️ Mark as Resolved")
     def mark_as_resolved(self, request: HttpRequest, queryset: QuerySet[Incident]) -> None:
-        updated = queryset.exclude(status=IncidentStatus.RESOLVED).update(
+        updated = self._bulk_transition(
+            request,
+            queryset,
+            ~Q(status=IncidentStatus.RESOLVED),
+            "resolved",
             status=IncidentStatus.RESOLVED,
-            resolved_at=timezone.now()
+            resolved_at=timezone.now(),
         )
         self.message_user(request, f"{updated} incident(s) marked as resolved.", messages.SUCCESS)
 
+    def _bulk_transition(
+        self,
+        request: HttpRequest,
+        queryset: QuerySet[Incident],
+        condition: Q,
+        verb: str,
+        **values: Any,
+    ) -> int:
+        """
+        Apply a status change with one UPDATE and one bulk INSERT of timeline events.
+        
+        queryset.update() fires no signals, so the STATUS_CHANGE events the
+        orchestrator would record are created here in bulk, and the cached
+        incident counts are dropped explicitly.
+        """
+        with transaction.atomic():
+            # Lock the rows still eligible so the events match what is updated
+            incident_ids = list(
+                Incident.objects.select_for_update()
+                .filter(condition, id__in=queryset.values("id"))
+                .values_list("id", flat=True)
+            )
+            updated = Incident.objects.filter(id__in=incident_ids).update(**values)
+            IncidentEvent.objects.bulk_create(
+                [
+                    IncidentEvent(
+                        incident_id=incident_id,
+                        type=IncidentEventType.STATUS_CHANGE,
+                        message=f"Incident {verb} by {request.user.username}",
+                        created_by=request.user,
+                    )
+                    for incident_id in incident_ids
+                ],
+                batch_size=1000,
+            )
+            transaction.on_commit(CacheManager.invalidate_incident_counts)
+        return updated
+
     @admin.action(description="🔄 Re-run Orchestration")
     def rerun_orchestration(self, request: HttpRequest, queryset: QuerySet[Incident]) -> None:
         """Trigger orchestration task again for selected incidents."""
         try:
-            from services.tasks import orchestrate_incident_task
-            count = 0
-            for incident in queryset:
-                orchestrate_incident_task.delay(str(incident.id))
-                count += 1
+            from celery import group
+            
+            from tasks.incident_tasks import orchestrate_incident_task
+            incident_ids = [str(pk) for pk in queryset.values_list("id", flat=True)]
+            count = len(incident_ids)
+            # One broker publish for the whole selection
+            group(
+                orchestrate_incident_task.s(incident_id) for incident_id in incident_ids
+            ).apply_async()
             self.message_user(
                 request, 
                 f"Orchestration queued for {count} incident(s).", 
@@ -759,41 +1121,57 @@ class IncidentAdmin(admin.ModelAdmin):
         )
 
     @admin.action(description="📥 Export as CSV")
-    def export_as_csv(self, request: HttpRequest, queryset: QuerySet[Incident]) -> HttpResponse:
-        """Export selected incidents to CSV file."""
-        output = StringIO()
-        writer = csv.writer(output)
-        
-        # Header
-        writer.writerow([
-            "ID", "Short ID", "Title", "Service", "Severity", "Status",
-            "Lead", "Created At", "Acknowledged At", "Resolved At",
-            "MTTD", "MTTA", "MTTR", "War Room", "LID"
-        ])
+    def export_as_csv(
+        self, request: HttpRequest, queryset: QuerySet[Incident]
+    ) -> StreamingHttpResponse:
+        """Export selected incidents to CSV file, streamed row by row."""
+        writer = csv.writer(_EchoBuffer())
+        incidents = queryset.select_related("service", "lead").only(
+            "id", "title", "severity", "status", "detected_at", "created_at",
+            "acknowledged_at", "resolved_at", "war_room_link", "lid_link",
+            "service__name", "lead__username",
+        )
         
-        # Data rows
-        for inc in queryset.select_related("service", "lead"):
-            writer.writerow([
-                str(inc.id),
-                inc.short_id,
-                inc.title,
-                inc.service.name if inc.service else "",
-                inc.get_severity_display(),
-                inc.get_status_display(),
-                inc.lead.username if inc.lead else "",
-                inc.created_at.isoformat() if inc.created_at else "",
-                inc.acknowledged_at.isoformat() if inc.acknowledged_at else "",
-                inc.resolved_at.isoformat() if inc.resolved_at else "",
-                str(inc.mttd) if inc.mttd else "",
-                str(inc.mtta) if inc.mtta else "",
-                str(inc.mttr) if inc.mttr else "",
-                inc.war_room_link or "",
-                inc.lid_link or "",
+        def rows():
+            # Header
+            yield writer.writerow([
+                "ID", "Short ID", "Title", "Service", "Severity", "Status",
+                "Lead", "Created At", "Acknowledged At", "Resolved At",
+                "MTTD", "MTTA", "MTTR", "War Room", "LID"
             ])
+            
+            # Data rows
+            for inc in incidents.iterator(chunk_size=2000):
+                yield writer.writerow([
+                    str(inc.id),
+                    inc.short_id,
+                    inc.title,
+                    inc.service.name if inc.service else "",
+                    inc.get_severity_display(),
+                    inc.get_status_display(),
+                    inc.lead.username if inc.lead else "",
+                    inc.created_at.isoformat() if inc.created_at else "",
+                    inc.acknowledged_at.isoformat() if inc.acknowledged_at else "",
+                    inc.resolved_at.isoformat() if inc.resolved_at else "",
+                    str(inc.mttd) if inc.mttd else "",
+                    str(inc.mtta) if inc.mtta else "",
+                    str(inc.mttr) if inc.mttr else "",
+                    inc.war_room_link or "",
+                    inc.lid_link or "",
+                ])
         
-        response = HttpResponse(output.getvalue(), content_type="text/csv")
-        response["Content-Disposition"] = 'attachment; filename="incidents_export.csv"'
-        return response
+        return StreamingHttpResponse(
+            rows(),
+            content_type="text/csv",
+            headers={"Content-Disposition": 'attachment; filename="incidents_export.csv"'},
+        )
+
+
+class _EchoBuffer:
+    """File-like object whose write() returns the value, for streaming csv.writer output."""
+    
+    def write(self, value: str) -> str:
+        return value
 
 
 # =============================================================================
@@ -811,7 +1189,18 @@ class IncidentEventAdmin(admin.ModelAdmin):
     readonly_fields = ("id", "incident", "type", "message", "timestamp", "created_by")
     list_select_related = ("incident", "created_by")
     date_hierarchy = "timestamp"
-    
+    paginator = FasterAdminPaginator
+    show_full_result_count = False
+    
+    def get_queryset(self, request: HttpRequest) -> QuerySet:
+        queryset = super().get_queryset(request)
+        if _is_changelist(request, self):
+            # Fetch one character past the cut-off to know whether to add "..."
+            queryset = queryset.annotate(
+                _message_short=Substr("message", 1, 101),
+            ).defer("message")
+        return queryset
+
     def has_add_permission(self, request: HttpRequest) -> bool:
         return False
 
@@ -823,7 +1212,10 @@ class IncidentEventAdmin(admin.ModelAdmin):
 
     @admin.display(description="Message")
     def message_truncated(self, obj: IncidentEvent) -> str:
-        return obj.message[:100] + "..." if len(obj.message) > 100 else obj.message
+        message = getattr(obj, "_message_short", None)
+        if message is None:
+            message = obj.message
+        return message[:100] + "..." if len(message) > 100 else message
 
 
 # =============================================================================
@@ -858,11 +1250,17 @@ class NotificationProviderAdmin(admin.ModelAdmin):
     @admin.display(description="Config Keys")
     def config_keys(self, obj: NotificationProvider) -> str:
         if obj.config:
-            keys = ", ".join(obj.config.keys())
-            return keys[:50] + "..." if len(keys) > 50 else keys
+            return _format_config_keys(tuple(obj.config))
         return "-"
 
 
+@lru_cache(maxsize=512)
+def _format_config_keys(keys: tuple[str, ...]) -> str:
+    """Render provider config keys for the changelist (pure, so memoized)."""
+    joined = ", ".join(keys)
+    return joined[:50] + "..." if len(joined) > 50 else joined
+
+
 # =============================================================================
 # OnCallSchedule Admin
 # =============================================================================
@@ -902,13 +1300,27 @@ class OnCallScheduleAdmin(admin.ModelAdmin):
         }),
     )
 
-    @admin.display(description="Active", boolean=True)
+    def get_queryset(self, request: HttpRequest) -> QuerySet:
+        # Same semantics as OnCallSchedule.is_active / duration_hours
+        return super().get_queryset(request).annotate(
+            _is_active=Case(
+                When(start_time__lte=Now(), end_time__gt=Now(), then=Value(True)),
+                default=Value(False),
+                output_field=BooleanField(),
+            ),
+            _duration=ExpressionWrapper(
+                F("end_time") - F("start_time"),
+                output_field=DurationField(),
+            ),
+        )
+
+    @admin.display(description="Active", boolean=True, ordering="_is_active")
     def is_active_display(self, obj: OnCallSchedule) -> bool:
-        return obj.is_active
+        return obj._is_active
 
-    @admin.display(description="Duration")
+    @admin.display(description="Duration", ordering="_duration")
     def duration_display(self, obj: OnCallSchedule) -> str:
-        hours = obj.duration_hours
+        hours = obj._duration.total_seconds() / 3600
         if hours >= 24:
             days = hours / 24
             return f"{days:.1f} days"
@@ -917,20 +1329,24 @@ class OnCallScheduleAdmin(admin.ModelAdmin):
     @admin.action(description="📋 Duplicate for Next Week")
     def duplicate_schedule(self, request: HttpRequest, queryset: QuerySet[OnCallSchedule]) -> None:
         """Duplicate selected schedules shifted by 7 days."""
-        count = 0
-        for schedule in queryset:
-            OnCallSchedule.objects.create(
-                team=schedule.team,
-                user=schedule.user,
+        duplicates = [
+            OnCallSchedule(
+                team_id=schedule.team_id,
+                user_id=schedule.user_id,
                 start_time=schedule.start_time + timedelta(days=7),
                 end_time=schedule.end_time + timedelta(days=7),
                 escalation_level=schedule.escalation_level,
                 notes=f"(Duplicated) {schedule.notes}" if schedule.notes else "(Duplicated)",
             )
-            count += 1
+            for schedule in queryset.only(
+                "team_id", "user_id", "start_time", "end_time",
+                "escalation_level", "notes",
+            )
+        ]
+        OnCallSchedule.objects.bulk_create(duplicates, batch_size=500)
         self.message_user(
             request, 
-            f"Created {count} schedule(s) for next week.", 
+            f"Created {len(duplicates)} schedule(s) for next week.", 
             messages.SUCCESS
         )
 
@@ -954,18 +1370,19 @@ class AlertFingerprintAdmin(admin.ModelAdmin):
         "last_fired_at",
     )
     list_filter = ("source", "status", "first_fired_at")
-    search_fields = ("alert_name", "fingerprint", "labels")
+    search_fields = ("alert_name", "labels")
     readonly_fields = (
-        "id", "fingerprint", "first_fired_at", "last_fired_at", 
+        "id", "fingerprint_hex", "first_fired_at", "last_fired_at", 
         "resolved_at", "fire_count"
     )
     raw_id_fields = ("incident",)
+    list_select_related = ("incident",)
     date_hierarchy = "last_fired_at"
     ordering = ("-last_fired_at",)
     
     fieldsets = (
         (None, {
-            "fields": ("id", "fingerprint", "source", "alert_name", "status"),
+            "fields": ("id", "fingerprint_hex", "source", "alert_name", "status"),
         }),
         ("Details", {
             "fields": ("labels", "annotations"),
@@ -979,6 +1396,27 @@ class AlertFingerprintAdmin(admin.ModelAdmin):
         }),
     )
 
+    def get_search_results(self, request, queryset, search_term):
+        """Also match a full hex fingerprint exactly against the stored digest."""
+        base_queryset = queryset
+        queryset, may_have_duplicates = super().get_search_results(
+            request, queryset, search_term
+        )
+        term = search_term.strip()
+        if len(term) == 64:
+            try:
+                digest = bytes.fromhex(term)
+            except ValueError:
+                pass
+            else:
+                # Stay within the list filters already applied to the queryset
+                queryset |= base_queryset.filter(fingerprint=digest)
+        return queryset, may_have_duplicates
+    
+    @admin.display(description="Fingerprint")
+    def fingerprint_hex(self, obj: AlertFingerprint) -> str:
+        return obj.fingerprint_hex
+    
     @admin.display(description="Incident")
     def incident_link(self, obj: AlertFingerprint) -> str:
         if obj.incident:
@@ -1058,6 +1496,8 @@ class AuditLogAdmin(admin.ModelAdmin):
     )
     date_hierarchy = "timestamp"
     ordering = ("-timestamp",)
+    paginator = FasterAdminPaginator
+    show_full_result_count = False
     
     def has_add_permission(self, request: HttpRequest) -> bool:
         """Audit logs are created automatically, not manually."""
@@ -1073,13 +1513,7 @@ class AuditLogAdmin(admin.ModelAdmin):
     
     @admin.display(description="Status")
     def success_badge(self, obj: AuditLog) -> str:
-        if obj.success:
-            return format_html(
-                '<span style="color: #22c55e; font-weight: bold;">✓</span>'
-            )
-        return format_html(
-            '<span style="color: #ef4444; font-weight: bold;">✗</span>'
-        )
+        return _SUCCESS_MARK if obj.success else _FAILURE_MARK
 
 
 # =============================================================================
@@ -1111,6 +1545,7 @@ class RunbookAdmin(admin.ModelAdmin):
     search_fields = ("name", "description", "alert_pattern")
     readonly_fields = ("id", "created_at", "updated_at", "usage_count", "last_used_at")
     raw_id_fields = ("service", "author")
+    list_select_related = ("service",)
     list_editable = ("is_active",)
     inlines = [RunbookStepInline]
     ordering = ("-created_at",)
@@ -1133,9 +1568,9 @@ class RunbookAdmin(admin.ModelAdmin):
         }),
     )
     
-    @admin.display(description="Steps")
+    @admin.display(description="Steps", ordering="steps_count")
     def steps_count(self, obj: Runbook) -> int:
-        return obj.steps.count()
+        return obj.steps_count
 
 
 @admin.register(RunbookStep)
@@ -1188,16 +1623,22 @@ class TagAdmin(admin.ModelAdmin):
     
     @admin.display(description="Color")
     def color_preview(self, obj: Tag) -> str:
-        return format_html(
-            '<span style="background-color: {}; color: white; padding: 3px 10px; '
-            'border-radius: 4px;">{}</span>',
-            obj.color,
-            obj.color
-        )
+        return _color_preview(obj.color)
     
-    @admin.display(description="Usage")
+    @admin.display(description="Usage", ordering="usage_count")
     def usage_count(self, obj: Tag) -> int:
-        return obj.incident_tags.count()
+        return obj.usage_count
+
+
+@lru_cache(maxsize=256)
+def _color_preview(color: str) -> str:
+    """Render a tag color swatch (pure, so memoized per color)."""
+    return format_html(
+        '<span style="background-color: {}; color: white; padding: 3px 10px; '
+        'border-radius: 4px;">{}</span>',
+        color,
+        color
+    )
 
 
 # =============================================================================
@@ -1221,6 +1662,7 @@ class IncidentCommentAdmin(admin.ModelAdmin):
     search_fields = ("content", "incident__title", "author__username")
     readonly_fields = ("id", "created_at", "updated_at")
     raw_id_fields = ("incident", "author")
+    list_select_related = ("incident", "author")
     ordering = ("-created_at",)
     
     @admin.display(description="Content")
@@ -1233,14 +1675,56 @@ class IncidentCommentAdmin(admin.ModelAdmin):
 # =============================================================================
 
 
+class JoinedRawIdWidget(ForeignKeyRawIdWidget):
+    """Raw-id widget that labels its value from an already loaded object."""
+    
+    related_obj = None
+    
+    def label_and_url_for_value(self, value):
+        obj = self.related_obj
+        if obj is None or str(obj.pk) != str(value):
+            return super().label_and_url_for_value(value)
+        try:
+            url = reverse(
+                f"{self.admin_site.name}:{obj._meta.app_label}_{obj._meta.model_name}_change",
+                args=(obj.pk,),
+            )
+        except NoReverseMatch:
+            url = ""
+        return Truncator(obj).words(14), url
+
+
+class JoinedRawIdFormSet(BaseInlineFormSet):
+    """Inline formset handing joined raw-id relations to their widgets."""
+    
+    def _construct_form(self, i, **kwargs):
+        form = super()._construct_form(i, **kwargs)
+        for name, field in form.fields.items():
+            if isinstance(field.widget, JoinedRawIdWidget) and form.instance.pk:
+                field.widget.related_obj = getattr(form.instance, name)
+        return form
+
+
 class EscalationStepInline(admin.TabularInline):
     """Inline admin for escalation steps."""
     
     model = EscalationStep
+    formset = JoinedRawIdFormSet
     extra = 1
     fields = ("order", "delay_minutes", "notify_type", "notify_user", "notification_channels")
     raw_id_fields = ("notify_user",)
     ordering = ("order",)
+    
+    def get_queryset(self, request: HttpRequest) -> QuerySet:
+        return super().get_queryset(request).select_related("notify_user")
+    
+    def formfield_for_foreignkey(self, db_field, request: HttpRequest, **kwargs):
+        # Label the notify_user from the joined row instead of one query per step
+        if db_field.name in self.raw_id_fields:
+            kwargs["widget"] = JoinedRawIdWidget(
+                db_field.remote_field, self.admin_site, using=kwargs.get("using")
+            )
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
 
 
 @admin.register(EscalationPolicy)
@@ -1258,6 +1742,7 @@ class EscalationPolicyAdmin(admin.ModelAdmin):
     search_fields = ("name", "description", "team__name")
     readonly_fields = ("id", "created_at", "updated_at")
     raw_id_fields = ("team",)
+    list_select_related = ("team",)
     list_editable = ("is_active",)
     inlines = [EscalationStepInline]
     ordering = ("team", "name")
@@ -1279,9 +1764,9 @@ class EscalationPolicyAdmin(admin.ModelAdmin):
         }),
     )
     
-    @admin.display(description="Steps")
+    @admin.display(description="Steps", ordering="steps_count")
     def steps_count(self, obj: EscalationPolicy) -> int:
-        return obj.steps.count()
+        return obj.steps_count
 
 
 @admin.register(EscalationStep)
@@ -1293,6 +1778,7 @@ class EscalationStepAdmin(admin.ModelAdmin):
     search_fields = ("policy__name",)
     readonly_fields = ("id",)
     raw_id_fields = ("policy", "notify_user")
+    list_select_related = ("policy__team", "notify_user")
     ordering = ("policy", "order")
     
     @admin.display(description="Target")
@@ -1333,7 +1819,10 @@ class IncidentEscalationAdmin(admin.ModelAdmin):
         "acknowledged_at", "error_message", "scheduled_at",
     )
     raw_id_fields = ("incident", "policy", "step", "notified_user")
+    list_select_related = ("incident", "policy__team")
     ordering = ("-scheduled_at",)
+    paginator = FasterAdminPaginator
+    show_full_result_count = False
     
     def has_add_permission(self, request: HttpRequest) -> bool:
         """Escalations are created automatically."""
@@ -1358,4 +1847,5 @@ class IncidentTagAdmin(admin.ModelAdmin):
     search_fields = ("incident__title", "tag__name")
     readonly_fields = ("id", "added_at")
     raw_id_fields = ("incident", "tag", "added_by")
+    list_select_related = ("incident", "tag", "added_by")
     ordering = ("-added_at",)
@@ -0,0 +1,142 @@
+"""
+IMAS Manager - Audit Log Writer
+
+Saves entries queued by AuditLog.log_async() from a background thread,
+keeping the INSERT off the request/response path. Entries are written in batches
+with a single bulk_create per batch.
+"""
+from __future__ import annotations
+
+import atexit
+import logging
+import queue
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.db import close_old_connections
+
+if TYPE_CHECKING:
+    from core.models import AuditLog
+
+logger = logging.getLogger(__name__)
+
+_queue: queue.Queue[AuditLog] = queue.Queue(
+    maxsize=getattr(settings, "AUDIT_LOG_QUEUE_SIZE", 10_000)
+)
+# A batch closes at this many entries or this many seconds after its first
+_BATCH_SIZE = 500
+_BATCH_WAIT = 0.1
+
+
+class _WriterHolder:
+    """Holds the writer thread so it can be (re)started without globals."""
+    
+    thread: threading.Thread | None = None
+    lock = threading.Lock()
+
+
+def enqueue(entry: AuditLog) -> None:
+    """
+    Queue an unsaved entry for the background writer.
+    
+    Entries are saved inline when AUDIT_LOG_ASYNC is off. When the queue
+    is full the entry is saved inline too, so memory stays bounded
+    without losing audit records.
+    """
+    if not getattr(settings, "AUDIT_LOG_ASYNC", False):
+        entry.save()
+        return
+    
+    _ensure_writer()
+    try:
+        _queue.put_nowait(entry)
+    except queue.Full:
+        logger.warning(f"Audit queue full, saving entry inline: {entry.description}")
+        entry.save()
+
+
+def flush(timeout: float = 5.0) -> bool:
+    """Wait for queued entries to be written; return False on timeout."""
+    deadline = time.monotonic() + timeout
+    while _queue.unfinished_tasks:
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def _ensure_writer() -> None:
+    """Start the writer thread on first use (and again after a fork)."""
+    writer = _WriterHolder.thread
+    if writer is not None and writer.is_alive():
+        return
+    with _WriterHolder.lock:
+        writer = _WriterHolder.thread
+        if writer is None or not writer.is_alive():
+            writer = threading.Thread(
+                target=_write_forever, name="audit-log-writer", daemon=True
+            )
+            writer.start()
+            _WriterHolder.thread = writer
+
+
+def _next_batch() -> list[AuditLog]:
+    """Block for one entry, then collect more until the batch closes."""
+    batch = [_queue.get()]
+    deadline = time.monotonic() + _BATCH_WAIT
+    while len(batch) < _BATCH_SIZE:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        try:
+            batch.append(_queue.get(timeout=remaining))
+        except queue.Empty:
+            break
+    return batch
+
+
+def _write_batch(model: type[AuditLog], batch: list[AuditLog]) -> None:
+    """
+    Save a batch with one bulk_create, falling back to row-by-row saves.
+    
+    A single bad row or a transient database error must not lose the
+    whole batch, so after a failed bulk insert each entry is saved on
+    its own and only the ones that still fail are dropped.
+    """
+    try:
+        # Audit rows are append-only with no save() signals to honour
+        model.objects.bulk_create(batch, batch_size=_BATCH_SIZE)
+        return
+    except Exception as e:
+        logger.warning(f"Bulk insert of {len(batch)} audit logs failed, saving individually: {e}")
+        close_old_connections()
+    
+    for entry in batch:
+        try:
+            entry.save(force_insert=True)
+        except Exception as e:
+            logger.error(
+                f"Dropped audit log {entry.action} by {entry.username or 'anonymous'} "
+                f"({entry.description}): {e}"
+            )
+
+
+def _write_forever() -> None:
+    from core.models import AuditLog
+    
+    while True:
+        batch = _next_batch()
+        try:
+            _write_batch(AuditLog, batch)
+        finally:
+            for _ in batch:
+                _queue.task_done()
+        
+        # Recycle stale or broken connections while idle
+        if _queue.empty():
+            close_old_connections()
+
+
+atexit.register(flush)
@@ -6,28 +6,72 @@ Helper functions to broadcast real-time updates to connected WebSocket clients.
 from __future__ import annotations
 
 import logging
+import threading
+import time
+from collections import OrderedDict
 from typing import Any, Optional
 
 from asgiref.sync import async_to_sync
 from channels.layers import get_channel_layer
+from channels_redis.pubsub import RedisPubSubChannelLayer
+from django.db.models import Count, Q
+
+from core.cache import CacheManager
+from core.choices import IncidentSeverity, IncidentStatus
+from core.consumers import encode_frame
+from core.models import Incident
 
 logger = logging.getLogger(__name__)
 
+# Choice labels, looked up once instead of through get_FOO_display() per broadcast
+_SEVERITY_LABELS = dict(IncidentSeverity.choices)
+_STATUS_LABELS = dict(IncidentStatus.choices)
+
+# Dashboard stats aggregate, built once at import
+_STATS_STATUSES = (IncidentStatus.TRIGGERED, IncidentStatus.ACKNOWLEDGED)
+_STATS_AGGREGATES = {
+    "triggered": Count("id", filter=Q(status=IncidentStatus.TRIGGERED)),
+    "acknowledged": Count("id", filter=Q(status=IncidentStatus.ACKNOWLEDGED)),
+}
+
+
+# Columns read by get_incident_serialized()
+BROADCAST_INCIDENT_FIELDS = (
+    "id", "title", "severity", "status", "service__name", "lead__username",
+    "created_at", "acknowledged_at", "resolved_at", "lid_link", "war_room_link",
+)
+
+
+def get_broadcast_incident(incident_id):
+    """
+    Fetch an incident with only the columns a broadcast needs.
+    
+    Service and lead are joined in the same query, so serializing the
+    result issues no further queries.
+    """
+    return (
+        Incident.objects.select_related("service", "lead")
+        .only(*BROADCAST_INCIDENT_FIELDS)
+        .get(pk=incident_id)
+    )
+
 
 def get_incident_serialized(incident) -> dict:
     """
     Serialize an incident for WebSocket broadcast.
     
     Returns a lightweight representation suitable for real-time updates.
+    Callers that load the incident for a broadcast should use
+    get_broadcast_incident() so the service and lead are already joined.
     """
     return {
         "id": str(incident.id),
         "short_id": incident.short_id,
         "title": incident.title,
         "severity": incident.severity,
-        "severity_display": incident.get_severity_display(),
+        "severity_display": _SEVERITY_LABELS.get(incident.severity, incident.severity),
         "status": incident.status,
-        "status_display": incident.get_status_display(),
+        "status_display": _STATUS_LABELS.get(incident.status, incident.status),
         "service": incident.service.name if incident.service else None,
         "lead": incident.lead.username if incident.lead else None,
         "created_at": incident.created_at.isoformat() if incident.created_at else None,
@@ -38,6 +82,99 @@ def get_incident_serialized(incident) -> dict:
     }
 
 
+# Groups with listeners nearly all the time; never worth checking
+_ALWAYS_SEND_GROUPS = frozenset({"incidents_all", "dashboard"})
+# How long a subscriber check is trusted, in seconds
+_SUBSCRIBER_CHECK_TTL = 2.0
+# Upper bound on remembered checks; incident groups come and go
+_SUBSCRIBER_CHECK_MAX = 1024
+# group -> (monotonic time of the check, whether it had subscribers),
+# oldest check first. Broadcasts run from async_to_sync on concurrent
+# request and Celery threads, so every access holds the lock.
+_subscriber_checks: OrderedDict[str, tuple[float, bool]] = OrderedDict()
+_subscriber_checks_lock = threading.Lock()
+
+
+def _pubsub_numsub_target(channel_layer, group: str) -> tuple[Any, str] | None:
+    """
+    Return the Redis client and channel name a group publishes on.
+    
+    Only the Redis pub/sub layer has such a channel. This is the single
+    place that reaches into channels_redis internals; a test pins the
+    attribute names it relies on, which is why the dependency is pinned.
+    """
+    if not isinstance(channel_layer, RedisPubSubChannelLayer):
+        return None
+    layer = channel_layer._get_layer()
+    group_channel = layer._get_group_channel_name(group)
+    shard = layer._get_shard(group_channel)
+    shard._ensure_redis()
+    return shard._redis, group_channel
+
+
+async def _count_subscribers(channel_layer, group: str) -> int | None:
+    """Count the processes subscribed to a group (PUBSUB NUMSUB), or None if unknown."""
+    target = _pubsub_numsub_target(channel_layer, group)
+    if target is None:
+        return None
+    client, group_channel = target
+    [(_, count)] = await client.pubsub_numsub(group_channel)
+    return count
+
+
+def _remember_check(group: str, now: float, has_subscribers: bool) -> None:
+    """Record a check, dropping expired entries and keeping the cache bounded."""
+    with _subscriber_checks_lock:
+        _subscriber_checks[group] = (now, has_subscribers)
+        _subscriber_checks.move_to_end(group)
+        while _subscriber_checks:
+            oldest_group, (checked_at, _) = next(iter(_subscriber_checks.items()))
+            expired = now - checked_at >= _SUBSCRIBER_CHECK_TTL
+            if not expired and len(_subscriber_checks) <= _SUBSCRIBER_CHECK_MAX:
+                break
+            del _subscriber_checks[oldest_group]
+
+
+async def _has_subscribers(channel_layer, group: str) -> bool:
+    """Return False only when the group was recently seen without listeners."""
+    if group in _ALWAYS_SEND_GROUPS:
+        return True
+    
+    now = time.monotonic()
+    with _subscriber_checks_lock:
+        checked = _subscriber_checks.get(group)
+    if checked is not None and now - checked[0] < _SUBSCRIBER_CHECK_TTL:
+        return checked[1]
+    
+    try:
+        count = await _count_subscribers(channel_layer, group)
+    except Exception as e:
+        logger.debug(f"Subscriber check failed for {group}: {e}")
+        count = None
+    has_subscribers = count is None or count > 0
+    _remember_check(group, now, has_subscribers)
+    return has_subscribers
+
+
+async def _group_send_many(channel_layer, messages: list[tuple[str, dict]]) -> None:
+    """
+    Send several group messages in order from a single event loop.
+    
+    Each message is also the frame its consumer handler sends to clients,
+    so it is encoded once here and published as {"type", "frame"}; a
+    message shared by several groups is encoded only once.
+    """
+    published: dict[int, dict] = {}
+    for group, message in messages:
+        if not await _has_subscribers(channel_layer, group):
+            continue
+        event = published.get(id(message))
+        if event is None:
+            event = {"type": message["type"], "frame": encode_frame(message)}
+            published[id(message)] = event
+        await channel_layer.group_send(group, event)
+
+
 def broadcast_incident_created(incident) -> None:
     """
     Broadcast new incident creation to all connected clients.
@@ -53,33 +190,27 @@ def broadcast_incident_created(incident) -> None:
         
         incident_data = get_incident_serialized(incident)
         
-        # Broadcast to all incidents group
-        async_to_sync(channel_layer.group_send)(
-            "incidents_all",
-            {
+        messages = [
+            # Broadcast to all incidents group
+            ("incidents_all", {
                 "type": "incident_created",
                 "incident": incident_data,
-            }
-        )
-        
-        # Broadcast to dashboard
-        async_to_sync(channel_layer.group_send)(
-            "dashboard",
-            {
+            }),
+            # Broadcast to dashboard
+            ("dashboard", {
                 "type": "stats_update",
                 "stats": _get_stats(),
-            }
-        )
+            }),
+        ]
         
         # If critical, send alert
         if incident.severity in ["SEV1_CRITICAL", "SEV2_HIGH"]:
-            async_to_sync(channel_layer.group_send)(
-                "dashboard",
-                {
-                    "type": "critical_alert",
-                    "incident": incident_data,
-                }
-            )
+            messages.append(("dashboard", {
+                "type": "critical_alert",
+                "incident": incident_data,
+            }))
+        
+        async_to_sync(_group_send_many)(channel_layer, messages)
         
         logger.debug(f"Broadcast: incident_created {incident.short_id}")
         
@@ -100,27 +231,17 @@ def broadcast_incident_updated(incident, changes: Optional[dict] = None) -> None
         if not channel_layer:
             return
         
-        incident_data = get_incident_serialized(incident)
+        message = {
+            "type": "incident_updated",
+            "incident": get_incident_serialized(incident),
+            "changes": changes or {},
+        }
         
-        # Broadcast to specific incident group
-        async_to_sync(channel_layer.group_send)(
-            f"incident_{incident.id}",
-            {
-                "type": "incident_updated",
-                "incident": incident_data,
-                "changes": changes or {},
-            }
-        )
-        
-        # Broadcast to all incidents group
-        async_to_sync(channel_layer.group_send)(
-            "incidents_all",
-            {
-                "type": "incident_updated",
-                "incident": incident_data,
-                "changes": changes or {},
-            }
-        )
+        # Broadcast to specific incident group and all incidents group
+        async_to_sync(_group_send_many)(channel_layer, [
+            (f"incident_{incident.id}", message),
+            ("incidents_all", message),
+        ])
         
         logger.debug(f"Broadcast: incident_updated {incident.short_id}")
         
@@ -137,36 +258,22 @@ def broadcast_incident_acknowledged(incident, acknowledged_by: Optional[str] = N
         if not channel_layer:
             return
         
-        incident_data = get_incident_serialized(incident)
-        
-        # Broadcast to specific incident group
-        async_to_sync(channel_layer.group_send)(
-            f"incident_{incident.id}",
-            {
-                "type": "incident_acknowledged",
-                "incident": incident_data,
-                "acknowledged_by": acknowledged_by,
-            }
-        )
-        
-        # Broadcast to all incidents group
-        async_to_sync(channel_layer.group_send)(
-            "incidents_all",
-            {
-                "type": "incident_acknowledged",
-                "incident": incident_data,
-                "acknowledged_by": acknowledged_by,
-            }
-        )
+        message = {
+            "type": "incident_acknowledged",
+            "incident": get_incident_serialized(incident),
+            "acknowledged_by": acknowledged_by,
+        }
         
-        # Update dashboard stats
-        async_to_sync(channel_layer.group_send)(
-            "dashboard",
-            {
+        # Broadcast to specific incident group, all incidents group and
+        # update dashboard stats
+        async_to_sync(_group_send_many)(channel_layer, [
+            (f"incident_{incident.id}", message),
+            ("incidents_all", message),
+            ("dashboard", {
                 "type": "stats_update",
                 "stats": _get_stats(),
-            }
-        )
+            }),
+        ])
         
         logger.debug(f"Broadcast: incident_acknowledged {incident.short_id}")
         
@@ -183,36 +290,22 @@ def broadcast_incident_resolved(incident, resolved_by: Optional[str] = None) ->
         if not channel_layer:
             return
         
-        incident_data = get_incident_serialized(incident)
-        
-        # Broadcast to specific incident group
-        async_to_sync(channel_layer.group_send)(
-            f"incident_{incident.id}",
-            {
-                "type": "incident_resolved",
-                "incident": incident_data,
-                "resolved_by": resolved_by,
-            }
-        )
-        
-        # Broadcast to all incidents group
-        async_to_sync(channel_layer.group_send)(
-            "incidents_all",
-            {
-                "type": "incident_resolved",
-                "incident": incident_data,
-                "resolved_by": resolved_by,
-            }
-        )
+        message = {
+            "type": "incident_resolved",
+            "incident": get_incident_serialized(incident),
+            "resolved_by": resolved_by,
+        }
         
-        # Update dashboard stats
-        async_to_sync(channel_layer.group_send)(
-            "dashboard",
-            {
+        # Broadcast to specific incident group, all incidents group and
+        # update dashboard stats
+        async_to_sync(_group_send_many)(channel_layer, [
+            (f"incident_{incident.id}", message),
+            ("incidents_all", message),
+            ("dashboard", {
                 "type": "stats_update",
                 "stats": _get_stats(),
-            }
-        )
+            }),
+        ])
         
         logger.debug(f"Broadcast: incident_resolved {incident.short_id}")
         
@@ -229,14 +322,13 @@ def broadcast_incident_event(incident_id: str, event_data: dict) -> None:
         if not channel_layer:
             return
         
-        async_to_sync(channel_layer.group_send)(
-            f"incident_{incident_id}",
-            {
+        async_to_sync(_group_send_many)(channel_layer, [
+            (f"incident_{incident_id}", {
                 "type": "incident_event_added",
                 "incident_id": str(incident_id),
                 "event": event_data,
-            }
-        )
+            }),
+        ])
         
         logger.debug(f"Broadcast: incident_event_added {incident_id}")
         
@@ -245,18 +337,21 @@ def broadcast_incident_event(incident_id: str, event_data: dict) -> None:
 
 
 def _get_stats() -> dict:
-    """Get current incident statistics for dashboard broadcast."""
+    """
+    Get current incident statistics for dashboard broadcast.
+    
+    The result is cached for a couple of seconds so a burst of broadcasts
+    (e.g. during an alert storm) shares a single query.
+    """
     try:
-        from core.choices import IncidentStatus
-        from core.models import Incident
+        stats = CacheManager.get_broadcast_stats()
+        if stats is not None:
+            return stats
         
-        return {
-            "triggered": Incident.objects.filter(
-                status=IncidentStatus.TRIGGERED
-            ).count(),
-            "acknowledged": Incident.objects.filter(
-                status=IncidentStatus.ACKNOWLEDGED
-            ).count(),
-        }
+        stats = Incident.objects.filter(
+            status__in=_STATS_STATUSES,
+        ).aggregate(**_STATS_AGGREGATES)
+        CacheManager.set_broadcast_stats(stats)
+        return stats
     except Exception:
         return {"triggered": 0, "acknowledged": 0}
@@ -35,8 +35,8 @@ def make_cache_key(*args, prefix: str = "imas") -> str:
     Returns:
         A unique cache key string
     """
-    key_data = ":".join(str(arg) for arg in args)
-    key_hash = hashlib.md5(key_data.encode()).hexdigest()[:12]
+    key_data = ":".join(map(str, args))
+    key_hash = hashlib.blake2b(key_data.encode(), digest_size=6).hexdigest()
     return f"{prefix}:{key_hash}"
 
 
@@ -44,10 +44,21 @@ def cached_queryset(
     cache_key: str,
     timeout: Optional[int] = None,
     cache_type: str = "default",
+    as_values: bool = False,
+    max_rows: int = 10_000,
 ) -> Callable:
     """
     Decorator to cache QuerySet results.
     
+    With as_values=True a returned QuerySet is cached as plain dicts
+    (QuerySet.values()), which pickle smaller and faster than model
+    instances and survive model changes. Callers then get dicts on both
+    cache hits and misses.
+    
+    A QuerySet is always evaluated once and returned as a list, but one
+    with more than max_rows rows is not cached, keeping oversized pickles
+    out of the cache.
+    
     Usage:
         @cached_queryset("active_incidents", cache_type="incident_list")
         def get_active_incidents():
@@ -72,7 +83,12 @@ def cached_queryset(
             
             # Handle QuerySets by converting to list
             if isinstance(result, QuerySet):
-                result = list(result)
+                result = list(result.values() if as_values else result)
+                if len(result) > max_rows:
+                    logger.warning(
+                        f"Not caching {full_key}: {len(result)} rows exceeds {max_rows}"
+                    )
+                    return result
             
             effective_timeout = timeout or get_cache_timeout(cache_type)
             cache.set(full_key, result, timeout=effective_timeout)
@@ -131,7 +147,31 @@ class CacheManager:
     @staticmethod
     def invalidate_dashboard_stats() -> None:
         """Invalidate dashboard stats cache."""
-        cache.delete("imas:dashboard:stats")
+        cache.delete_many(
+            ["imas:dashboard:stats", "imas:broadcast:stats", "imas:dashboard:live"]
+        )
+    
+    @staticmethod
+    def get_broadcast_stats() -> Optional[dict]:
+        """Get cached WebSocket broadcast statistics."""
+        return cache.get("imas:broadcast:stats")
+    
+    @staticmethod
+    def set_broadcast_stats(stats: dict) -> None:
+        """Cache WebSocket broadcast statistics for a short burst window."""
+        timeout = get_cache_timeout("broadcast_stats")
+        cache.set("imas:broadcast:stats", stats, timeout=timeout)
+    
+    @staticmethod
+    def get_live_stats() -> Optional[dict]:
+        """Get cached stats sent to dashboard WebSocket clients."""
+        return cache.get("imas:dashboard:live")
+    
+    @staticmethod
+    def set_live_stats(stats: dict) -> None:
+        """Cache dashboard WebSocket stats to absorb reconnect storms."""
+        timeout = get_cache_timeout("dashboard_live_stats")
+        cache.set("imas:dashboard:live", stats, timeout=timeout)
     
     @staticmethod
     def get_incident_count(status: str) -> Optional[int]:
@@ -144,13 +184,29 @@ class CacheManager:
         timeout = get_cache_timeout("incident_list")
         cache.set(f"imas:incident:count:{status}", count, timeout=timeout)
     
+    @staticmethod
+    def get_incident_counts(statuses: list[str]) -> dict[str, int]:
+        """Get cached incident counts for several statuses in one round trip."""
+        cached = cache.get_many([f"imas:incident:count:{status}" for status in statuses])
+        return {key.rsplit(":", 1)[1]: count for key, count in cached.items()}
+    
+    @staticmethod
+    def set_incident_counts(counts: dict[str, int]) -> None:
+        """Cache incident counts for several statuses in one round trip."""
+        timeout = get_cache_timeout("incident_list")
+        cache.set_many(
+            {f"imas:incident:count:{status}": count for status, count in counts.items()},
+            timeout=timeout,
+        )
+    
     @staticmethod
     def invalidate_incident_counts() -> None:
         """Invalidate all incident count caches."""
         statuses = ["TRIGGERED", "ACKNOWLEDGED", "RESOLVED", "ARCHIVED"]
-        for status in statuses:
-            cache.delete(f"imas:incident:count:{status}")
-        cache.delete("imas:dashboard:stats")
+        cache.delete_many(
+            [f"imas:incident:count:{status}" for status in statuses]
+            + ["imas:dashboard:stats", "imas:broadcast:stats", "imas:dashboard:live"]
+        )
     
     @staticmethod
     def get_services_list() -> Optional[list]:
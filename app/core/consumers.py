@@ -5,17 +5,154 @@ Real-time updates for incidents using Django Channels.
 """
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 from typing import Any
 
+import orjson
 from channels.db import database_sync_to_async
 from channels.generic.websocket import AsyncJsonWebsocketConsumer
+from django.db.models import Count, Q
+from django.utils import timezone
+from django.utils.functional import cached_property
+
+from core.cache import CacheManager
+from core.choices import IncidentStatus
+from core.models import Incident
 
 logger = logging.getLogger(__name__)
 
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+
+def encode_frame(content: Any) -> str:
+    """Encode a frame; types orjson cannot handle natively fall back to str()."""
+    return orjson.dumps(content, default=str, option=_ORJSON_OPTIONS).decode()
+
+
+class ORJSONWebsocketConsumer(AsyncJsonWebsocketConsumer):
+    """
+    JSON WebSocket consumer that encodes and decodes frames with orjson.
+    
+    Clients connecting with ?frames=binary receive UTF-8 JSON in binary
+    frames, skipping the str round trip; everyone else gets text frames.
+    Clients connecting with ?batch=1 receive group broadcasts as JSON
+    arrays, coalescing whatever queued up while the previous frame was
+    being sent (at most max_batch messages per frame). A batching client
+    that falls max_outbox frames behind is disconnected rather than
+    buffered without limit.
+    """
+    
+    max_batch = 32
+    max_outbox = 1000
+    _outbox: asyncio.Queue | None = None
+    _writer: asyncio.Task | None = None
+    _closer: asyncio.Task | None = None
+    _closing = False
+    
+    @classmethod
+    async def decode_json(cls, text_data: str | bytes) -> Any:
+        return orjson.loads(text_data)
+    
+    @classmethod
+    async def encode_json(cls, content: Any) -> str:
+        return encode_frame(content)
+    
+    @cached_property
+    def _query_flags(self) -> frozenset[bytes]:
+        return frozenset(self.scope.get("query_string", b"").split(b"&"))
+    
+    @cached_property
+    def binary_frames(self) -> bool:
+        """Whether the client asked for binary frames."""
+        return b"frames=binary" in self._query_flags
+    
+    @cached_property
+    def batch_frames(self) -> bool:
+        """Whether the client asked for batched broadcast frames."""
+        return b"batch=1" in self._query_flags
+    
+    async def receive(self, text_data: str | None = None, bytes_data: bytes | None = None, **kwargs):
+        """Accept JSON in text or binary frames."""
+        data = text_data if text_data is not None else bytes_data
+        if data is None:
+            raise ValueError("No data in incoming WebSocket frame!")
+        await self.receive_json(await self.decode_json(data), **kwargs)
+    
+    async def send_json(self, content: Any, close: bool = False) -> None:
+        """Encode inline instead of awaiting the encode_json coroutine."""
+        if self.binary_frames:
+            data = orjson.dumps(content, default=str, option=_ORJSON_OPTIONS)
+            await self.send(bytes_data=data, close=close)
+        else:
+            await self.send(text_data=encode_frame(content), close=close)
+    
+    async def send_frame(self, event: dict) -> None:
+        """
+        Forward a group event to the client.
+        
+        Broadcasts carry the client frame pre-encoded under "frame", so it
+        is encoded once per broadcast rather than once per connection.
+        An event without one already has the frame's shape and is encoded
+        here.
+        """
+        frame = event.get("frame")
+        if self.batch_frames:
+            await self._enqueue(frame if frame is not None else encode_frame(event))
+        elif frame is None:
+            await self.send_json(event)
+        else:
+            await self._send_encoded(frame)
+    
+    async def _send_encoded(self, frame: str) -> None:
+        if self.binary_frames:
+            await self.send(bytes_data=frame.encode())
+        else:
+            await self.send(text_data=frame)
+    
+    async def _enqueue(self, frame: str) -> None:
+        """Queue a frame for the batching writer, starting it on first use."""
+        if self._closing:
+            return
+        if self._outbox is None:
+            self._outbox = asyncio.Queue(maxsize=self.max_outbox)
+            self._writer = asyncio.create_task(self._write_batches())
+            self._writer.add_done_callback(self._writer_done)
+        try:
+            self._outbox.put_nowait(frame)
+        except asyncio.QueueFull:
+            logger.warning(
+                f"WebSocket client fell {self.max_outbox} frames behind, disconnecting"
+            )
+            self._closing = True
+            self._writer.cancel()
+            await self.close(code=1013)
+    
+    def _writer_done(self, task: asyncio.Task) -> None:
+        """Close the connection when the batching writer dies with an error."""
+        if task.cancelled() or task.exception() is None:
+            return
+        logger.error(
+            "WebSocket batch writer failed, closing connection", exc_info=task.exception()
+        )
+        self._closing = True
+        self._closer = asyncio.ensure_future(self.close(code=1011))
+    
+    async def _write_batches(self) -> None:
+        while True:
+            batch = [await self._outbox.get()]
+            while len(batch) < self.max_batch and not self._outbox.empty():
+                batch.append(self._outbox.get_nowait())
+            # Frames are already JSON, so the array is built by joining them
+            await self._send_encoded("[" + ",".join(batch) + "]")
+    
+    async def websocket_disconnect(self, message: dict) -> None:
+        if self._writer is not None:
+            self._writer.cancel()
+        await super().websocket_disconnect(message)
+
 
-class IncidentConsumer(AsyncJsonWebsocketConsumer):
+class IncidentConsumer(ORJSONWebsocketConsumer):
     """
     WebSocket consumer for real-time incident updates.
     
@@ -24,6 +161,9 @@ class IncidentConsumer(AsyncJsonWebsocketConsumer):
     - Specific incident: /ws/incidents/<incident_id>/
     """
     
+    # Most incidents one subscribe/unsubscribe message can cover
+    MAX_BATCH_SUBSCRIBE = 100
+    
     async def connect(self):
         """Handle WebSocket connection."""
         self.incident_id = self.scope["url_route"]["kwargs"].get("incident_id")
@@ -70,7 +210,9 @@ class IncidentConsumer(AsyncJsonWebsocketConsumer):
         
         Supported message types:
         - ping: Keep-alive ping
-        - subscribe: Subscribe to specific incident
+        - subscribe: Subscribe to specific incident (incident_id), or to
+          several at once (incident_ids, up to MAX_BATCH_SUBSCRIBE)
+        - unsubscribe: Same shape as subscribe
         """
         message_type = content.get("type")
         
@@ -78,6 +220,20 @@ class IncidentConsumer(AsyncJsonWebsocketConsumer):
             await self.send_json({"type": "pong"})
         
         elif message_type == "subscribe":
+            incident_ids = content.get("incident_ids")
+            if isinstance(incident_ids, list) and incident_ids:
+                incident_ids = incident_ids[:self.MAX_BATCH_SUBSCRIBE]
+                # One concurrent round of group_add calls instead of a chain
+                await asyncio.gather(*(
+                    self.channel_layer.group_add(f"incident_{i}", self.channel_name)
+                    for i in incident_ids
+                ))
+                await self.send_json({
+                    "type": "subscribed",
+                    "incident_ids": incident_ids,
+                })
+                return
+            
             # Subscribe to a specific incident
             incident_id = content.get("incident_id")
             if incident_id:
@@ -92,6 +248,19 @@ class IncidentConsumer(AsyncJsonWebsocketConsumer):
                 })
         
         elif message_type == "unsubscribe":
+            incident_ids = content.get("incident_ids")
+            if isinstance(incident_ids, list) and incident_ids:
+                incident_ids = incident_ids[:self.MAX_BATCH_SUBSCRIBE]
+                await asyncio.gather(*(
+                    self.channel_layer.group_discard(f"incident_{i}", self.channel_name)
+                    for i in incident_ids
+                ))
+                await self.send_json({
+                    "type": "unsubscribed",
+                    "incident_ids": incident_ids,
+                })
+                return
+            
             incident_id = content.get("incident_id")
             if incident_id:
                 old_group = f"incident_{incident_id}"
@@ -108,45 +277,26 @@ class IncidentConsumer(AsyncJsonWebsocketConsumer):
     
     async def incident_created(self, event: dict):
         """Handle new incident created."""
-        await self.send_json({
-            "type": "incident_created",
-            "incident": event["incident"],
-        })
+        await self.send_frame(event)
     
     async def incident_updated(self, event: dict):
         """Handle incident update."""
-        await self.send_json({
-            "type": "incident_updated",
-            "incident": event["incident"],
-            "changes": event.get("changes", {}),
-        })
+        await self.send_frame(event)
     
     async def incident_acknowledged(self, event: dict):
         """Handle incident acknowledged."""
-        await self.send_json({
-            "type": "incident_acknowledged",
-            "incident": event["incident"],
-            "acknowledged_by": event.get("acknowledged_by"),
-        })
+        await self.send_frame(event)
     
     async def incident_resolved(self, event: dict):
         """Handle incident resolved."""
-        await self.send_json({
-            "type": "incident_resolved",
-            "incident": event["incident"],
-            "resolved_by": event.get("resolved_by"),
-        })
+        await self.send_frame(event)
     
     async def incident_event_added(self, event: dict):
         """Handle new event added to incident timeline."""
-        await self.send_json({
-            "type": "incident_event_added",
-            "incident_id": event["incident_id"],
-            "event": event["event"],
-        })
+        await self.send_frame(event)
 
 
-class DashboardConsumer(AsyncJsonWebsocketConsumer):
+class DashboardConsumer(ORJSONWebsocketConsumer):
     """
     WebSocket consumer for real-time dashboard updates.
     
@@ -205,35 +355,33 @@ class DashboardConsumer(AsyncJsonWebsocketConsumer):
     
     @database_sync_to_async
     def get_dashboard_stats(self) -> dict:
-        """Get current dashboard statistics."""
-        from core.choices import IncidentStatus
-        from core.models import Incident
-        
-        return {
-            "triggered": Incident.objects.filter(
-                status=IncidentStatus.TRIGGERED
-            ).count(),
-            "acknowledged": Incident.objects.filter(
-                status=IncidentStatus.ACKNOWLEDGED
-            ).count(),
-            "resolved_today": Incident.objects.filter(
+        """
+        Get current dashboard statistics.
+        
+        Cached for a few seconds so a burst of (re)connecting clients shares
+        one query; incident status changes invalidate the cache.
+        """
+        stats = CacheManager.get_live_stats()
+        if stats is not None:
+            return stats
+        
+        stats = Incident.objects.aggregate(
+            triggered=Count("id", filter=Q(status=IncidentStatus.TRIGGERED)),
+            acknowledged=Count("id", filter=Q(status=IncidentStatus.ACKNOWLEDGED)),
+            resolved_today=Count("id", filter=Q(
                 status=IncidentStatus.RESOLVED,
-                resolved_at__date__gte=__import__("django.utils.timezone", fromlist=["now"]).now().date()
-            ).count(),
-        }
+                resolved_at__date__gte=timezone.localdate(),
+            )),
+        )
+        CacheManager.set_live_stats(stats)
+        return stats
     
     # Message handlers for group broadcasts
     
     async def stats_update(self, event: dict):
         """Handle stats update broadcast."""
-        await self.send_json({
-            "type": "stats_update",
-            "stats": event["stats"],
-        })
+        await self.send_frame(event)
     
     async def critical_alert(self, event: dict):
         """Handle critical incident alert."""
-        await self.send_json({
-            "type": "critical_alert",
-            "incident": event["incident"],
-        })
+        await self.send_frame(event)
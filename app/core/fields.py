@@ -0,0 +1,44 @@
+"""
+IMAS Manager - Model Fields
+
+Custom model fields shared across the core models.
+"""
+from __future__ import annotations
+
+import orjson
+from django.db import models
+from django.db.models.fields.json import KeyTransform
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+class FastJSONField(models.JSONField):
+    """
+    JSONField that (de)serializes with orjson instead of the json module.
+
+    Only whole-document loads and saves take the orjson path. Lookups,
+    expressions, and fields with a custom encoder or decoder go through
+    JSONField unchanged.
+    """
+
+    def from_db_value(self, value, expression, connection):
+        if self.decoder is not None or not isinstance(value, (str, bytes)):
+            return super().from_db_value(value, expression, connection)
+        if isinstance(expression, KeyTransform):
+            return super().from_db_value(value, expression, connection)
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            return value
+
+    def get_db_prep_save(self, value, connection):
+        if (
+            self.encoder is not None
+            or value is None
+            or hasattr(value, "resolve_expression")
+        ):
+            return super().get_db_prep_save(value, connection)
+        # The column type (json/jsonb/text) gives the string its meaning.
+        # No default= hook: unserializable values raise TypeError, like the
+        # json module does for JSONField.
+        return orjson.dumps(value, option=_ORJSON_OPTIONS).decode()
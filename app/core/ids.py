@@ -0,0 +1,31 @@
+"""
+IMAS Manager - Identifiers
+
+Time-ordered UUIDs for primary keys on high-insert tables.
+"""
+from __future__ import annotations
+
+import os
+import time
+import uuid
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a version 7 UUID (RFC 9562).
+    
+    The leading 48 bits are the Unix time in milliseconds, so new keys
+    land at the right edge of a B-tree index instead of at random pages
+    as uuid4 keys do. The remaining 74 bits are random.
+    """
+    unix_ts_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    rand_a = rand >> 68  # 12 bits
+    rand_b = rand & ((1 << 62) - 1)  # 62 bits
+    return uuid.UUID(int=(
+        (unix_ts_ms & ((1 << 48) - 1)) << 80
+        | 0x7 << 76
+        | rand_a << 64
+        | 0b10 << 62
+        | rand_b
+    ))
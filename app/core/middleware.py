@@ -5,7 +5,10 @@ Provides audit logging and security headers for the application.
 """
 from __future__ import annotations
 
+import cProfile
+import io
 import logging
+import pstats
 import time
 from typing import Callable
 
@@ -19,54 +22,41 @@ class AuditLogMiddleware:
     """
     Middleware to log API requests for security auditing.
     
-    Only logs:
+    Only logs mutating requests (POST, PUT, PATCH, DELETE) to:
     - API endpoints (starting with /api/)
-    - Mutating requests (POST, PUT, PATCH, DELETE)
     - Authentication endpoints
+    - The admin site
     """
     
-    AUDIT_PATHS = ["/api/", "/auth/", "/admin/"]
-    SKIP_PATHS = ["/api/v1/health/", "/health/", "/static/", "/favicon.ico"]
-    AUDIT_METHODS = ["POST", "PUT", "PATCH", "DELETE"]
+    # Tuples so str.startswith() tests every prefix in one call
+    AUDIT_PATHS = ("/api/", "/auth/", "/admin/")
+    SKIP_PATHS = ("/api/v1/health/", "/health/", "/static/", "/favicon.ico")
+    AUDIT_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
     
     def __init__(self, get_response: Callable):
         self.get_response = get_response
     
     def __call__(self, request: HttpRequest) -> HttpResponse:
-        # Skip non-audit paths
-        if not self._should_audit(request):
+        # Fast path, inlined: reads are never audited, then path prefixes
+        path = request.path
+        if (
+            request.method not in self.AUDIT_METHODS
+            or not path.startswith(self.AUDIT_PATHS)
+            or path.startswith(self.SKIP_PATHS)
+        ):
             return self.get_response(request)
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         response = self.get_response(request)
         
         # Log after response
-        duration_ms = (time.time() - start_time) * 1000
+        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         self._log_request(request, response, duration_ms)
         
         return response
     
-    def _should_audit(self, request: HttpRequest) -> bool:
-        """Determine if request should be audited."""
-        path = request.path
-        
-        # Skip certain paths
-        for skip_path in self.SKIP_PATHS:
-            if path.startswith(skip_path):
-                return False
-        
-        # Only audit specific paths
-        for audit_path in self.AUDIT_PATHS:
-            if path.startswith(audit_path):
-                # For GET requests, only log admin access
-                if request.method == "GET" and not path.startswith("/admin/"):
-                    return False
-                return True
-        
-        return False
-    
-    def _log_request(self, request: HttpRequest, response: HttpResponse, duration_ms: float):
+    def _log_request(self, request: HttpRequest, response: HttpResponse, duration_ms: int):
         """Log the request to audit log."""
         from core.models import AuditLog, AuditAction
         
@@ -77,10 +67,10 @@ class AuditLogMiddleware:
             action = AuditAction.API_REQUEST
         
         # Build description
-        description = f"{request.method} {request.path} -> {response.status_code} ({duration_ms:.0f}ms)"
+        description = f"{request.method} {request.path} -> {response.status_code} ({duration_ms}ms)"
         
         try:
-            AuditLog.log(
+            AuditLog.log_async(
                 action=action,
                 user=request.user if hasattr(request, "user") else None,
                 request=request,
@@ -95,38 +85,79 @@ class AuditLogMiddleware:
 
 class SecurityHeadersMiddleware:
     """
-    Middleware to add security headers to all responses.
+    Middleware to add the security headers Django cannot emit itself.
+    
+    X-Content-Type-Options, Referrer-Policy and HSTS are set by
+    SecurityMiddleware and X-Frame-Options by XFrameOptionsMiddleware
+    (see the SECURE_* and X_FRAME_OPTIONS settings).
     """
     
+    CONTENT_SECURITY_POLICY = (
+        "default-src 'self'; "
+        "script-src 'self' 'unsafe-inline' cdn.tailwindcss.com cdn.jsdelivr.net; "
+        "style-src 'self' 'unsafe-inline' cdn.tailwindcss.com cdnjs.cloudflare.com; "
+        "font-src 'self' cdnjs.cloudflare.com; "
+        "img-src 'self' data:; "
+        "connect-src 'self'; "
+        "frame-ancestors 'none';"
+    )
+    
     def __init__(self, get_response: Callable):
         self.get_response = get_response
+        
+        # Built once; the set of headers only depends on settings
+        self.headers = {"X-XSS-Protection": "1; mode=block"}
+        
+        # Content Security Policy (only in production)
+        if not settings.DEBUG:
+            self.headers["Content-Security-Policy"] = self.CONTENT_SECURITY_POLICY
     
     def __call__(self, request: HttpRequest) -> HttpResponse:
         response = self.get_response(request)
+        for header, value in self.headers.items():
+            response.headers[header] = value
+        return response
+
+
+class StaffProfilerMiddleware:
+    """
+    On-demand cProfile output for staff users.
+    
+    A staff user adding ``?prof`` (or ``?prof=<sort key>``, e.g. ``time``)
+    to any URL gets the pstats report instead of the page. The report is
+    also kept in the cache for an hour under ``imas:prof:<user id>``.
+    Every other request costs a single membership check.
+    """
+    
+    DEFAULT_SORT = pstats.SortKey.CUMULATIVE
+    SORT_KEYS = frozenset(key.value for key in pstats.SortKey)
+    STATS_LIMIT = 50
+    CACHE_TIMEOUT = 3600
+    
+    def __init__(self, get_response: Callable):
+        self.get_response = get_response
+    
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if "prof" not in request.GET or not request.user.is_staff:
+            return self.get_response(request)
         
-        # Security headers
-        response["X-Content-Type-Options"] = "nosniff"
-        response["X-Frame-Options"] = "DENY"
-        response["X-XSS-Protection"] = "1; mode=block"
-        response["Referrer-Policy"] = "strict-origin-when-cross-origin"
+        from django.core.cache import cache
         
-        # HSTS (only in production)
-        if not settings.DEBUG:
-            response["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
+        profiler = cProfile.Profile()
+        profiler.runcall(self.get_response, request)
         
-        # Content Security Policy
-        if not settings.DEBUG:
-            response["Content-Security-Policy"] = (
-                "default-src 'self'; "
-                "script-src 'self' 'unsafe-inline' cdn.tailwindcss.com cdn.jsdelivr.net; "
-                "style-src 'self' 'unsafe-inline' cdn.tailwindcss.com cdnjs.cloudflare.com; "
-                "font-src 'self' cdnjs.cloudflare.com; "
-                "img-src 'self' data:; "
-                "connect-src 'self'; "
-                "frame-ancestors 'none';"
-            )
+        sort_key = request.GET["prof"]
+        if sort_key not in self.SORT_KEYS:
+            sort_key = self.DEFAULT_SORT
         
-        return response
+        output = io.StringIO()
+        pstats.Stats(profiler, stream=output).sort_stats(sort_key).print_stats(
+            self.STATS_LIMIT
+        )
+        report = output.getvalue()
+        
+        cache.set(f"imas:prof:{request.user.pk}", report, self.CACHE_TIMEOUT)
+        return HttpResponse(report, content_type="text/plain; charset=utf-8")
 
 
 class RateLimitByIPMiddleware:
@@ -138,6 +169,9 @@ class RateLimitByIPMiddleware:
     # Requests per minute for anonymous users
     RATE_LIMIT = 60
     
+    # Health probes and schema/docs endpoints are never rate limited
+    SKIP_PATHS = ("/api/v1/health/", "/api/schema/", "/api/docs/", "/api/redoc/")
+    
     def __init__(self, get_response: Callable):
         self.get_response = get_response
     
@@ -145,35 +179,41 @@ class RateLimitByIPMiddleware:
         from django.core.cache import cache
         from django.http import JsonResponse
         
-        # Skip for authenticated users (they have DRF throttling)
-        if hasattr(request, "user") and request.user.is_authenticated:
+        # Skip non-API paths (health checks, static files, dashboard) and
+        # exempt API paths before touching the cache
+        path = request.path
+        if not path.startswith("/api/") or path.startswith(self.SKIP_PATHS):
             return self.get_response(request)
         
-        # Skip for non-API paths
-        if not request.path.startswith("/api/"):
+        # Skip for authenticated users (they have DRF throttling)
+        if hasattr(request, "user") and request.user.is_authenticated:
             return self.get_response(request)
         
         # Get client IP
         ip = self._get_client_ip(request)
         cache_key = f"rate_limit:{ip}"
         
-        # Check rate limit
-        request_count = cache.get(cache_key, 0)
+        # Count this request atomically; add() only starts a new 60 second
+        # window when none is open
+        cache.add(cache_key, 0, 60)
+        try:
+            request_count = cache.incr(cache_key)
+        except ValueError:
+            # The window expired between add() and incr()
+            cache.add(cache_key, 1, 60)
+            request_count = 1
         
-        if request_count >= self.RATE_LIMIT:
+        if request_count > self.RATE_LIMIT:
             return JsonResponse(
                 {"error": "Rate limit exceeded. Please try again later."},
                 status=429,
             )
         
-        # Increment counter
-        cache.set(cache_key, request_count + 1, 60)  # 60 second window
-        
         response = self.get_response(request)
         
         # Add rate limit headers
         response["X-RateLimit-Limit"] = str(self.RATE_LIMIT)
-        response["X-RateLimit-Remaining"] = str(max(0, self.RATE_LIMIT - request_count - 1))
+        response["X-RateLimit-Remaining"] = str(max(0, self.RATE_LIMIT - request_count))
         
         return response
     
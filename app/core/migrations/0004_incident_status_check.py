@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-16 18:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_features_runbooks_tags_escalation'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='incident',
+            constraint=models.CheckConstraint(condition=models.Q(('status__in', ['TRIGGERED', 'ACKNOWLEDGED', 'MITIGATED', 'RESOLVED'])), name='incident_status_valid'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-16 18:33
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_incident_status_check'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='incident',
+            index=models.Index(condition=models.Q(('war_room_link__gt', '')), fields=['-created_at'], name='incident_has_war_room_idx'),
+        ),
+    ]
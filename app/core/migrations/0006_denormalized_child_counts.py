@@ -0,0 +1,53 @@
+# Generated by Django 5.2.18 on 2026-10-16 18:42
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_counts(apps, schema_editor):
+    """Populate the new counters from the existing child rows."""
+    targets = (
+        ("Runbook", "steps_count", "RunbookStep", "runbook"),
+        ("EscalationPolicy", "steps_count", "EscalationStep", "policy"),
+        ("Tag", "usage_count", "IncidentTag", "tag"),
+    )
+    for parent_name, counter, child_name, fk_name in targets:
+        parent = apps.get_model("core", parent_name)
+        child = apps.get_model("core", child_name)
+        counts = (
+            child.objects.filter(**{fk_name: OuterRef("pk")})
+            .order_by()
+            .values(fk_name)
+            .annotate(total=Count("pk"))
+            .values("total")
+        )
+        parent.objects.update(
+            **{counter: Coalesce(Subquery(counts, output_field=IntegerField()), 0)}
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_incident_has_war_room_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='escalationpolicy',
+            name='steps_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Number of steps (maintained by signals).'),
+        ),
+        migrations.AddField(
+            model_name='runbook',
+            name='steps_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Number of steps (maintained by signals).'),
+        ),
+        migrations.AddField(
+            model_name='tag',
+            name='usage_count',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Number of incidents tagged (maintained by signals).'),
+        ),
+        migrations.RunPython(backfill_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-16 18:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_denormalized_child_counts'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='alertfingerprint',
+            index=models.Index(fields=['-last_fired_at'], name='core_alertf_last_fi_75d8e2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='alertfingerprint',
+            index=models.Index(fields=['source', 'status', '-last_fired_at'], name='core_alertf_source_51d8bb_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['resource_type', '-timestamp'], name='core_auditl_resourc_53775c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='incidentescalation',
+            index=models.Index(fields=['-scheduled_at'], name='core_incide_schedul_7927fd_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='incidentescalation',
+            index=models.Index(fields=['status', '-scheduled_at'], name='core_incide_status_f94f68_idx'),
+        ),
+    ]
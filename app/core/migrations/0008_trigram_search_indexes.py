@@ -0,0 +1,42 @@
+from django.db import migrations
+
+# (model, index name, indexed expression). The expressions match the SQL
+# Django emits for icontains on PostgreSQL, so admin searches can use them.
+TRIGRAM_INDEXES = (
+    ("AuditLog", "auditlog_username_trgm", 'UPPER("username"::text)'),
+    ("AuditLog", "auditlog_resource_id_trgm", 'UPPER("resource_id"::text)'),
+    ("AuditLog", "auditlog_description_trgm", 'UPPER("description"::text)'),
+    ("AuditLog", "auditlog_ip_address_trgm", 'UPPER(HOST("ip_address"))'),
+    ("IncidentComment", "incidentcomment_content_trgm", 'UPPER("content"::text)'),
+)
+
+
+def create_trigram_indexes(apps, schema_editor):
+    """Create pg_trgm GIN indexes; other backends keep sequential search."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for model_name, index_name, expression in TRIGRAM_INDEXES:
+        table = apps.get_model("core", model_name)._meta.db_table
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS "{index_name}" ON "{table}" '
+            f"USING gin (({expression}) gin_trgm_ops)"
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for _, index_name, _ in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS "{index_name}"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_admin_list_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,29 @@
+from django.db import migrations
+
+
+def create_timestamp_brin(apps, schema_editor):
+    """Add a BRIN index for date-hierarchy range scans; PostgreSQL only."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    table = apps.get_model("core", "AuditLog")._meta.db_table
+    schema_editor.execute(
+        f'CREATE INDEX IF NOT EXISTS "auditlog_ts_brin" ON "{table}" '
+        f'USING brin ("timestamp") WITH (pages_per_range = 32)'
+    )
+
+
+def drop_timestamp_brin(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS "auditlog_ts_brin"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_trigram_search_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_timestamp_brin, drop_timestamp_brin),
+    ]
@@ -0,0 +1,41 @@
+import hashlib
+
+import orjson
+from django.db import migrations
+
+
+def _fingerprint(source, alert_name, labels):
+    # Frozen copy of AlertFingerprint.compute_fingerprint at this migration
+    digest = hashlib.sha256(source.encode())
+    digest.update(b"\x1f")
+    digest.update(alert_name.encode())
+    digest.update(b"\x1f")
+    digest.update(orjson.dumps(labels, option=orjson.OPT_SORT_KEYS))
+    return digest.hexdigest()
+
+
+def rekey_fingerprints(apps, schema_editor):
+    """Recompute stored fingerprints so open alerts keep deduplicating."""
+    AlertFingerprint = apps.get_model("core", "AlertFingerprint")
+    batch = []
+    for alert in AlertFingerprint.objects.only(
+        "id", "source", "alert_name", "labels"
+    ).iterator(chunk_size=2000):
+        alert.fingerprint = _fingerprint(alert.source, alert.alert_name, alert.labels)
+        batch.append(alert)
+        if len(batch) >= 2000:
+            AlertFingerprint.objects.bulk_update(batch, ["fingerprint"])
+            batch = []
+    if batch:
+        AlertFingerprint.objects.bulk_update(batch, ["fingerprint"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_auditlog_timestamp_brin'),
+    ]
+
+    operations = [
+        migrations.RunPython(rekey_fingerprints, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-16 18:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_rekey_alert_fingerprints'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='alertfingerprint',
+            index=models.Index(fields=['fingerprint'], include=('id', 'fire_count', 'status', 'incident', 'last_fired_at', 'auto_create_incident'), name='alertfp_fp_cover'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-16 18:59
+
+import core.ids
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_alertfingerprint_dedup_cover'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='alertfingerprint',
+            name='id',
+            field=models.UUIDField(default=core.ids.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='alertrule',
+            name='id',
+            field=models.UUIDField(default=core.ids.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
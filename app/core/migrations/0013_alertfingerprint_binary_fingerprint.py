@@ -0,0 +1,71 @@
+from django.db import migrations, models
+
+
+def hex_to_digest(apps, schema_editor):
+    AlertFingerprint = apps.get_model("core", "AlertFingerprint")
+    batch = []
+    for alert in AlertFingerprint.objects.only("id", "fingerprint").iterator(chunk_size=2000):
+        alert.fingerprint_digest = bytes.fromhex(alert.fingerprint)
+        batch.append(alert)
+        if len(batch) >= 2000:
+            AlertFingerprint.objects.bulk_update(batch, ["fingerprint_digest"])
+            batch = []
+    if batch:
+        AlertFingerprint.objects.bulk_update(batch, ["fingerprint_digest"])
+
+
+def digest_to_hex(apps, schema_editor):
+    AlertFingerprint = apps.get_model("core", "AlertFingerprint")
+    batch = []
+    for alert in AlertFingerprint.objects.only("id", "fingerprint_digest").iterator(chunk_size=2000):
+        alert.fingerprint = bytes(alert.fingerprint_digest).hex()
+        batch.append(alert)
+        if len(batch) >= 2000:
+            AlertFingerprint.objects.bulk_update(batch, ["fingerprint"])
+            batch = []
+    if batch:
+        AlertFingerprint.objects.bulk_update(batch, ["fingerprint"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0012_alert_uuid7_ids'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='alertfingerprint',
+            name='alertfp_fp_cover',
+        ),
+        # Nullable while both columns exist, so either direction can refill
+        migrations.AlterField(
+            model_name='alertfingerprint',
+            name='fingerprint',
+            field=models.CharField(max_length=64, null=True, unique=True),
+        ),
+        migrations.AddField(
+            model_name='alertfingerprint',
+            name='fingerprint_digest',
+            field=models.BinaryField(max_length=32, null=True),
+        ),
+        migrations.RunPython(hex_to_digest, digest_to_hex),
+        migrations.RemoveField(
+            model_name='alertfingerprint',
+            name='fingerprint',
+        ),
+        migrations.RenameField(
+            model_name='alertfingerprint',
+            old_name='fingerprint_digest',
+            new_name='fingerprint',
+        ),
+        migrations.AlterField(
+            model_name='alertfingerprint',
+            name='fingerprint',
+            field=models.BinaryField(help_text='Raw SHA256 digest of the alert identity, for deduplication', max_length=32, unique=True),
+        ),
+        migrations.AddIndex(
+            model_name='alertfingerprint',
+            index=models.Index(fields=['fingerprint'], include=('id', 'fire_count', 'status', 'incident', 'last_fired_at', 'auto_create_incident'), name='alertfp_fp_cover'),
+        ),
+    ]
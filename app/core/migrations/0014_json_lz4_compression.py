@@ -0,0 +1,56 @@
+from django.db import migrations
+
+# (model, column) pairs holding free-form JSON documents. All JSONFields are
+# already jsonb on PostgreSQL; large values are TOASTed, so switching the
+# TOAST codec to lz4 makes those reads and writes cheaper.
+JSON_COLUMNS = (
+    ("AuditLog", "changes"),
+    ("IncidentComment", "metadata"),
+    ("NotificationProvider", "config"),
+    ("Runbook", "quick_actions"),
+    ("Runbook", "external_docs"),
+    ("EscalationStep", "notification_channels"),
+    ("IncidentEscalation", "channels_used"),
+)
+
+
+def _supports_lz4(schema_editor) -> bool:
+    """lz4 TOAST compression needs PostgreSQL 14+ built with lz4."""
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_settings WHERE name = 'default_toast_compression' "
+            "AND 'lz4' = ANY(enumvals)"
+        )
+        return cursor.fetchone() is not None
+
+
+def _set_compression(apps, schema_editor, method):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    if not _supports_lz4(schema_editor):
+        return
+    for model_name, column in JSON_COLUMNS:
+        table = apps.get_model("core", model_name)._meta.db_table
+        schema_editor.execute(
+            f'ALTER TABLE "{table}" ALTER COLUMN "{column}" SET COMPRESSION {method}'
+        )
+
+
+def use_lz4(apps, schema_editor):
+    """Compress new JSON values with lz4; existing rows are left as stored."""
+    _set_compression(apps, schema_editor, "lz4")
+
+
+def use_default(apps, schema_editor):
+    _set_compression(apps, schema_editor, "default")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0013_alertfingerprint_binary_fingerprint'),
+    ]
+
+    operations = [
+        migrations.RunPython(use_lz4, use_default),
+    ]
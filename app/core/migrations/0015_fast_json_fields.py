@@ -0,0 +1,49 @@
+# Generated by Django 5.2.18 on 2026-10-16 19:04
+
+import core.fields
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0014_json_lz4_compression'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='auditlog',
+            name='changes',
+            field=core.fields.FastJSONField(blank=True, default=dict),
+        ),
+        migrations.AlterField(
+            model_name='escalationstep',
+            name='notification_channels',
+            field=core.fields.FastJSONField(default=list, help_text="Channels to use: ['slack', 'email', 'sms', 'phone']"),
+        ),
+        migrations.AlterField(
+            model_name='incidentcomment',
+            name='metadata',
+            field=core.fields.FastJSONField(blank=True, default=dict, help_text='Additional metadata for the comment.'),
+        ),
+        migrations.AlterField(
+            model_name='incidentescalation',
+            name='channels_used',
+            field=core.fields.FastJSONField(default=list, help_text='Notification channels that were used.'),
+        ),
+        migrations.AlterField(
+            model_name='notificationprovider',
+            name='config',
+            field=core.fields.FastJSONField(default=dict, help_text='Provider-specific configuration (tokens, webhooks, etc.). Stored as JSON.'),
+        ),
+        migrations.AlterField(
+            model_name='runbook',
+            name='external_docs',
+            field=core.fields.FastJSONField(blank=True, default=list, help_text='List of external documentation links.'),
+        ),
+        migrations.AlterField(
+            model_name='runbook',
+            name='quick_actions',
+            field=core.fields.FastJSONField(blank=True, default=list, help_text='List of quick action buttons with commands.'),
+        ),
+    ]
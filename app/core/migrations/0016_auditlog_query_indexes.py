@@ -0,0 +1,63 @@
+# Generated by Django 5.2.18 on 2026-10-16 19:07
+
+from django.conf import settings
+from django.db import migrations, models
+
+OLD_RESOURCE_INDEX = models.Index(
+    fields=['resource_type', 'resource_id'], name='core_auditl_resourc_a674ad_idx',
+)
+NEW_INDEXES = (
+    models.Index(fields=['action', 'user', '-timestamp'], name='audit_action_user_ts'),
+    models.Index(fields=['resource_type', 'resource_id', '-timestamp'], name='audit_resource_ts'),
+    models.Index(condition=models.Q(('success', False)), fields=['-timestamp'], name='audit_failed_ts'),
+)
+
+
+def _index_kwargs(schema_editor):
+    # Build without blocking audit writes on large PostgreSQL tables
+    if schema_editor.connection.vendor == "postgresql":
+        return {"concurrently": True}
+    return {}
+
+
+def add_query_indexes(apps, schema_editor):
+    model = apps.get_model("core", "AuditLog")
+    kwargs = _index_kwargs(schema_editor)
+    for index in NEW_INDEXES:
+        schema_editor.add_index(model, index, **kwargs)
+    # Superseded by audit_resource_ts, which has the same leading columns
+    schema_editor.remove_index(model, OLD_RESOURCE_INDEX, **kwargs)
+
+
+def remove_query_indexes(apps, schema_editor):
+    model = apps.get_model("core", "AuditLog")
+    kwargs = _index_kwargs(schema_editor)
+    schema_editor.add_index(model, OLD_RESOURCE_INDEX, **kwargs)
+    for index in NEW_INDEXES:
+        schema_editor.remove_index(model, index, **kwargs)
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    atomic = False
+
+    dependencies = [
+        ('core', '0015_fast_json_fields'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.RemoveIndex(
+                    model_name='auditlog',
+                    name='core_auditl_resourc_a674ad_idx',
+                ),
+                *(migrations.AddIndex(model_name='auditlog', index=index) for index in NEW_INDEXES),
+            ],
+            database_operations=[
+                migrations.RunPython(add_query_indexes, remove_query_indexes),
+            ],
+        ),
+    ]
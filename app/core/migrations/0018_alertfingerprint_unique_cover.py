@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-16 19:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0017_uuid7_primary_keys'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='alertfingerprint',
+            name='alertfp_fp_cover',
+        ),
+        migrations.AlterField(
+            model_name='alertfingerprint',
+            name='fingerprint',
+            field=models.BinaryField(help_text='Raw SHA256 digest of the alert identity, for deduplication', max_length=32),
+        ),
+        migrations.AddConstraint(
+            model_name='alertfingerprint',
+            constraint=models.UniqueConstraint(fields=('fingerprint',), include=('id', 'fire_count', 'status', 'incident', 'last_fired_at', 'auto_create_incident'), name='alertfp_fp_unique_cover'),
+        ),
+    ]
@@ -6,13 +6,19 @@ Models for alert ingestion, deduplication, and auto-incident creation.
 from __future__ import annotations
 
 import hashlib
-import uuid
 from typing import TYPE_CHECKING
 
+import orjson
 from django.db import models
+from django.db.models import F
 from django.utils import timezone
 
+from core.ids import uuid7
+from core.patterns import compile_pattern
+
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from core.models import Incident, Service
 
 
@@ -31,6 +37,12 @@ class AlertStatus(models.TextChoices):
     SUPPRESSED = "SUPPRESSED", "Suppressed"
 
 
+# Columns read when deduplicating an incoming alert by fingerprint
+DEDUP_FIELDS = (
+    "id", "fire_count", "status", "incident", "last_fired_at", "auto_create_incident",
+)
+
+
 class AlertFingerprint(models.Model):
     """
     Tracks unique alerts for deduplication.
@@ -38,14 +50,12 @@ class AlertFingerprint(models.Model):
     The fingerprint is a hash of key alert labels to identify
     the same alert across multiple firings.
     """
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     
     # Alert identification
-    fingerprint = models.CharField(
-        max_length=64,
-        unique=True,
-        db_index=True,
-        help_text="SHA256 hash of alert labels for deduplication"
+    fingerprint = models.BinaryField(
+        max_length=32,
+        help_text="Raw SHA256 digest of the alert identity, for deduplication"
     )
     source = models.CharField(
         max_length=20,
@@ -94,35 +104,57 @@ class AlertFingerprint(models.Model):
         indexes = [
             models.Index(fields=["source", "alert_name"]),
             models.Index(fields=["status", "last_fired_at"]),
+            models.Index(fields=["-last_fired_at"]),
+            models.Index(fields=["source", "status", "-last_fired_at"]),
+        ]
+        constraints = [
+            # One unique index that also covers the ingestion dedup lookup.
+            # PostgreSQL only: backends without INCLUDE skip the constraint.
+            models.UniqueConstraint(
+                fields=["fingerprint"],
+                include=DEDUP_FIELDS,
+                name="alertfp_fp_unique_cover",
+            ),
         ]
 
     def __str__(self) -> str:
-        return f"{self.alert_name} ({self.fingerprint[:8]})"
+        return f"{self.alert_name} ({self.fingerprint_hex[:8]})"
+
+    @property
+    def fingerprint_hex(self) -> str:
+        """Hex form of the fingerprint, as shown in the admin and API."""
+        return self.fingerprint.hex()
 
     @classmethod
     def compute_fingerprint(
         cls,
         alert_name: str,
-        labels: dict,
+        labels: Mapping,
         source: str = "CUSTOM",
-    ) -> str:
+    ) -> bytes:
         """
         Compute a unique fingerprint for an alert.
         
-        Uses alert name + sorted labels to create a stable hash.
+        Hashes source, alert name and the labels as key-sorted JSON, fed
+        to SHA256 piecewise so no combined string is built. The raw digest
+        is what the fingerprint BinaryField stores; use .hex() to display it.
         
         Args:
             alert_name: Name of the alert.
-            labels: Dict of alert labels.
+            labels: Mapping of alert labels (e.g. a ChainMap of alert
+                and common labels).
             source: Alert source type.
             
         Returns:
-            SHA256 hex digest.
+            Raw 32-byte SHA256 digest.
         """
-        # Sort labels for stable hashing
-        sorted_labels = sorted(labels.items())
-        fingerprint_data = f"{source}:{alert_name}:{sorted_labels}"
-        return hashlib.sha256(fingerprint_data.encode()).hexdigest()
+        digest = hashlib.sha256(source.encode())
+        digest.update(b"\x1f")
+        digest.update(alert_name.encode())
+        digest.update(b"\x1f")
+        # orjson only serializes real dicts, not other Mapping types
+        digest.update(orjson.dumps(dict(labels), option=orjson.OPT_SORT_KEYS))
+        return digest.digest()
 
     def mark_resolved(self) -> None:
         """Mark this alert as resolved."""
@@ -131,12 +163,23 @@ class AlertFingerprint(models.Model):
         self.save(update_fields=["status", "resolved_at"])
 
     def increment_fire_count(self) -> None:
-        """Increment fire count and update timestamp."""
+        """
+        Increment fire count and update timestamp.
+        
+        The counter is incremented in SQL so concurrent firings of a
+        flapping alert are all counted; the instance mirrors the change.
+        """
+        now = timezone.now()
+        AlertFingerprint.objects.filter(pk=self.pk).update(
+            fire_count=F("fire_count") + 1,
+            last_fired_at=now,
+            status=AlertStatus.FIRING,
+            resolved_at=None,
+        )
         self.fire_count += 1
-        self.last_fired_at = timezone.now()
+        self.last_fired_at = now
         self.status = AlertStatus.FIRING
         self.resolved_at = None
-        self.save(update_fields=["fire_count", "last_fired_at", "status", "resolved_at"])
 
 
 class AlertRule(models.Model):
@@ -145,7 +188,7 @@ class AlertRule(models.Model):
     
     Allows configuring how incoming alerts should create incidents.
     """
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     
     name = models.CharField(max_length=255)
     description = models.TextField(blank=True)
@@ -222,15 +265,13 @@ class AlertRule(models.Model):
         Returns:
             True if rule matches.
         """
-        import re
-        
         # Check source
         if self.source and self.source != source:
             return False
         
         # Check alert name pattern
         if self.alert_name_pattern:
-            if not re.match(self.alert_name_pattern, alert_name, re.IGNORECASE):
+            if not compile_pattern(self.alert_name_pattern).match(alert_name):
                 return False
         
         # Check label matchers
@@ -5,10 +5,12 @@ Tracks all security-relevant actions in the system.
 """
 from __future__ import annotations
 
-import uuid
 from django.conf import settings
 from django.db import models
 
+from core.fields import FastJSONField
+from core.ids import uuid7
+
 
 class AuditAction(models.TextChoices):
     """Types of audited actions."""
@@ -53,7 +55,7 @@ class AuditLog(models.Model):
     
     Captures who did what, when, from where, and what changed.
     """
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     
     # When
     timestamp = models.DateTimeField(auto_now_add=True, db_index=True)
@@ -75,7 +77,7 @@ class AuditLog(models.Model):
     
     # Details
     description = models.TextField(blank=True)
-    changes = models.JSONField(default=dict, blank=True)  # Before/after for updates
+    changes = FastJSONField(default=dict, blank=True)  # Before/after for updates
     
     # Where (request metadata)
     ip_address = models.GenericIPAddressField(null=True, blank=True)
@@ -92,8 +94,19 @@ class AuditLog(models.Model):
         indexes = [
             models.Index(fields=["user", "-timestamp"]),
             models.Index(fields=["action", "-timestamp"]),
-            models.Index(fields=["resource_type", "resource_id"]),
+            models.Index(fields=["action", "user", "-timestamp"], name="audit_action_user_ts"),
+            models.Index(
+                fields=["resource_type", "resource_id", "-timestamp"],
+                name="audit_resource_ts",
+            ),
+            models.Index(fields=["resource_type", "-timestamp"]),
             models.Index(fields=["-timestamp"]),
+            # Failures are a small slice that the admin filters on
+            models.Index(
+                fields=["-timestamp"],
+                condition=models.Q(success=False),
+                name="audit_failed_ts",
+            ),
         ]
         verbose_name = "Audit Log"
         verbose_name_plural = "Audit Logs"
@@ -116,7 +129,62 @@ class AuditLog(models.Model):
         error_message: str = "",
     ) -> "AuditLog":
         """
-        Create an audit log entry.
+        Create and save an audit log entry.
+        
+        Takes the same arguments as build().
+        
+        Returns:
+            Created AuditLog instance
+        """
+        log_entry = cls.build(
+            action=action,
+            user=user,
+            request=request,
+            resource_type=resource_type,
+            resource_id=resource_id,
+            description=description,
+            changes=changes,
+            success=success,
+            error_message=error_message,
+        )
+        log_entry.save()
+        return log_entry
+
+    @classmethod
+    def log_async(cls, action: str, **kwargs) -> None:
+        """
+        Queue an audit log entry for the background writer.
+        
+        Takes the same arguments as build(). Use this on request paths
+        where the caller does not need the saved instance.
+        """
+        from core.audit import enqueue
+        
+        log_entry = cls.build(action=action, **kwargs)
+        # Keep only user_id so the queued entry does not pin the request user
+        user_field = cls._meta.get_field("user")
+        if user_field.is_cached(log_entry):
+            user_field.delete_cached_value(log_entry)
+        enqueue(log_entry)
+
+    @classmethod
+    def build(
+        cls,
+        action: str,
+        user=None,
+        request=None,
+        resource_type: str = "",
+        resource_id: str = "",
+        description: str = "",
+        changes: dict = None,
+        success: bool = True,
+        error_message: str = "",
+    ) -> "AuditLog":
+        """
+        Build an unsaved audit log entry.
+        
+        Request metadata is copied onto the entry here, so it can be saved
+        later from another thread.
         
         Args:
             action: AuditAction value
@@ -130,7 +198,7 @@ class AuditLog(models.Model):
             error_message: Error message if failed
         
         Returns:
-            Created AuditLog instance
+            Unsaved AuditLog instance
         """
         log_entry = cls(
             action=action,
@@ -159,7 +227,6 @@ class AuditLog(models.Model):
                 log_entry.user = request.user
                 log_entry.username = request.user.username
         
-        log_entry.save()
         return log_entry
 
     @staticmethod
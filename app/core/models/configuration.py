@@ -5,11 +5,11 @@ Contains NotificationProvider model for dynamic notification configuration.
 """
 from __future__ import annotations
 
-import uuid
-
 from django.db import models
 
 from core.choices import NotificationProviderType
+from core.fields import FastJSONField
+from core.ids import uuid7
 
 
 class NotificationProvider(models.Model):
@@ -27,7 +27,7 @@ class NotificationProvider(models.Model):
     
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
     )
     name = models.CharField(
@@ -40,7 +40,7 @@ class NotificationProvider(models.Model):
         db_index=True,
         help_text="Type of notification provider.",
     )
-    config = models.JSONField(
+    config = FastJSONField(
         default=dict,
         help_text="Provider-specific configuration (tokens, webhooks, etc.). Stored as JSON.",
     )
@@ -5,7 +5,6 @@ Contains Runbook, IncidentComment, IncidentTag, and EscalationPolicy models.
 """
 from __future__ import annotations
 
-import uuid
 from datetime import timedelta
 from typing import TYPE_CHECKING
 
@@ -13,6 +12,9 @@ from django.conf import settings
 from django.db import models
 from django.utils import timezone
 
+from core.fields import FastJSONField
+from core.ids import uuid7
+
 if TYPE_CHECKING:
     from django.contrib.auth.models import User
 
@@ -32,7 +34,7 @@ class RunbookStep(models.Model):
     
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
     )
     runbook = models.ForeignKey(
@@ -90,7 +92,7 @@ class Runbook(models.Model):
     
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
     )
     name = models.CharField(
@@ -128,12 +130,12 @@ class Runbook(models.Model):
     )
     
     # Content
-    quick_actions = models.JSONField(
+    quick_actions = FastJSONField(
         default=list,
         blank=True,
         help_text="List of quick action buttons with commands.",
     )
-    external_docs = models.JSONField(
+    external_docs = FastJSONField(
         default=list,
         blank=True,
         help_text="List of external documentation links.",
@@ -165,6 +167,11 @@ class Runbook(models.Model):
         default=0,
         help_text="Number of times this runbook has been used.",
     )
+    steps_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Number of steps (maintained by signals).",
+    )
     
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
@@ -206,35 +213,41 @@ class Runbook(models.Model):
         3. Alert pattern match (global)
         4. None
         """
-        import re
+        from core.patterns import first_match
         
         # Get alert name from incident (usually in title or description)
         alert_name = incident.title
         
         # Try service + pattern match
-        if incident.service:
-            runbooks = cls.objects.filter(
-                service=incident.service,
+        if incident.service_id:
+            runbooks = list(cls.objects.filter(
+                service_id=incident.service_id,
                 is_active=True,
-            )
+            ).select_related("service", "author"))
+            # A runbook without a pattern matches anything, so only the
+            # patterns ordered before the first such runbook are tried
+            patterns = []
             for rb in runbooks:
-                if rb.alert_pattern:
-                    if re.search(rb.alert_pattern, alert_name, re.IGNORECASE):
-                        return rb
-                elif not rb.alert_pattern:
-                    # Service-specific runbook without pattern
-                    return rb
+                if not rb.alert_pattern:
+                    break
+                patterns.append(rb.alert_pattern)
+            index = first_match(patterns, alert_name)
+            if index is not None:
+                return runbooks[index]
+            if len(patterns) < len(runbooks):
+                # Service-specific runbook without pattern
+                return runbooks[len(patterns)]
         
         # Try global pattern match
-        global_runbooks = cls.objects.filter(
+        global_runbooks = list(cls.objects.filter(
             service__isnull=True,
             alert_pattern__isnull=False,
             is_active=True,
-        ).exclude(alert_pattern="")
+        ).exclude(alert_pattern="").select_related("author"))
         
-        for rb in global_runbooks:
-            if re.search(rb.alert_pattern, alert_name, re.IGNORECASE):
-                return rb
+        index = first_match([rb.alert_pattern for rb in global_runbooks], alert_name)
+        if index is not None:
+            return global_runbooks[index]
         
         return None
 
@@ -263,7 +276,7 @@ class IncidentComment(models.Model):
     
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
     )
     incident: models.ForeignKey["Incident"] = models.ForeignKey(
@@ -301,7 +314,7 @@ class IncidentComment(models.Model):
         blank=True,
         help_text="Source system for automated comments (e.g., 'slack', 'pagerduty').",
     )
-    metadata = models.JSONField(
+    metadata = FastJSONField(
         default=dict,
         blank=True,
         help_text="Additional metadata for the comment.",
@@ -333,7 +346,7 @@ class Tag(models.Model):
     
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
     )
     name = models.CharField(
@@ -360,6 +373,11 @@ class Tag(models.Model):
         blank=True,
         help_text="Regex pattern to auto-apply this tag.",
     )
+    usage_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Number of incidents tagged (maintained by signals).",
+    )
     
     created_at = models.DateTimeField(auto_now_add=True)
 
@@ -379,7 +397,7 @@ class IncidentTag(models.Model):
     
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
     )
     incident: models.ForeignKey["Incident"] = models.ForeignKey(
@@ -425,7 +443,7 @@ class EscalationPolicy(models.Model):
     
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
     )
     name = models.CharField(
@@ -462,6 +480,11 @@ class EscalationPolicy(models.Model):
         default=3,
         help_text="Maximum number of escalation attempts.",
     )
+    steps_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Number of steps (maintained by signals).",
+    )
     
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
@@ -489,7 +512,7 @@ class EscalationStep(models.Model):
     
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
     )
     policy = models.ForeignKey(
@@ -516,7 +539,7 @@ class EscalationStep(models.Model):
         default=0,
         help_text="Additional delay before this step (added to policy delay).",
     )
-    notification_channels = models.JSONField(
+    notification_channels = FastJSONField(
         default=list,
         help_text="Channels to use: ['slack', 'email', 'sms', 'phone']",
     )
@@ -550,7 +573,7 @@ class IncidentEscalation(models.Model):
     
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
     )
     incident: models.ForeignKey["Incident"] = models.ForeignKey(
@@ -583,7 +606,7 @@ class IncidentEscalation(models.Model):
         blank=True,
         related_name="received_escalations",
     )
-    channels_used = models.JSONField(
+    channels_used = FastJSONField(
         default=list,
         help_text="Notification channels that were used.",
     )
@@ -610,6 +633,10 @@ class IncidentEscalation(models.Model):
         verbose_name = "Incident Escalation"
         verbose_name_plural = "Incident Escalations"
         ordering = ["incident", "escalation_number"]
+        indexes = [
+            models.Index(fields=["-scheduled_at"]),
+            models.Index(fields=["status", "-scheduled_at"]),
+        ]
 
     def __str__(self) -> str:
         return f"{self.incident.short_id} - Escalation #{self.escalation_number}"
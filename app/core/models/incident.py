@@ -13,6 +13,7 @@ from django.conf import settings
 from django.db import models
 
 from core.choices import IncidentEventType, IncidentSeverity, IncidentStatus
+from core.ids import uuid7
 
 if TYPE_CHECKING:
     from django.contrib.auth.models import User
@@ -143,6 +144,18 @@ class Incident(models.Model):
             models.Index(fields=["status", "severity"]),
             models.Index(fields=["service", "status"]),
             models.Index(fields=["-created_at"]),
+            # Partial index backing the admin "Has War Room" filter
+            models.Index(
+                fields=["-created_at"],
+                condition=models.Q(war_room_link__gt=""),
+                name="incident_has_war_room_idx",
+            ),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                condition=models.Q(status__in=IncidentStatus.values),
+                name="incident_status_valid",
+            ),
         ]
 
     def __str__(self) -> str:
@@ -242,7 +255,7 @@ class IncidentEvent(models.Model):
     
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
     )
     incident = models.ForeignKey(
@@ -5,7 +5,6 @@ Contains Team, Service, ImpactScope, and OnCallSchedule models.
 """
 from __future__ import annotations
 
-import uuid
 from datetime import timedelta
 from typing import TYPE_CHECKING
 
@@ -14,6 +13,7 @@ from django.db import models
 from django.utils import timezone
 
 from core.choices import ServiceCriticality
+from core.ids import uuid7
 
 if TYPE_CHECKING:
     from django.contrib.auth.models import User
@@ -28,7 +28,7 @@ class Team(models.Model):
     
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
         help_text="Unique identifier for the team.",
     )
@@ -134,7 +134,7 @@ class Service(models.Model):
     
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
         help_text="Unique identifier for the service.",
     )
@@ -204,7 +204,7 @@ class ImpactScope(models.Model):
     
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
         help_text="Unique identifier for the impact scope.",
     )
@@ -250,7 +250,7 @@ class OnCallSchedule(models.Model):
     
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
     )
     team = models.ForeignKey(
@@ -0,0 +1,104 @@
+"""
+IMAS Manager - Pattern Matching
+
+Process-wide cache of compiled user-editable regexes (tag auto-apply
+patterns, alert rule name patterns, runbook alert patterns).
+"""
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# Numbered or named backreferences change meaning once patterns are merged
+_BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=")
+
+
+@lru_cache(maxsize=1024)
+def compile_pattern(pattern: str, flags: int = re.IGNORECASE) -> re.Pattern:
+    """
+    Compile a regex once per process.
+    
+    Entries are keyed on the pattern text itself, so editing a pattern
+    simply yields a new entry and no invalidation is needed.
+    
+    Raises:
+        re.error: If the pattern is not a valid regular expression.
+    """
+    return re.compile(pattern, flags)
+
+
+@lru_cache(maxsize=256)
+def _compile_combined(patterns: tuple[str, ...], first_only: bool) -> re.Pattern | None:
+    """
+    Merge patterns into one regex matched at the start of the text.
+    
+    Each pattern becomes a lookahead that captures into group ``_p<i>``,
+    so one match reports which patterns occur anywhere in the text.
+    With first_only the lookaheads are alternatives tried in order;
+    otherwise each one is optional and all of them are evaluated.
+    
+    Returns None when the patterns cannot be merged safely, in which
+    case callers fall back to matching them one by one.
+    """
+    for pattern in patterns:
+        if _BACKREFERENCE.search(pattern):
+            return None
+        try:
+            compile_pattern(pattern)
+        except re.error:
+            return None
+    
+    parts = [rf"(?=[\s\S]*?(?P<_p{i}>{pattern}))" for i, pattern in enumerate(patterns)]
+    if first_only:
+        source = "|".join(parts)
+    else:
+        source = "".join(f"(?:{part}|)" for part in parts)
+    try:
+        return re.compile(source, re.IGNORECASE)
+    except re.error:
+        # e.g. clashing group names or inline global flags
+        return None
+
+
+def first_match(patterns: Sequence[str], text: str) -> int | None:
+    """
+    Return the index of the first pattern found in text, or None.
+    
+    Equivalent to searching each pattern in order, but done in a single
+    regex match when the patterns can be merged.
+    
+    Raises:
+        re.error: If a pattern is not a valid regular expression.
+    """
+    if not patterns:
+        return None
+    combined = _compile_combined(tuple(patterns), first_only=True)
+    if combined is None:
+        for i, pattern in enumerate(patterns):
+            if compile_pattern(pattern).search(text):
+                return i
+        return None
+    
+    match = combined.match(text)
+    return int(match.lastgroup[2:]) if match else None
+
+
+def all_matches(patterns: Sequence[str], text: str) -> list[int] | None:
+    """
+    Return the indexes of every pattern found in text.
+    
+    Returns None when the patterns cannot be merged into one regex, so
+    callers can match them individually and report invalid ones.
+    """
+    if not patterns:
+        return []
+    combined = _compile_combined(tuple(patterns), first_only=False)
+    if combined is None:
+        return None
+    
+    match = combined.match(text)
+    return [i for i in range(len(patterns)) if match.start(f"_p{i}") != -1]
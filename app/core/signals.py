@@ -1,17 +1,25 @@
 """
 IMAS Manager - Django Signals
 
-Handles automatic KPI timestamp updates and event logging.
+Handles automatic KPI timestamp updates, event logging, denormalized
+child counters and API token cache eviction.
 """
 from __future__ import annotations
 
 import logging
 
-from django.db.models.signals import post_save, pre_save
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F, Model
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 from django.utils import timezone
+from rest_framework.authtoken.models import Token
 
+from api.authentication import invalidate_cached_token, token_cache_key
+from core.cache import CacheManager
 from core.choices import IncidentEventType, IncidentStatus
+from core.models.features import EscalationStep, IncidentTag, RunbookStep
 from core.models.incident import Incident, IncidentEvent
 
 logger = logging.getLogger(__name__)
@@ -117,3 +125,94 @@ def log_status_change(
     # so we'll rely on explicit event creation in the service layer
     # for status changes after the initial creation.
     # This signal will be enhanced in Phase 2.
+
+
+@receiver(post_save, sender=Incident)
+@receiver(post_delete, sender=Incident)
+def invalidate_incident_stats(
+    sender: type[Incident],
+    instance: Incident,
+    update_fields: frozenset[str] | None = None,
+    **kwargs,
+) -> None:
+    """Drop cached incident counts and dashboard stats when they may change."""
+    if update_fields is not None and "status" not in update_fields:
+        return
+    CacheManager.invalidate_incident_counts()
+
+
+# Child model -> (foreign key to the parent, counter field on the parent)
+DENORMALIZED_COUNTERS: dict[type[Model], tuple[str, str]] = {
+    RunbookStep: ("runbook", "steps_count"),
+    EscalationStep: ("policy", "steps_count"),
+    IncidentTag: ("tag", "usage_count"),
+}
+
+
+def _adjust_parent_counter(instance: Model, delta: int) -> None:
+    """Apply delta to the parent's denormalized counter with an atomic UPDATE."""
+    fk_name, counter = DENORMALIZED_COUNTERS[type(instance)]
+    field = instance._meta.get_field(fk_name)
+    parent_id = getattr(instance, field.attname)
+    if parent_id is None:
+        return
+    
+    parents = field.related_model.objects.filter(pk=parent_id)
+    if delta < 0:
+        parents = parents.filter(**{f"{counter}__gte": -delta})
+    parents.update(**{counter: F(counter) + delta})
+    
+    # Keep an already-loaded parent in step so a later save() doesn't undo it
+    if field.is_cached(instance):
+        parent = field.get_cached_value(instance)
+        if parent is not None:
+            setattr(parent, counter, max(getattr(parent, counter) + delta, 0))
+
+
+@receiver(post_save, sender=RunbookStep)
+@receiver(post_save, sender=EscalationStep)
+@receiver(post_save, sender=IncidentTag)
+def increment_parent_counter(
+    sender: type[Model],
+    instance: Model,
+    created: bool,
+    raw: bool = False,
+    **kwargs,
+) -> None:
+    """Count a newly created child row on its parent."""
+    if created and not raw:
+        _adjust_parent_counter(instance, 1)
+
+
+@receiver(post_delete, sender=RunbookStep)
+@receiver(post_delete, sender=EscalationStep)
+@receiver(post_delete, sender=IncidentTag)
+def decrement_parent_counter(
+    sender: type[Model],
+    instance: Model,
+    **kwargs,
+) -> None:
+    """Uncount a deleted child row on its parent."""
+    _adjust_parent_counter(instance, -1)
+
+
+@receiver(post_save, sender=Token)
+@receiver(post_delete, sender=Token)
+def evict_cached_token(sender: type[Token], instance: Token, **kwargs) -> None:
+    """Drop a changed or revoked token from the authentication cache."""
+    invalidate_cached_token(instance.key)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def evict_cached_user_tokens(
+    sender: type[Model],
+    instance: Model,
+    update_fields: frozenset[str] | None = None,
+    **kwargs,
+) -> None:
+    """Drop a user's cached tokens so deactivation takes effect immediately."""
+    if update_fields is not None and update_fields <= {"last_login"}:
+        return
+    keys = Token.objects.filter(user_id=instance.pk).values_list("key", flat=True)
+    cache.delete_many([token_cache_key(key) for key in keys])
@@ -260,6 +260,25 @@ def cleanup_old_comments(days: int = 365):
     return {"deleted": deleted}
 
 
+# =============================================================================
+# Cache Tasks
+# =============================================================================
+
+
+@shared_task(name="tasks.refresh_admin_dashboard")
+def refresh_admin_dashboard():
+    """
+    Recompute the cached admin dashboard statistics.
+    
+    Scheduled by the admin dashboard when it serves a stale cache entry.
+    """
+    from core.admin import refresh_admin_dashboard_stats
+    
+    stats = refresh_admin_dashboard_stats()
+    logger.info("Admin dashboard statistics refreshed")
+    return {"active_count": stats["active_count"]}
+
+
 # =============================================================================
 # Celery Beat Schedule
 # =============================================================================
@@ -27,7 +27,7 @@ from django.views.generic import (
 
 from core.choices import IncidentSeverity, IncidentStatus
 from core.models import Incident, IncidentEvent, Service, Team
-from services.orchestrator import orchestrator
+from services.orchestrator import InvalidTransitionError, orchestrator
 
 from .forms import IncidentCreateForm, IncidentNoteForm, IncidentResolveForm
 
@@ -295,11 +295,12 @@ class IncidentAcknowledgeView(LoginRequiredMixin, View):
     def post(self, request: HttpRequest, pk: str) -> HttpResponse:
         incident = get_object_or_404(Incident, pk=pk)
 
-        if incident.status != IncidentStatus.TRIGGERED:
+        try:
+            orchestrator.acknowledge_incident(incident, user=request.user)
+        except InvalidTransitionError:
             messages.warning(request, "Cet incident ne peut pas être acquitté.")
             return redirect("dashboard:incident_detail", pk=pk)
 
-        orchestrator.acknowledge_incident(incident, user=request.user)
         messages.success(request, f"Incident {incident.short_id} acquitté.")
 
         return redirect("dashboard:incident_detail", pk=pk)
@@ -321,11 +322,15 @@ class IncidentResolveView(LoginRequiredMixin, FormView):
     def form_valid(self, form: IncidentResolveForm) -> HttpResponse:
         incident = get_object_or_404(Incident, pk=self.kwargs["pk"])
 
-        orchestrator.resolve_incident(
-            incident,
-            user=self.request.user,
-            resolution_note=form.cleaned_data.get("resolution_note", ""),
-        )
+        try:
+            orchestrator.resolve_incident(
+                incident,
+                user=self.request.user,
+                resolution_note=form.cleaned_data.get("resolution_note", ""),
+            )
+        except InvalidTransitionError:
+            messages.warning(self.request, "Cet incident est déjà résolu.")
+            return redirect("dashboard:incident_detail", pk=incident.pk)
 
         messages.success(self.request, f"Incident {incident.short_id} résolu.")
         return redirect("dashboard:incident_detail", pk=incident.pk)
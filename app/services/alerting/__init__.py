@@ -15,6 +15,8 @@ from django.db import transaction
 from django.utils import timezone
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from core.models import AlertFingerprint, AlertRule, Incident, Service
 
 logger = logging.getLogger(__name__)
@@ -26,8 +28,8 @@ class AlertPayload:
     source: str
     alert_name: str
     status: str  # "firing" or "resolved"
-    labels: dict
-    annotations: dict
+    labels: Mapping
+    annotations: Mapping
     starts_at: str | None = None
     ends_at: str | None = None
     generator_url: str | None = None
@@ -84,6 +86,7 @@ class AlertIngestionService:
             Dict with processing result.
         """
         from core.models import AlertFingerprint, AlertSource, AlertStatus
+        from core.models.alerting import DEDUP_FIELDS
         
         # Compute fingerprint
         fingerprint = AlertFingerprint.compute_fingerprint(
@@ -92,8 +95,12 @@ class AlertIngestionService:
             source=payload.source,
         )
         
-        # Check for existing fingerprint
-        existing = AlertFingerprint.objects.filter(fingerprint=fingerprint).first()
+        # Check for existing fingerprint (answered from the covering index)
+        existing = (
+            AlertFingerprint.objects.only("fingerprint", *DEDUP_FIELDS)
+            .filter(fingerprint=fingerprint)
+            .first()
+        )
         
         if payload.status.lower() == "resolved":
             return self._handle_resolved(existing, payload, fingerprint)
@@ -104,7 +111,7 @@ class AlertIngestionService:
         self,
         existing: "AlertFingerprint | None",
         payload: AlertPayload,
-        fingerprint: str,
+        fingerprint: bytes,
     ) -> dict:
         """Handle a firing alert."""
         from core.models import AlertFingerprint, AlertStatus
@@ -115,7 +122,7 @@ class AlertIngestionService:
                 logger.info(f"Alert {payload.alert_name} suppressed (duplicate)")
                 return {
                     "action": "suppressed",
-                    "fingerprint": fingerprint,
+                    "fingerprint": fingerprint.hex(),
                     "incident_id": str(existing.incident_id) if existing.incident else None,
                 }
             
@@ -129,8 +136,9 @@ class AlertIngestionService:
                 fingerprint=fingerprint,
                 source=payload.source,
                 alert_name=payload.alert_name,
-                labels=payload.labels,
-                annotations=payload.annotations,
+                # Materialize layered mappings (e.g. ChainMap) for JSON storage
+                labels=dict(payload.labels),
+                annotations=dict(payload.annotations),
                 status=AlertStatus.FIRING,
             )
             is_new = True
@@ -145,7 +153,7 @@ class AlertIngestionService:
         
         return {
             "action": "created" if is_new else "updated",
-            "fingerprint": fingerprint,
+            "fingerprint": fingerprint.hex(),
             "fire_count": alert_fp.fire_count,
             "incident_id": str(incident.id) if incident else None,
             "incident_short_id": incident.short_id if incident else None,
@@ -155,7 +163,7 @@ class AlertIngestionService:
         self,
         existing: "AlertFingerprint | None",
         payload: AlertPayload,
-        fingerprint: str,
+        fingerprint: bytes,
     ) -> dict:
         """Handle a resolved alert."""
         if not existing:
@@ -163,7 +171,7 @@ class AlertIngestionService:
             return {
                 "action": "ignored",
                 "reason": "no_matching_alert",
-                "fingerprint": fingerprint,
+                "fingerprint": fingerprint.hex(),
             }
         
         existing.mark_resolved()
@@ -176,7 +184,7 @@ class AlertIngestionService:
         
         return {
             "action": "resolved",
-            "fingerprint": fingerprint,
+            "fingerprint": fingerprint.hex(),
             "incident_id": str(existing.incident_id) if existing.incident else None,
         }
 
@@ -11,7 +11,9 @@ from typing import TYPE_CHECKING, Any
 
 from django.contrib.auth import get_user_model
 from django.db import transaction
+from django.utils import timezone
 
+from core.cache import CacheManager
 from core.choices import IncidentStatus
 from core.models import Incident, IncidentEvent, Service
 
@@ -22,6 +24,10 @@ logger = logging.getLogger(__name__)
 User = get_user_model()
 
 
+class InvalidTransitionError(ValueError):
+    """Raised when an incident is not in a status that allows the transition."""
+
+
 class IncidentOrchestrator:
     """
     Orchestrates incident creation and lifecycle management.
@@ -113,21 +119,41 @@ class IncidentOrchestrator:
         """
         Acknowledge an incident.
         
+        The transition is applied with a single conditional UPDATE so the
+        database, not a prior read, decides whether the incident is still
+        TRIGGERED.
+        
         Args:
             incident: The incident to acknowledge.
             user: The user acknowledging.
             
         Returns:
             Updated incident.
+            
+        Raises:
+            InvalidTransitionError: If the incident is no longer TRIGGERED.
         """
-        if incident.status != IncidentStatus.TRIGGERED:
+        values: dict[str, Any] = {
+            "status": IncidentStatus.ACKNOWLEDGED,
+            "acknowledged_at": incident.acknowledged_at or timezone.now(),
+        }
+        if user and not incident.lead_id:
+            values["lead"] = user
+        
+        updated = Incident.objects.filter(
+            pk=incident.pk,
+            status=IncidentStatus.TRIGGERED,
+        ).update(**values)
+        if not updated:
             logger.warning(f"Incident {incident.short_id} is not in TRIGGERED status")
-            return incident
+            raise InvalidTransitionError(
+                f"Cannot acknowledge incident {incident.short_id}: not in TRIGGERED status"
+            )
         
-        incident.status = IncidentStatus.ACKNOWLEDGED
-        if user and not incident.lead:
-            incident.lead = user
-        incident.save()
+        for field, value in values.items():
+            setattr(incident, field, value)
+        # update() sends no post_save, so drop the cached counts here
+        transaction.on_commit(CacheManager.invalidate_incident_counts)
         
         # Create event
         IncidentEvent.objects.create(
@@ -156,9 +182,29 @@ class IncidentOrchestrator:
             
         Returns:
             Updated incident.
+            
+        Raises:
+            InvalidTransitionError: If the incident is already resolved.
         """
-        incident.status = IncidentStatus.RESOLVED
-        incident.save()
+        values: dict[str, Any] = {
+            "status": IncidentStatus.RESOLVED,
+            "resolved_at": incident.resolved_at or timezone.now(),
+        }
+        
+        updated = (
+            Incident.objects.filter(pk=incident.pk)
+            .exclude(status=IncidentStatus.RESOLVED)
+            .update(**values)
+        )
+        if not updated:
+            logger.warning(f"Incident {incident.short_id} is already resolved")
+            raise InvalidTransitionError(
+                f"Cannot resolve incident {incident.short_id}: already resolved"
+            )
+        
+        for field, value in values.items():
+            setattr(incident, field, value)
+        transaction.on_commit(CacheManager.invalidate_incident_counts)
         
         message = f"Incident resolved by {user.username if user else 'system'}"
         if resolution_note:
@@ -235,12 +235,12 @@ class RunbookAutoAttacher:
                 content=f"**📚 Runbook Attached: {runbook.name}**\n\n"
                         f"{runbook.description or ''}\n\n"
                         f"**Steps:**\n{steps_preview}\n\n"
-                        f"{'...(more steps)' if steps.count() > 5 else ''}",
+                        f"{'...(more steps)' if runbook.steps_count > 5 else ''}",
                 is_pinned=True,
                 metadata={
                     "runbook_id": str(runbook.id),
                     "runbook_name": runbook.name,
-                    "steps_count": steps.count(),
+                    "steps_count": runbook.steps_count,
                 }
             )
             
@@ -303,9 +303,10 @@ class TagService:
         """
         import re
         from core.models import IncidentTag, Tag
+        from core.patterns import all_matches, compile_pattern
         
         applied = []
-        tags = Tag.objects.filter(is_active=True).exclude(auto_apply_pattern="")
+        tags = list(Tag.objects.filter(is_active=True).exclude(auto_apply_pattern=""))
         
         # Build search text from incident
         search_text = " ".join([
@@ -315,23 +316,28 @@ class TagService:
             incident.severity or "",
         ]).lower()
         
-        for tag in tags:
-            if not tag.auto_apply_pattern:
-                continue
-            
-            try:
-                if re.search(tag.auto_apply_pattern, search_text, re.IGNORECASE):
-                    # Apply tag if not already applied
-                    _, created = IncidentTag.objects.get_or_create(
-                        incident=incident,
-                        tag=tag,
-                        defaults={"added_by": None, "is_auto_applied": True}
-                    )
-                    if created:
-                        applied.append(tag)
-                        logger.info(f"Auto-applied tag '{tag.name}' to incident {incident.id}")
-            except re.error as e:
-                logger.warning(f"Invalid regex pattern for tag {tag.name}: {e}")
+        indexes = all_matches([tag.auto_apply_pattern for tag in tags], search_text)
+        if indexes is None:
+            # Patterns could not be merged; match one by one to report bad ones
+            indexes = []
+            for i, tag in enumerate(tags):
+                try:
+                    if compile_pattern(tag.auto_apply_pattern).search(search_text):
+                        indexes.append(i)
+                except re.error as e:
+                    logger.warning(f"Invalid regex pattern for tag {tag.name}: {e}")
+        
+        for i in indexes:
+            tag = tags[i]
+            # Apply tag if not already applied
+            _, created = IncidentTag.objects.get_or_create(
+                incident=incident,
+                tag=tag,
+                defaults={"added_by": None, "is_auto_applied": True}
+            )
+            if created:
+                applied.append(tag)
+                logger.info(f"Auto-applied tag '{tag.name}' to incident {incident.id}")
         
         return applied
     
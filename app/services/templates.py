@@ -76,7 +76,7 @@ class NotificationContext:
         if self.runbook:
             data["runbook"] = {
                 "name": self.runbook.name,
-                "steps_count": self.runbook.steps.count(),
+                "steps_count": self.runbook.steps_count,
                 "quick_actions": self.runbook.quick_actions,
                 "external_docs": self.runbook.external_docs,
             }
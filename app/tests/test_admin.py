@@ -9,14 +9,22 @@ from unittest.mock import patch, MagicMock
 
 from django.contrib.admin.sites import AdminSite
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase, RequestFactory
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
 from core.admin import (
+    AlertFingerprintAdmin,
+    FasterAdminPaginator,
+    IMASUserAdmin,
     IncidentAdmin,
     TeamAdmin,
     ServiceAdmin,
     OnCallScheduleAdmin,
+    RunbookAdmin,
+    TagAdmin,
     ActiveIncidentFilter,
     SeverityCriticalFilter,
     RecentlyCreatedFilter,
@@ -24,7 +32,20 @@ from core.admin import (
     OnCallActiveFilter,
 )
 from core.choices import IncidentSeverity, IncidentStatus
-from core.models import Incident, Team, Service, OnCallSchedule
+from core.models import (
+    AlertFingerprint,
+    AlertStatus,
+    AuditLog,
+    EscalationPolicy,
+    EscalationStep,
+    Incident,
+    OnCallSchedule,
+    Runbook,
+    RunbookStep,
+    Service,
+    Tag,
+    Team,
+)
 
 
 User = get_user_model()
@@ -152,6 +173,37 @@ class TestIncidentAdminFilters(AdminTestMixin, TestCase):
         self.assertEqual(filtered.count(), 1)
         self.assertEqual(filtered.first().id, with_war_room.id)
 
+    def test_service_name_filter_renders_without_service_choices(self):
+        """Test the service filter is a text box matching by name."""
+        other_service = Service.objects.create(name="Billing", owner_team=self.team)
+        Incident.objects.create(title="Gateway down", service=self.service)
+        Incident.objects.create(title="Billing down", service=other_service)
+        self.client.force_login(self.admin_user)
+        
+        response = self.client.get(
+            "/admin/core/incident/", {"service_name": "gateway", "o": "1"}
+        )
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["cl"].result_count, 1)
+        self.assertContains(response, 'name="service_name" value="gateway"')
+        self.assertContains(response, '<input type="hidden" name="o" value="1">')
+
+    def test_condition_filters_applied_on_changelist(self):
+        """Test the Q-mapped filters narrow the changelist."""
+        Incident.objects.create(title="Open", service=self.service)
+        Incident.objects.create(
+            title="Closed",
+            service=self.service,
+            status=IncidentStatus.RESOLVED,
+            resolved_at=timezone.now(),
+        )
+        self.client.force_login(self.admin_user)
+        
+        response = self.client.get("/admin/core/incident/", {"active": "no"})
+        
+        self.assertEqual(response.context["cl"].result_count, 1)
+
     def test_filter_classes_exist(self):
         """Test that filter classes are properly defined."""
         self.assertEqual(ActiveIncidentFilter.parameter_name, "active")
@@ -186,6 +238,11 @@ class TestIncidentAdminActions(AdminTestMixin, TestCase):
         
         self.incident.refresh_from_db()
         self.assertEqual(self.incident.status, IncidentStatus.ACKNOWLEDGED)
+        self.assertTrue(
+            self.incident.events.filter(
+                message=f"Incident acknowledged by {self.admin_user.username}"
+            ).exists()
+        )
 
     def test_mark_as_resolved_action(self):
         """Test mark_as_resolved action."""
@@ -221,6 +278,22 @@ class TestIncidentAdminActions(AdminTestMixin, TestCase):
         self.incident.refresh_from_db()
         self.assertEqual(self.incident.lead, other_user)
 
+    def test_rerun_orchestration_dispatches_one_group(self):
+        """Test rerun_orchestration enqueues all incidents in a single group."""
+        request = self.factory.post("/admin/core/incident/")
+        request.user = self.admin_user
+        
+        incident_admin = IncidentAdmin(Incident, self.site)
+        queryset = Incident.objects.all()
+        
+        with patch("celery.group") as mock_group, \
+                patch.object(incident_admin, "message_user"):
+            incident_admin.rerun_orchestration(request, queryset)
+        
+        signatures = list(mock_group.call_args.args[0])
+        self.assertEqual([sig.args for sig in signatures], [(str(self.incident.id),)])
+        mock_group.return_value.apply_async.assert_called_once()
+
     def test_export_as_csv_action(self):
         """Test export_as_csv action."""
         request = self.factory.post("/admin/core/incident/")
@@ -235,7 +308,7 @@ class TestIncidentAdminActions(AdminTestMixin, TestCase):
         self.assertEqual(response["Content-Type"], "text/csv")
         self.assertIn("incidents_export.csv", response["Content-Disposition"])
         
-        content = response.content.decode("utf-8")
+        content = b"".join(response.streaming_content).decode("utf-8")
         self.assertIn("Test incident", content)
 
 
@@ -283,6 +356,193 @@ class TestIncidentAdminDisplayMethods(AdminTestMixin, TestCase):
         
         self.assertTrue(any(unit in age for unit in ["m", "h", "d"]))
 
+    def test_age_display_uses_database_age(self):
+        """Test age comes from the changelist annotation."""
+        Incident.objects.filter(pk=self.incident.pk).update(
+            status=IncidentStatus.RESOLVED,
+            resolved_at=self.incident.created_at + timedelta(hours=3),
+        )
+        incident_admin = IncidentAdmin(Incident, self.site)
+        request = self.factory.get("/admin/core/incident/")
+        request.user = self.admin_user
+        
+        incident = incident_admin.get_queryset(request).get(pk=self.incident.pk)
+        
+        self.assertEqual(incident_admin.age_display(incident), "3h")
+
+    def test_reopened_incident_age_keeps_running(self):
+        """Test a stale resolved_at does not freeze the age of an open incident."""
+        Incident.objects.filter(pk=self.incident.pk).update(
+            status=IncidentStatus.TRIGGERED,
+            created_at=timezone.now() - timedelta(days=2),
+            resolved_at=timezone.now() - timedelta(days=2) + timedelta(hours=3),
+        )
+        incident_admin = IncidentAdmin(Incident, self.site)
+        request = self.factory.get("/admin/core/incident/")
+        request.user = self.admin_user
+        
+        incident = incident_admin.get_queryset(request).get(pk=self.incident.pk)
+        
+        self.assertEqual(incident_admin.age_display(incident), "2d")
+
+
+class TestIMASUserAdmin(AdminTestMixin, TestCase):
+    """Tests for the User admin."""
+
+    def test_changelist_columns_need_no_queries(self):
+        """Test lead counts and on-call teams come from the changelist queryset."""
+        Incident.objects.create(
+            title="Led incident",
+            service=self.service,
+            lead=self.admin_user,
+        )
+        user_admin = IMASUserAdmin(User, self.site)
+        request = self.factory.get("/admin/auth/user/")
+        request.user = self.admin_user
+        
+        user = user_admin.get_queryset(request).get(pk=self.admin_user.pk)
+        
+        with self.assertNumQueries(0):
+            self.assertEqual(user_admin.incident_lead_count(user), 1)
+            self.assertEqual(user_admin.on_call_teams_display(user), "-")
+
+    def test_lead_incidents_inline_shows_latest_ten(self):
+        """Test the change form only loads the ten most recent led incidents."""
+        for i in range(12):
+            Incident.objects.create(
+                title=f"Led incident {i}",
+                service=self.service,
+                lead=self.admin_user,
+            )
+        self.client.force_login(self.admin_user)
+        
+        response = self.client.get(f"/admin/auth/user/{self.admin_user.pk}/change/")
+        
+        self.assertEqual(response.status_code, 200)
+        formset = response.context["inline_admin_formsets"][0].formset
+        self.assertEqual(len(formset.forms), 10)
+
+
+class TestTeamAdmin(AdminTestMixin, TestCase):
+    """Tests for the Team admin."""
+
+    def test_changelist_columns_use_prefetched_data(self):
+        """Test on-call and service columns need no per-row queries."""
+        now = timezone.now()
+        OnCallSchedule.objects.create(
+            team=self.team,
+            user=self.admin_user,
+            start_time=now - timedelta(hours=1),
+            end_time=now + timedelta(hours=1),
+        )
+        team_admin = TeamAdmin(Team, self.site)
+        request = self.factory.get("/admin/core/team/")
+        request.user = self.admin_user
+        
+        team = team_admin.get_queryset(request).get(pk=self.team.pk)
+        
+        with self.assertNumQueries(0):
+            self.assertEqual(team_admin.current_on_call_display(team), "admin")
+            self.assertEqual(team_admin.service_count(team), 1)
+
+
+class TestRunbookAdmin(AdminTestMixin, TestCase):
+    """Tests for the Runbook admin."""
+
+    def test_steps_count_is_denormalized(self):
+        """Test the steps column reads the stored counter."""
+        runbook = Runbook.objects.create(name="DB failover", slug="db-failover")
+        for order in (1, 2):
+            RunbookStep.objects.create(
+                runbook=runbook, order=order, title=f"Step {order}", description="-"
+            )
+        runbook_admin = RunbookAdmin(Runbook, self.site)
+        request = self.factory.get("/admin/core/runbook/")
+        request.user = self.admin_user
+        
+        runbook = runbook_admin.get_queryset(request).get(pk=runbook.pk)
+        
+        with self.assertNumQueries(0):
+            self.assertEqual(runbook_admin.steps_count(runbook), 2)
+
+
+class TestTagAdmin(AdminTestMixin, TestCase):
+    """Tests for the Tag admin."""
+
+    def test_color_preview_escapes_color(self):
+        """Test the memoized color swatch still escapes the stored color."""
+        tag_admin = TagAdmin(Tag, self.site)
+        tag = Tag(name="db", color='red"><script>')
+        
+        html = tag_admin.color_preview(tag)
+        
+        self.assertNotIn("<script>", html)
+        self.assertIs(html, tag_admin.color_preview(tag))
+
+
+class TestAlertFingerprintAdmin(AdminTestMixin, TestCase):
+    """Tests for the AlertFingerprint admin."""
+
+    def setUp(self):
+        super().setUp()
+        self.fp_admin = AlertFingerprintAdmin(AlertFingerprint, self.site)
+        self.request = self.factory.get("/admin/core/alertfingerprint/")
+        self.request.user = self.admin_user
+        self.alert = AlertFingerprint.objects.create(
+            fingerprint=AlertFingerprint.compute_fingerprint("DiskFull", {"host": "db-1"}),
+            alert_name="DiskFull",
+            status=AlertStatus.FIRING,
+        )
+
+    def test_hex_search_matches_fingerprint(self):
+        """Test a full hex fingerprint finds the alert."""
+        queryset, _ = self.fp_admin.get_search_results(
+            self.request, AlertFingerprint.objects.all(), self.alert.fingerprint_hex
+        )
+        
+        self.assertEqual(list(queryset), [self.alert])
+
+    def test_hex_search_respects_list_filters(self):
+        """Test a hex search does not bypass filters already applied."""
+        resolved = AlertFingerprint.objects.filter(status=AlertStatus.RESOLVED)
+        
+        queryset, _ = self.fp_admin.get_search_results(
+            self.request, resolved, self.alert.fingerprint_hex
+        )
+        
+        self.assertFalse(queryset.exists())
+
+
+class TestEscalationPolicyAdmin(AdminTestMixin, TestCase):
+    """Tests for the EscalationPolicy admin."""
+
+    def test_step_users_labelled_without_extra_queries(self):
+        """Test inline notify_user labels come from the joined rows."""
+        policy = EscalationPolicy.objects.create(name="Default", team=self.team)
+        url = f"/admin/core/escalationpolicy/{policy.pk}/change/"
+        self.client.force_login(self.admin_user)
+        
+        def add_step(order):
+            EscalationStep.objects.create(
+                policy=policy,
+                order=order,
+                notify_type="user",
+                notify_user=User.objects.create_user(username=f"responder{order}"),
+            )
+        
+        add_step(1)
+        self.client.get(url)
+        with CaptureQueriesContext(connection) as one_step:
+            self.client.get(url)
+        
+        add_step(2)
+        add_step(3)
+        with CaptureQueriesContext(connection) as three_steps:
+            response = self.client.get(url)
+        
+        self.assertEqual(len(three_steps), len(one_step))
+        self.assertContains(response, "responder3")
+
 
 class TestOnCallScheduleAdmin(AdminTestMixin, TestCase):
     """Tests for OnCallSchedule admin."""
@@ -312,6 +572,24 @@ class TestOnCallScheduleAdmin(AdminTestMixin, TestCase):
         new_schedule = OnCallSchedule.objects.exclude(id=schedule.id).first()
         self.assertEqual(new_schedule.start_time, schedule.start_time + timedelta(days=7))
 
+    def test_changelist_columns_are_annotated(self):
+        """Test active flag and duration come from the database."""
+        now = timezone.now()
+        schedule = OnCallSchedule.objects.create(
+            team=self.team,
+            user=self.admin_user,
+            start_time=now - timedelta(hours=1),
+            end_time=now + timedelta(hours=47),
+        )
+        oncall_admin = OnCallScheduleAdmin(OnCallSchedule, self.site)
+        request = self.factory.get("/admin/core/oncallschedule/")
+        request.user = self.admin_user
+        
+        schedule = oncall_admin.get_queryset(request).get(pk=schedule.pk)
+        
+        self.assertTrue(oncall_admin.is_active_display(schedule))
+        self.assertEqual(oncall_admin.duration_display(schedule), "2.0 days")
+
     def test_oncall_active_filter(self):
         """Test OnCallActiveFilter logic."""
         now = timezone.now()
@@ -343,3 +621,75 @@ class TestOnCallScheduleAdmin(AdminTestMixin, TestCase):
         filtered_ids = list(filtered.values_list("id", flat=True))
         self.assertIn(active_sched.id, filtered_ids)
         self.assertNotIn(past_sched.id, filtered_ids)
+
+
+class TestIMASAdminDashboard(AdminTestMixin, TestCase):
+    """Tests for the IMAS admin dashboard view."""
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_dashboard_aggregates(self):
+        """Test dashboard counts and MTTR come from a single aggregate."""
+        from core.admin import imas_admin_site
+        
+        Incident.objects.create(
+            title="Active",
+            service=self.service,
+            severity=IncidentSeverity.SEV1_CRITICAL,
+            status=IncidentStatus.TRIGGERED,
+        )
+        resolved = Incident.objects.create(
+            title="Resolved",
+            service=self.service,
+            severity=IncidentSeverity.SEV3_MEDIUM,
+            status=IncidentStatus.RESOLVED,
+        )
+        Incident.objects.filter(pk=resolved.pk).update(
+            resolved_at=resolved.created_at + timedelta(minutes=30)
+        )
+        
+        request = self.factory.get("/admin/dashboard/")
+        request.user = self.admin_user
+        
+        response = imas_admin_site.dashboard_view(request)
+        context = response.context_data
+        
+        self.assertEqual(context["active_count"], 1)
+        self.assertEqual(context["total_incidents_24h"], 2)
+        self.assertEqual(context["total_incidents_30d"], 2)
+        self.assertEqual(context["avg_mttr"], timedelta(minutes=30))
+
+    def test_dashboard_serves_stale_stats_and_schedules_refresh(self):
+        """Test a stale cache entry is served while a refresh is scheduled."""
+        from core.admin import (
+            ADMIN_DASHBOARD_STALE_CACHE_KEY,
+            get_admin_dashboard_stats,
+        )
+        
+        stale = {"active_count": 42}
+        cache.set(ADMIN_DASHBOARD_STALE_CACHE_KEY, stale)
+        
+        with patch("core.tasks.refresh_admin_dashboard.delay") as mock_delay:
+            self.assertEqual(get_admin_dashboard_stats(), stale)
+            self.assertEqual(get_admin_dashboard_stats(), stale)
+        
+        mock_delay.assert_called_once()
+
+
+class TestFasterAdminPaginator(TestCase):
+    """Tests for the estimated-count paginator."""
+
+    def test_falls_back_to_exact_count(self):
+        """Test non-PostgreSQL backends and filtered querysets count exactly."""
+        AuditLog.objects.create(action="LOGIN", username="alice")
+        AuditLog.objects.create(action="LOGOUT", username="alice")
+        
+        self.assertEqual(FasterAdminPaginator(AuditLog.objects.all(), 10).count, 2)
+        self.assertEqual(
+            FasterAdminPaginator(AuditLog.objects.filter(action="LOGIN"), 10).count, 1
+        )
@@ -26,6 +26,31 @@ class TestHealthCheck:
         assert response.data["service"] == "imas-manager"
 
 
+@pytest.mark.django_db
+class TestSchemaView:
+    """Tests for the OpenAPI schema endpoint."""
+
+    def test_serves_precompiled_schema(self, api_client, settings, tmp_path):
+        """Test the build-time schema file is returned without introspection."""
+        schema_file = tmp_path / "schema.yaml"
+        schema_file.write_text("openapi: 3.0.3\n")
+        settings.SPECTACULAR_SCHEMA_FILE = schema_file
+        
+        response = api_client.get("/api/schema/")
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert b"".join(response.streaming_content) == b"openapi: 3.0.3\n"
+
+    def test_generates_schema_without_file(self, api_client, settings, tmp_path):
+        """Test the schema is generated live when no file was built."""
+        settings.SPECTACULAR_SCHEMA_FILE = tmp_path / "missing.yaml"
+        
+        response = api_client.get("/api/schema/?format=json")
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert "paths" in response.json()
+
+
 @pytest.mark.django_db
 class TestIncidentAPI:
     """Tests for Incident API endpoints."""
@@ -43,6 +68,22 @@ class TestIncidentAPI:
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data["results"]) >= 1
 
+    def test_list_incidents_cursor_pagination(self, authenticated_client, service):
+        """Test incident list pages are linked by cursor, newest first."""
+        for i in range(3):
+            Incident.objects.create(title=f"Incident {i}", service=service)
+        
+        response = authenticated_client.get("/api/v1/incidents/", {"page_size": 2})
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert "count" not in response.data
+        assert [i["title"] for i in response.data["results"]] == ["Incident 2", "Incident 1"]
+        
+        response = authenticated_client.get(response.data["next"])
+        
+        assert [i["title"] for i in response.data["results"]] == ["Incident 0"]
+        assert response.data["next"] is None
+
     def test_create_incident(self, authenticated_client, service):
         """Test creating an incident via API."""
         data = {
@@ -218,6 +259,44 @@ class TestTokenAuthentication:
         response = authenticated_client.get("/api/v1/incidents/")
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
+    def test_token_lookup_is_cached(
+        self, authenticated_client, user, django_assert_num_queries
+    ):
+        """Test repeated requests authenticate without any query."""
+        from django.core.cache import cache
+        
+        authenticated_client.get("/api/token/verify/")
+        
+        with django_assert_num_queries(0):
+            response = authenticated_client.get("/api/token/verify/")
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["username"] == user.username
+        # The password hash never leaves the database
+        key = authenticated_client._credentials["HTTP_AUTHORIZATION"].split()[1]
+        cached = cache.get(f"imas:tok:{key}")
+        assert cached["id"] == user.pk
+        assert "password" not in cached
+
+    def test_deactivated_user_token_rejected_immediately(self, authenticated_client, user):
+        """Test deactivating a user evicts their cached token."""
+        authenticated_client.get("/api/token/verify/")
+        
+        user.is_active = False
+        user.save()
+        
+        response = authenticated_client.get("/api/token/verify/")
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_deleted_user_token_rejected_immediately(self, authenticated_client, user):
+        """Test deleting a user evicts their cached token."""
+        authenticated_client.get("/api/token/verify/")
+        
+        user.delete()
+        
+        response = authenticated_client.get("/api/token/verify/")
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
     def test_regenerate_token(self, authenticated_client, user):
         """Test regenerating a token."""
         # Get current token
@@ -5,17 +5,25 @@ Tests for real-time broadcasting utilities.
 """
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from asgiref.sync import async_to_sync
 
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.test import TestCase
 
+from core import broadcast
 from core.broadcast import (
+    _get_stats,
+    _group_send_many,
     broadcast_incident_acknowledged,
     broadcast_incident_created,
     broadcast_incident_event,
     broadcast_incident_resolved,
     broadcast_incident_updated,
+    get_broadcast_incident,
     get_incident_serialized,
 )
 from core.choices import IncidentSeverity, IncidentStatus
@@ -58,6 +66,24 @@ class IncidentSerializationTestCase(TestCase):
         self.assertEqual(serialized["status"], "TRIGGERED")
         self.assertEqual(serialized["service"], "WS Service")
         self.assertEqual(serialized["lead"], "wstest")
+        self.assertEqual(serialized["severity_display"], incident.get_severity_display())
+        self.assertEqual(serialized["status_display"], incident.get_status_display())
+
+    def test_broadcast_incident_serializes_in_one_query(self):
+        """Test the broadcast fetch joins everything the serializer reads."""
+        incident = Incident.objects.create(
+            title="Single Query Incident",
+            severity=IncidentSeverity.SEV2_HIGH,
+            status=IncidentStatus.TRIGGERED,
+            service=self.service,
+            lead=self.user,
+        )
+        
+        with self.assertNumQueries(1):
+            serialized = get_incident_serialized(get_broadcast_incident(incident.pk))
+        
+        self.assertEqual(serialized["service"], "WS Service")
+        self.assertEqual(serialized["lead"], "wstest")
 
     def test_serialize_incident_without_lead(self):
         """Test serialization when lead is None."""
@@ -93,6 +119,23 @@ class BroadcastFunctionsTestCase(TestCase):
             service=cls.service,
         )
 
+    def setUp(self):
+        cache.clear()
+
+    def test_get_stats_single_query(self):
+        """Test dashboard stats are counted in one aggregate query."""
+        with self.assertNumQueries(1):
+            stats = _get_stats()
+        
+        self.assertEqual(stats, {"triggered": 1, "acknowledged": 0})
+
+    def test_get_stats_reused_within_burst(self):
+        """Test back-to-back broadcasts reuse the cached stats."""
+        _get_stats()
+        
+        with self.assertNumQueries(0):
+            self.assertEqual(_get_stats(), {"triggered": 1, "acknowledged": 0})
+
     @patch("core.broadcast.get_channel_layer")
     @patch("core.broadcast.async_to_sync")
     def test_broadcast_incident_created(self, mock_async, mock_layer):
@@ -106,6 +149,21 @@ class BroadcastFunctionsTestCase(TestCase):
         # Should call async_to_sync for group_send
         self.assertTrue(mock_async.called)
 
+    @patch("core.broadcast.get_channel_layer")
+    @patch("core.broadcast.async_to_sync")
+    def test_broadcast_incident_created_single_loop(self, mock_async, mock_layer):
+        """Test all created-incident messages go out through one async_to_sync."""
+        mock_layer.return_value = MagicMock()
+        
+        broadcast_incident_created(self.incident)
+        
+        mock_async.assert_called_once()
+        _, messages = mock_async.return_value.call_args.args
+        self.assertEqual(
+            [group for group, _ in messages],
+            ["incidents_all", "dashboard", "dashboard"],
+        )
+
     @patch("core.broadcast.get_channel_layer")
     @patch("core.broadcast.async_to_sync")
     def test_broadcast_incident_updated(self, mock_async, mock_layer):
@@ -196,5 +254,347 @@ class BroadcastFunctionsTestCase(TestCase):
         
         broadcast_incident_created(critical_incident)
         
-        # Should have called group_send multiple times (incidents_all, dashboard stats, critical_alert)
-        self.assertGreaterEqual(mock_async.call_count, 2)
+        # incidents_all, dashboard stats and critical_alert share one send batch
+        _, messages = mock_group_send.call_args.args
+        self.assertIn("critical_alert", [message["type"] for _, message in messages])
+
+
+class SubscriberCheckTestCase(TestCase):
+    """Test broadcasts skip groups nobody listens to."""
+
+    def setUp(self):
+        broadcast._subscriber_checks.clear()
+
+    @patch("core.broadcast._count_subscribers", new_callable=AsyncMock)
+    def test_empty_group_skipped_and_check_cached(self, mock_count):
+        """Test empty incident groups are skipped and rechecked only after the TTL."""
+        mock_count.return_value = 0
+        channel_layer = MagicMock(group_send=AsyncMock())
+        messages = [
+            ("incidents_all", {"type": "incident_update"}),
+            ("incident_abc", {"type": "incident_update"}),
+        ]
+        
+        async_to_sync(_group_send_many)(channel_layer, messages)
+        async_to_sync(_group_send_many)(channel_layer, messages)
+        
+        sent_groups = [c.args[0] for c in channel_layer.group_send.call_args_list]
+        self.assertEqual(sent_groups, ["incidents_all", "incidents_all"])
+        mock_count.assert_awaited_once()
+
+    @patch("core.broadcast._count_subscribers", new_callable=AsyncMock)
+    def test_unknown_count_still_sends(self, mock_count):
+        """Test layers that cannot count subscribers always receive the send."""
+        mock_count.return_value = None
+        channel_layer = MagicMock(group_send=AsyncMock())
+        
+        async_to_sync(_group_send_many)(
+            channel_layer, [("incident_abc", {"type": "incident_update"})]
+        )
+        
+        channel_layer.group_send.assert_awaited_once()
+
+    @patch("core.broadcast._SUBSCRIBER_CHECK_MAX", 3)
+    @patch("core.broadcast._count_subscribers", new_callable=AsyncMock)
+    def test_subscriber_checks_stay_bounded(self, mock_count):
+        """Test remembered checks are capped and expired ones are pruned."""
+        mock_count.return_value = 0
+        channel_layer = MagicMock(group_send=AsyncMock())
+        messages = [(f"incident_{i}", {"type": "incident_update"}) for i in range(5)]
+        
+        async_to_sync(_group_send_many)(channel_layer, messages)
+        self.assertEqual(list(broadcast._subscriber_checks), ["incident_2", "incident_3", "incident_4"])
+        
+        broadcast._remember_check("incident_9", time.monotonic() + 60, False)
+        self.assertEqual(list(broadcast._subscriber_checks), ["incident_9"])
+
+    @patch("core.broadcast._SUBSCRIBER_CHECK_MAX", 8)
+    def test_subscriber_checks_safe_across_threads(self):
+        """Test concurrent broadcast threads can record checks at once."""
+        import sys
+        import threading
+        
+        errors = []
+        
+        def record(worker):
+            try:
+                for i in range(2000):
+                    broadcast._remember_check(f"incident_{worker}_{i}", time.monotonic(), False)
+            except Exception as e:
+                errors.append(e)
+        
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=record, args=(n,)) for n in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+        
+        self.assertEqual(errors, [])
+        self.assertLessEqual(len(broadcast._subscriber_checks), 8)
+
+    def test_pubsub_numsub_target_matches_channels_redis(self):
+        """Test the channels_redis internals used for PUBSUB NUMSUB still exist."""
+        from channels_redis.pubsub import RedisPubSubChannelLayer
+        
+        channel_layer = RedisPubSubChannelLayer(hosts=["redis://localhost:6379/0"])
+        
+        async def resolve():
+            # No command is sent; the client connects lazily
+            return broadcast._pubsub_numsub_target(channel_layer, "incident_abc")
+        
+        client, group_channel = async_to_sync(resolve)()
+        
+        self.assertTrue(callable(client.pubsub_numsub))
+        self.assertIn("incident_abc", group_channel)
+        self.assertIsNone(broadcast._pubsub_numsub_target(MagicMock(), "incident_abc"))
+
+    @patch("core.broadcast._count_subscribers", new_callable=AsyncMock)
+    @patch("core.broadcast.encode_frame", wraps=broadcast.encode_frame)
+    def test_shared_message_encoded_once(self, mock_encode, mock_count):
+        """Test groups sharing a message receive one pre-encoded frame."""
+        mock_count.return_value = 1
+        channel_layer = MagicMock(group_send=AsyncMock())
+        message = {"type": "incident_updated", "incident": {"id": "abc"}, "changes": {}}
+        
+        async_to_sync(_group_send_many)(
+            channel_layer, [("incident_abc", message), ("incidents_all", message)]
+        )
+        
+        mock_encode.assert_called_once_with(message)
+        events = [c.args[1] for c in channel_layer.group_send.call_args_list]
+        self.assertEqual(events[0], events[1])
+        self.assertEqual(events[0]["type"], "incident_updated")
+        self.assertEqual(
+            events[0]["frame"],
+            '{"type":"incident_updated","incident":{"id":"abc"},"changes":{}}',
+        )
+
+
+class DashboardConsumerTestCase(TestCase):
+    """Test dashboard consumer queries."""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_dashboard_stats_single_query(self):
+        """Test connect-time stats come from one aggregate query."""
+        from django.utils import timezone
+
+        from core.consumers import DashboardConsumer
+        
+        team = Team.objects.create(name="Stats Team", slug="stats-team")
+        service = Service.objects.create(name="Stats API", owner_team=team)
+        for status in (IncidentStatus.TRIGGERED, IncidentStatus.ACKNOWLEDGED):
+            Incident.objects.create(title=status, status=status, service=service)
+        Incident.objects.create(
+            title="Done",
+            status=IncidentStatus.RESOLVED,
+            resolved_at=timezone.now(),
+            service=service,
+        )
+        
+        get_stats = DashboardConsumer.__dict__["get_dashboard_stats"].func
+        with self.assertNumQueries(1):
+            stats = get_stats(DashboardConsumer())
+        
+        self.assertEqual(
+            stats, {"triggered": 1, "acknowledged": 1, "resolved_today": 1}
+        )
+
+    def test_dashboard_stats_cached_until_status_change(self):
+        """Test reconnects reuse the stats until an incident status changes."""
+        from core.consumers import DashboardConsumer
+        
+        team = Team.objects.create(name="Cache Team", slug="cache-team")
+        service = Service.objects.create(name="Cache API", owner_team=team)
+        incident = Incident.objects.create(title="Down", service=service)
+        get_stats = DashboardConsumer.__dict__["get_dashboard_stats"].func
+        
+        get_stats(DashboardConsumer())
+        with self.assertNumQueries(0):
+            stats = get_stats(DashboardConsumer())
+        self.assertEqual(stats["triggered"], 1)
+        
+        incident.status = IncidentStatus.ACKNOWLEDGED
+        incident.save(update_fields=["status"])
+        
+        stats = get_stats(DashboardConsumer())
+        self.assertEqual(stats["triggered"], 0)
+        self.assertEqual(stats["acknowledged"], 1)
+
+
+class ConsumerEncodingTestCase(TestCase):
+    """Test WebSocket frame encoding."""
+
+    def test_encode_decode_round_trip(self):
+        """Test the orjson codec matches the stdlib JSON wire format."""
+        from asgiref.sync import async_to_sync
+
+        from core.consumers import IncidentConsumer
+        
+        content = {"type": "stats_update", "stats": {"triggered": 1}, 3: "x"}
+        
+        text = async_to_sync(IncidentConsumer.encode_json)(content)
+        
+        self.assertIsInstance(text, str)
+        self.assertEqual(
+            async_to_sync(IncidentConsumer.decode_json)(text),
+            {"type": "stats_update", "stats": {"triggered": 1}, "3": "x"},
+        )
+
+    def test_send_json_handles_non_json_types(self):
+        """Test send_json writes one text frame for datetimes and Decimals."""
+        from datetime import datetime, timezone as dt_timezone
+        from decimal import Decimal
+
+        from core.consumers import DashboardConsumer
+        
+        consumer = DashboardConsumer()
+        consumer.scope = {"query_string": b""}
+        consumer.base_send = AsyncMock()
+        
+        async_to_sync(consumer.send_json)({
+            "at": datetime(2024, 1, 1, tzinfo=dt_timezone.utc),
+            "mttr": Decimal("1.5"),
+        })
+        
+        consumer.base_send.assert_awaited_once_with({
+            "type": "websocket.send",
+            "text": '{"at":"2024-01-01T00:00:00Z","mttr":"1.5"}',
+        })
+
+    def test_handler_forwards_pre_encoded_frame(self):
+        """Test group handlers send the broadcast frame without re-encoding."""
+        from core.consumers import IncidentConsumer
+        
+        consumer = IncidentConsumer()
+        consumer.scope = {"query_string": b""}
+        consumer.base_send = AsyncMock()
+        
+        with patch("core.consumers.encode_frame") as mock_encode:
+            async_to_sync(consumer.incident_created)({
+                "type": "incident_created",
+                "frame": '{"type":"incident_created"}',
+            })
+        
+        mock_encode.assert_not_called()
+        consumer.base_send.assert_awaited_once_with({
+            "type": "websocket.send",
+            "text": '{"type":"incident_created"}',
+        })
+
+    def test_binary_frames_opt_in(self):
+        """Test clients passing ?frames=binary get bytes frames."""
+        from core.consumers import IncidentConsumer
+        
+        consumer = IncidentConsumer()
+        consumer.scope = {"query_string": b"frames=binary"}
+        consumer.base_send = AsyncMock()
+        
+        async_to_sync(consumer.send_json)({"type": "pong"})
+        async_to_sync(consumer.incident_created)({
+            "type": "incident_created",
+            "frame": '{"type":"incident_created"}',
+        })
+        
+        self.assertEqual(
+            [c.args[0] for c in consumer.base_send.await_args_list],
+            [
+                {"type": "websocket.send", "bytes": b'{"type":"pong"}'},
+                {"type": "websocket.send", "bytes": b'{"type":"incident_created"}'},
+            ],
+        )
+
+    def test_batched_frames_coalesce_queued_broadcasts(self):
+        """Test ?batch=1 clients get queued broadcasts as one JSON array."""
+        import asyncio
+
+        from core.consumers import IncidentConsumer
+        
+        consumer = IncidentConsumer()
+        consumer.scope = {"query_string": b"batch=1"}
+        consumer.base_send = AsyncMock()
+        
+        async def storm():
+            await consumer.incident_created({"type": "incident_created", "frame": '{"n":1}'})
+            await consumer.incident_updated({"type": "incident_updated", "frame": '{"n":2}'})
+            await asyncio.sleep(0)
+            consumer._writer.cancel()
+        
+        async_to_sync(storm)()
+        
+        consumer.base_send.assert_awaited_once_with(
+            {"type": "websocket.send", "text": '[{"n":1},{"n":2}]'}
+        )
+
+    def test_batched_client_disconnected_when_outbox_full(self):
+        """Test a ?batch=1 client that falls behind is closed, not buffered."""
+        import asyncio
+
+        from core.consumers import IncidentConsumer
+        
+        consumer = IncidentConsumer()
+        consumer.scope = {"query_string": b"batch=1"}
+        consumer.base_send = AsyncMock()
+        consumer.max_outbox = 2
+        
+        async def storm():
+            for n in range(5):
+                await consumer.incident_updated({"type": "incident_updated", "frame": f'{{"n":{n}}}'})
+            await asyncio.sleep(0)
+        
+        async_to_sync(storm)()
+        
+        self.assertTrue(consumer._writer.cancelled())
+        consumer.base_send.assert_awaited_once_with({"type": "websocket.close", "code": 1013})
+
+    def test_batch_writer_failure_closes_connection(self):
+        """Test a failing batch send is logged and closes the connection."""
+        import asyncio
+
+        from core.consumers import IncidentConsumer
+        
+        consumer = IncidentConsumer()
+        consumer.scope = {"query_string": b"batch=1"}
+        consumer.base_send = AsyncMock(side_effect=[RuntimeError("send failed"), None])
+        
+        async def storm():
+            await consumer.incident_updated({"type": "incident_updated", "frame": '{"n":1}'})
+            for _ in range(3):
+                await asyncio.sleep(0)
+        
+        with self.assertLogs("core.consumers", level="ERROR"):
+            async_to_sync(storm)()
+        
+        self.assertEqual(
+            consumer.base_send.await_args_list[-1].args[0],
+            {"type": "websocket.close", "code": 1011},
+        )
+
+    def test_subscribe_many_incidents_in_one_message(self):
+        """Test incident_ids subscribes to every group with one acknowledgement."""
+        from core.consumers import IncidentConsumer
+        
+        consumer = IncidentConsumer()
+        consumer.scope = {"query_string": b""}
+        consumer.channel_name = "specific.abc"
+        consumer.channel_layer = MagicMock(group_add=AsyncMock())
+        consumer.base_send = AsyncMock()
+        
+        async_to_sync(consumer.receive_json)(
+            {"type": "subscribe", "incident_ids": ["a1", "b2"]}
+        )
+        
+        self.assertEqual(
+            [c.args for c in consumer.channel_layer.group_add.await_args_list],
+            [("incident_a1", "specific.abc"), ("incident_b2", "specific.abc")],
+        )
+        consumer.base_send.assert_awaited_once_with({
+            "type": "websocket.send",
+            "text": '{"type":"subscribed","incident_ids":["a1","b2"]}',
+        })
@@ -16,6 +16,7 @@ from core.cache import (
     get_cache_timeout,
     make_cache_key,
 )
+from core.models import Team
 
 
 class CacheKeyTestCase(TestCase):
@@ -106,6 +107,14 @@ class CacheManagerTestCase(TestCase):
         count = CacheManager.get_incident_count("TRIGGERED")
         self.assertEqual(count, 42)
 
+    def test_incident_counts_batch_set_get(self):
+        """Test several incident counts round-trip together."""
+        CacheManager.set_incident_counts({"TRIGGERED": 3, "ACKNOWLEDGED": 1})
+        
+        counts = CacheManager.get_incident_counts(["TRIGGERED", "ACKNOWLEDGED", "RESOLVED"])
+        
+        self.assertEqual(counts, {"TRIGGERED": 3, "ACKNOWLEDGED": 1})
+
     def test_incident_counts_invalidate(self):
         """Test invalidating all incident counts."""
         CacheManager.set_incident_count("TRIGGERED", 10)
@@ -194,3 +203,36 @@ class CachedQuerysetDecoratorTestCase(TestCase):
         # Different args = different cache keys
         self.assertEqual(result_a, ["incident_TRIGGERED"])
         self.assertEqual(result_b, ["incident_RESOLVED"])
+
+    def test_cached_queryset_as_values(self):
+        """Test QuerySets are cached as plain dicts when as_values is set."""
+        Team.objects.create(name="Cache Team", slug="cache-team")
+        
+        @cached_queryset("teams", as_values=True)
+        def get_teams():
+            return Team.objects.all()
+        
+        first = get_teams()
+        with self.assertNumQueries(0):
+            second = get_teams()
+        
+        self.assertEqual(first, second)
+        self.assertIsInstance(second[0], dict)
+        self.assertEqual(second[0]["slug"], "cache-team")
+
+    def test_cached_queryset_skips_large_results(self):
+        """Test QuerySets over max_rows are returned in one query but not cached."""
+        for i in range(3):
+            Team.objects.create(name=f"Team {i}", slug=f"team-{i}")
+        
+        @cached_queryset("big_teams", max_rows=2)
+        def get_teams():
+            return Team.objects.all()
+        
+        with self.assertNumQueries(1):
+            result = get_teams()
+        
+        self.assertIsInstance(result, list)
+        self.assertEqual(len(result), 3)
+        with self.assertNumQueries(1):
+            get_teams()
@@ -104,6 +104,30 @@ class TestTagModel:
         )
         assert tag.auto_apply_pattern == r"memory|oom|heap"
     
+    def test_auto_apply_pattern_compiled_once(self):
+        """Test auto-apply patterns are compiled once and reused."""
+        from core.patterns import compile_pattern
+        
+        pattern = compile_pattern(r"memory|oom|heap")
+        
+        assert compile_pattern(r"memory|oom|heap") is pattern
+        assert pattern.search("Java HEAP exhausted")
+    
+    def test_merged_patterns_match_like_individual_searches(self):
+        """Test merged pattern matching keeps per-pattern order and results."""
+        from core.patterns import all_matches, first_match
+        
+        patterns = [r"disk", r"^api", r"5\d\d", r"timeout$"]
+        
+        # The first pattern in order wins, not the leftmost match
+        assert first_match(patterns, "api 503 on disk") == 0
+        assert first_match(patterns, "db timeout") == 3
+        assert first_match(patterns, "all good") is None
+        assert all_matches(patterns, "api 503 timeout") == [1, 2, 3]
+        # Backreferences cannot be merged, so callers match individually
+        assert all_matches([r"(a)\1", "b"], "aa") is None
+        assert first_match([r"(a)\1", "b"], "aab") == 0
+    
     def test_tag_uniqueness(self, db):
         """Test tag name uniqueness."""
         Tag.objects.create(name="unique-tag")
@@ -298,6 +322,22 @@ class TestRunbook:
         
         assert matched == runbook
     
+    def test_find_for_incident_loads_relations(self, service, user, incident, django_assert_num_queries):
+        """Test the matched runbook arrives with its service and author loaded."""
+        Runbook.objects.create(
+            name="CPU Alert Runbook",
+            slug="cpu-alert-runbook",
+            service=service,
+            alert_pattern=r"cpu|processor",
+            author=user,
+        )
+        incident.title = "High CPU usage"
+        
+        with django_assert_num_queries(1):
+            matched = Runbook.find_for_incident(incident)
+            assert str(matched) == f"{service.name} - CPU Alert Runbook"
+            assert matched.author.username == user.username
+    
     def test_runbook_quick_actions(self, service, user):
         """Test runbook quick actions."""
         runbook = Runbook.objects.create(
@@ -583,6 +623,23 @@ class TestFeaturesAPI:
         assert response.status_code == 200
         assert len(response.data) >= 2
     
+    def test_list_incident_tags(self, client, user, incident):
+        """Test listing the tags applied to an incident."""
+        from rest_framework.test import APIClient
+        
+        client = APIClient()
+        client.force_authenticate(user=user)
+        
+        tag = Tag.objects.create(name="network")
+        IncidentTag.objects.create(incident=incident, tag=tag, added_by=user)
+        
+        response = client.get(f"/api/v1/incidents/{incident.id}/tags/")
+        
+        assert response.status_code == 200
+        results = response.data.get("results", response.data)
+        assert results[0]["tag_name"] == "network"
+        assert results[0]["added_by_username"] == user.username
+    
     def test_create_comment(self, client, user, incident):
         """Test creating a comment."""
         from rest_framework.test import APIClient
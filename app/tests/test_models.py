@@ -256,3 +256,51 @@ class TestNotificationProviderModel:
         
         assert "✓" in str(active)
         assert "✗" in str(inactive)
+
+    def test_config_round_trip(self):
+        """Test config survives a save and reload through the orjson field."""
+        config = {"channel": "#alerts", "retries": 3, "nested": {"ok": True}}
+        provider = NotificationProvider.objects.create(
+            name="Round Trip",
+            type="SLACK",
+            config=config,
+        )
+        
+        provider.refresh_from_db()
+        
+        assert provider.config == config
+        assert NotificationProvider.objects.filter(config__channel="#alerts").exists()
+
+    def test_config_rejects_unserializable_values(self):
+        """Test values JSONField cannot store raise instead of saving as text."""
+        provider = NotificationProvider(name="Bad", type="SLACK", config={"tags": {"a"}})
+        
+        with pytest.raises(TypeError):
+            provider.save()
+
+
+class TestUUID7:
+    """Tests for time-ordered primary keys."""
+
+    def test_uuid7_version_and_order(self):
+        """Test keys are RFC 9562 v7 and sort by creation time."""
+        import time
+
+        from core.ids import uuid7
+        
+        first = uuid7()
+        time.sleep(0.002)
+        second = uuid7()
+        
+        assert first.version == 7
+        assert first.variant == "specified in RFC 4122"
+        assert first < second
+
+    def test_append_heavy_models_default_to_uuid7(self):
+        """Test hot-insert tables get time-ordered keys while incidents keep uuid4."""
+        from core.models import AuditLog, IncidentEvent
+        
+        assert AuditLog().id.version == 7
+        assert IncidentEvent().id.version == 7
+        # Incident.short_id shows the leading UUID digits, so they must stay random
+        assert Incident().id.version == 4
@@ -5,9 +5,15 @@ Tests for RBAC permissions, audit logging, and security middleware.
 """
 from __future__ import annotations
 
+import os
+import runpy
+from unittest import mock
+
+import yaml
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
-from django.test import TestCase, override_settings
+from django.test import SimpleTestCase, TestCase, override_settings
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
@@ -214,6 +220,101 @@ class AuditLogTestCase(TestCase):
         self.assertFalse(log.success)
         self.assertEqual(log.error_message, "Invalid data format")
 
+    @override_settings(AUDIT_LOG_ASYNC=True)
+    def test_log_async_queues_entry_without_user_object(self):
+        """Test log_async hands the writer an entry that only keeps user_id."""
+        from unittest.mock import patch
+        
+        with patch("core.audit.enqueue") as enqueue:
+            result = AuditLog.log_async(
+                action=AuditAction.INCIDENT_CREATED,
+                user=self.user,
+                resource_type="Incident",
+                resource_id="abc123",
+            )
+        
+        self.assertIsNone(result)
+        entry = enqueue.call_args.args[0]
+        self.assertFalse(AuditLog.objects.exists())
+        self.assertEqual(entry.user_id, self.user.pk)
+        self.assertEqual(entry.username, "audituser")
+        self.assertFalse(AuditLog._meta.get_field("user").is_cached(entry))
+
+    @override_settings(AUDIT_LOG_ASYNC=True)
+    def test_middleware_entries_batched_off_request_thread(self):
+        """Test queued audit entries are bulk-created by the background writer."""
+        import threading
+        from unittest.mock import patch
+
+        from core import audit
+        
+        calls = []
+        
+        def record(entries, batch_size):
+            calls.append((threading.current_thread(), list(entries)))
+        
+        entries = [AuditLog(action=AuditAction.API_REQUEST) for _ in range(3)]
+        with patch.object(AuditLog.objects, "bulk_create", side_effect=record):
+            for entry in entries:
+                audit.enqueue(entry)
+            self.assertTrue(audit.flush())
+        
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(calls[0][1], entries)
+        self.assertIsNot(calls[0][0], threading.current_thread())
+
+    @override_settings(AUDIT_LOG_ASYNC=True)
+    def test_full_queue_saves_entry_inline(self):
+        """Test an entry that does not fit in the queue is saved, not dropped."""
+        import queue
+        from unittest.mock import patch
+
+        from core import audit
+        
+        entry = AuditLog(action=AuditAction.API_REQUEST, description="overflow")
+        with (
+            patch.object(audit, "_ensure_writer"),
+            patch.object(audit._queue, "put_nowait", side_effect=queue.Full),
+        ):
+            audit.enqueue(entry)
+        
+        self.assertTrue(AuditLog.objects.filter(description="overflow").exists())
+
+    def test_failed_batch_saved_row_by_row(self):
+        """Test a failed bulk insert falls back to saving entries one by one."""
+        from unittest.mock import patch
+
+        from core import audit
+        
+        good = [AuditLog(action=AuditAction.API_REQUEST, description=f"ok {i}") for i in range(2)]
+        bad = AuditLog(action=AuditAction.API_REQUEST, description="bad")
+        
+        with (
+            patch.object(AuditLog.objects, "bulk_create", side_effect=ValueError("boom")),
+            patch.object(bad, "save", side_effect=ValueError("bad row")),
+            self.assertLogs("core.audit", level="ERROR") as logs,
+        ):
+            audit._write_batch(AuditLog, [good[0], bad, good[1]])
+        
+        self.assertEqual(
+            set(AuditLog.objects.values_list("description", flat=True)), {"ok 0", "ok 1"}
+        )
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn("bad row", logs.output[0])
+
+    def test_read_requests_not_audited(self):
+        """Test the middleware only records mutating requests."""
+        staff = User.objects.create_user(
+            username="auditstaff", password="testpass123", is_staff=True
+        )
+        self.client.force_login(staff)
+        
+        self.client.get("/admin/")
+        self.assertFalse(AuditLog.objects.exists())
+        
+        self.client.post(reverse("api_v1:incident_list"), {})
+        self.assertEqual(AuditLog.objects.count(), 1)
+
 
 class SecurityHeadersTestCase(TestCase):
     """Test security headers middleware."""
@@ -231,6 +332,79 @@ class SecurityHeadersTestCase(TestCase):
         response = self.client.get("/health/")
         self.assertEqual(response["Referrer-Policy"], "strict-origin-when-cross-origin")
 
+    @override_settings(SECURE_PROXY_SSL_HEADER=("HTTP_X_FORWARDED_PROTO", "https"))
+    def test_hsts_header_behind_tls_proxy(self):
+        """Test HSTS is sent when a trusted proxy reports an HTTPS request."""
+        response = self.client.get("/health/", HTTP_X_FORWARDED_PROTO="https")
+        self.assertEqual(
+            response["Strict-Transport-Security"],
+            "max-age=31536000; includeSubDomains",
+        )
+
+    def test_forwarded_proto_ignored_by_default(self):
+        """Test a client-sent X-Forwarded-Proto is not trusted without opt-in."""
+        response = self.client.get("/health/", HTTP_X_FORWARDED_PROTO="https")
+        self.assertNotIn("Strict-Transport-Security", response)
+
+
+class ShippedProxyConfigTestCase(SimpleTestCase):
+    """Test the deployments we ship trust their TLS-terminating proxy."""
+
+    repo_root = settings.BASE_DIR.parent
+
+    def _load(self, relative_path: str):
+        with (self.repo_root / relative_path).open() as f:
+            return yaml.safe_load(f)
+
+    def _proxy_header_for(self, environ: dict[str, str]):
+        """Evaluate config/settings.py under the given environment."""
+        with mock.patch.dict(os.environ, environ):
+            namespace = runpy.run_path(str(settings.BASE_DIR / "config" / "settings.py"))
+        return namespace.get("SECURE_PROXY_SSL_HEADER")
+
+    def test_docker_compose_prod_trusts_forwarded_proto(self):
+        """Test the production compose web service enables the proxy header."""
+        compose = self._load("docker/docker-compose.prod.yml")
+        environ = dict(
+            item.split("=", 1) for item in compose["services"]["web"]["environment"]
+        )
+        self.assertEqual(
+            self._proxy_header_for({"USE_X_FORWARDED_PROTO": environ["USE_X_FORWARDED_PROTO"]}),
+            ("HTTP_X_FORWARDED_PROTO", "https"),
+        )
+
+    def test_k8s_configmap_trusts_forwarded_proto(self):
+        """Test the Kubernetes ConfigMap enables the proxy header."""
+        configmap = self._load("k8s/base/configmap.yaml")
+        self.assertEqual(
+            self._proxy_header_for(
+                {"USE_X_FORWARDED_PROTO": configmap["data"]["USE_X_FORWARDED_PROTO"]}
+            ),
+            ("HTTP_X_FORWARDED_PROTO", "https"),
+        )
+
+
+class StaffProfilerTestCase(TestCase):
+    """Test the on-demand profiling middleware."""
+
+    def test_staff_gets_profile_report(self):
+        """Staff users passing ?prof receive the pstats report."""
+        staff = User.objects.create_user(
+            username="profiler", password="testpass123", is_staff=True
+        )
+        self.client.force_login(staff)
+        
+        response = self.client.get("/health/?prof=time")
+        
+        self.assertEqual(response["Content-Type"], "text/plain; charset=utf-8")
+        self.assertIn(b"function calls", response.content)
+
+    def test_non_staff_not_profiled(self):
+        """Other users get the normal response."""
+        response = self.client.get("/health/?prof=time")
+        
+        self.assertEqual(response["Content-Type"], "application/json")
+
 
 class RateLimitTestCase(APITestCase):
     """Test rate limiting functionality."""
@@ -253,11 +427,47 @@ class RateLimitTestCase(APITestCase):
     )
     def test_rate_limit_headers(self):
         """Test that rate limit headers are present."""
-        response = self.client.get(reverse("api_v1:health_check"))
+        response = self.client.get(reverse("api_v1:incident_list"))
         
         self.assertIn("X-RateLimit-Limit", response)
         self.assertIn("X-RateLimit-Remaining", response)
 
+    @override_settings(
+        MIDDLEWARE=[
+            "django.middleware.security.SecurityMiddleware",
+            "core.middleware.RateLimitByIPMiddleware",
+            "django.contrib.sessions.middleware.SessionMiddleware",
+            "django.middleware.common.CommonMiddleware",
+            "django.contrib.auth.middleware.AuthenticationMiddleware",
+        ]
+    )
+    def test_health_check_not_rate_limited(self):
+        """Health checks bypass IP rate limiting."""
+        response = self.client.get(reverse("api_v1:health_check"))
+        
+        self.assertNotIn("X-RateLimit-Limit", response)
+
+    def test_rate_limit_counts_requests(self):
+        """Test the counter blocks requests past the limit within a window."""
+        from django.core.cache import cache
+        from django.http import HttpResponse
+        from django.test import RequestFactory
+
+        from core.middleware import RateLimitByIPMiddleware
+        
+        cache.clear()
+        middleware = RateLimitByIPMiddleware(lambda request: HttpResponse())
+        middleware.RATE_LIMIT = 2
+        request = RequestFactory().get("/api/v1/incidents/", REMOTE_ADDR="10.0.0.9")
+        
+        first = middleware(request)
+        second = middleware(request)
+        third = middleware(request)
+        
+        self.assertEqual(first["X-RateLimit-Remaining"], "1")
+        self.assertEqual(second["X-RateLimit-Remaining"], "0")
+        self.assertEqual(third.status_code, 429)
+
     def test_authenticated_user_not_ip_limited(self):
         """Authenticated users use DRF throttling, not IP limiting."""
         user = User.objects.create_user(
@@ -12,7 +12,7 @@ import pytest
 from core.choices import IncidentSeverity, IncidentStatus
 from core.models import Incident, IncidentEvent
 from services.notifications.router import NotificationRecipients, NotificationRouter
-from services.orchestrator import IncidentOrchestrator
+from services.orchestrator import IncidentOrchestrator, InvalidTransitionError
 
 
 @pytest.mark.django_db
@@ -90,6 +90,22 @@ class TestIncidentOrchestrator:
         assert result.status == IncidentStatus.ACKNOWLEDGED
         assert result.lead == user
 
+    def test_acknowledge_invalidates_cached_counts(
+        self, incident, user, django_capture_on_commit_callbacks
+    ):
+        """Test acknowledging drops cached counts although update() sends no signal."""
+        from core.cache import CacheManager
+        
+        CacheManager.set_incident_counts({"TRIGGERED": 1, "ACKNOWLEDGED": 0})
+        CacheManager.set_live_stats({"triggered": 1})
+        orchestrator = IncidentOrchestrator()
+        
+        with django_capture_on_commit_callbacks(execute=True):
+            orchestrator.acknowledge_incident(incident, user)
+        
+        assert CacheManager.get_incident_count("TRIGGERED") is None
+        assert CacheManager.get_live_stats() is None
+
     def test_resolve_incident(self, incident, user):
         """Test resolving an incident."""
         orchestrator = IncidentOrchestrator()
@@ -110,6 +126,22 @@ class TestIncidentOrchestrator:
         ).first()
         assert event is not None
 
+    def test_acknowledge_rejects_stale_status(self, incident, user):
+        """Test acknowledging fails when the stored status is no longer TRIGGERED."""
+        orchestrator = IncidentOrchestrator()
+        Incident.objects.filter(pk=incident.pk).update(status=IncidentStatus.ACKNOWLEDGED)
+        
+        with pytest.raises(InvalidTransitionError):
+            orchestrator.acknowledge_incident(incident, user)
+
+    def test_resolve_already_resolved(self, incident, user):
+        """Test resolving an already resolved incident raises."""
+        orchestrator = IncidentOrchestrator()
+        orchestrator.resolve_incident(incident, user)
+        
+        with pytest.raises(InvalidTransitionError):
+            orchestrator.resolve_incident(incident, user)
+
 
 @pytest.mark.django_db
 class TestNotificationRouter:
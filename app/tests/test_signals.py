@@ -1,7 +1,7 @@
 """
 IMAS Manager - Signal Tests
 
-Tests for Django signals: KPI timestamps, event logging.
+Tests for Django signals: KPI timestamps, event logging, child counters.
 """
 from __future__ import annotations
 
@@ -9,7 +9,7 @@ import pytest
 from django.utils import timezone
 
 from core.choices import IncidentStatus
-from core.models import Incident, IncidentEvent
+from core.models import Incident, IncidentEvent, IncidentTag, Runbook, RunbookStep, Tag
 
 
 @pytest.mark.django_db
@@ -60,3 +60,33 @@ class TestIncidentSignals:
         creation_event = events.filter(type="STATUS_CHANGE").first()
         assert creation_event is not None
         assert "created" in creation_event.message.lower()
+
+
+@pytest.mark.django_db
+class TestDenormalizedCounters:
+    """Tests for the child counters kept in step by signals."""
+
+    def test_runbook_steps_count(self):
+        """Test steps_count follows step creation and deletion."""
+        runbook = Runbook.objects.create(name="Cache flush", slug="cache-flush")
+        step = RunbookStep.objects.create(
+            runbook=runbook, order=1, title="Flush", description="-"
+        )
+        RunbookStep.objects.create(runbook=runbook, order=2, title="Check", description="-")
+        
+        assert runbook.steps_count == 2
+        step.delete()
+        runbook.refresh_from_db()
+        assert runbook.steps_count == 1
+
+    def test_tag_usage_count(self, incident):
+        """Test usage_count follows incident tagging."""
+        tag = Tag.objects.create(name="network")
+        IncidentTag.objects.create(incident=incident, tag=tag)
+        
+        tag.refresh_from_db()
+        assert tag.usage_count == 1
+        
+        IncidentTag.objects.filter(tag=tag).delete()
+        tag.refresh_from_db()
+        assert tag.usage_count == 0
@@ -285,6 +285,27 @@ class TestGrafanaWebhook:
         assert incident is not None
         assert "HighMemoryUsage" in incident.title or "Memory" in incident.title
 
+    @pytest.mark.django_db
+    def test_grafana_unified_common_labels_processed(self, service, grafana_unified_payload):
+        """Test unified alerts layered over commonLabels are fingerprinted and stored."""
+        from api.v1.webhooks import GrafanaWebhookView
+        from core.models import AlertFingerprint
+        from services.alerting import alert_service
+        
+        grafana_unified_payload["commonLabels"]["service"] = service.name
+        payload = GrafanaWebhookView().parse_alerts(grafana_unified_payload)[0]
+        
+        with patch("services.alerting.alert_service._trigger_notifications"):
+            result = alert_service.process_alert(payload)
+        
+        fingerprint = AlertFingerprint.objects.get()
+        assert result["fingerprint"] == fingerprint.fingerprint_hex
+        assert fingerprint.labels["team"] == "sre"
+        assert fingerprint.labels["service"] == service.name
+        assert fingerprint.fingerprint == AlertFingerprint.compute_fingerprint(
+            "HighMemoryUsage", dict(payload.labels), "GRAFANA",
+        )
+
     @pytest.mark.django_db
     def test_grafana_legacy_webhook(self, api_client, grafana_legacy_payload):
         """Test Grafana legacy alerting webhook."""
@@ -408,6 +429,26 @@ class TestAlertFingerprint:
         
         assert fp1 != fp2
 
+    @pytest.mark.django_db
+    def test_increment_fire_count_is_atomic(self):
+        """Test increments from stale instances are all counted."""
+        from core.models import AlertFingerprint, AlertStatus
+        
+        alert = AlertFingerprint.objects.create(
+            fingerprint=b"\xff" * 32,
+            alert_name="TestAlert",
+            status=AlertStatus.RESOLVED,
+        )
+        stale = AlertFingerprint.objects.get(pk=alert.pk)
+        
+        alert.increment_fire_count()
+        stale.increment_fire_count()
+        
+        alert.refresh_from_db()
+        assert alert.fire_count == 3
+        assert alert.status == AlertStatus.FIRING
+        assert alert.resolved_at is None
+
 
 class TestAlertRule:
     """Tests for AlertRule model."""